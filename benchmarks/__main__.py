@@ -0,0 +1,60 @@
+"""
+Runs the gbq benchmarks.
+
+    python -m benchmarks --quick --output results.json
+    python -m benchmarks --save-baseline
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks import (  # noqa: F401 register the benchmarks
+    bench_deploy,
+    bench_import,
+    bench_parameters,
+    bench_row_encoder,
+    bench_schema,
+    bench_structure,
+)
+from benchmarks.harness import compare, load, run_all, save
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("names", nargs="*", help="only run benchmarks matching names")
+    parser.add_argument("--quick", action="store_true", help="use small corpora")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="store the results as baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown against the baseline, 0.25 is 25%%",
+    )
+    args = parser.parse_args(argv)
+
+    report = run_all(quick=args.quick, repeat=args.repeat, selected=args.names)
+
+    regressions: list[str] = []
+    if args.save_baseline:
+        save(report, args.baseline)
+    elif os.path.exists(args.baseline):
+        regressions = compare(report, load(args.baseline), args.tolerance)
+
+    if args.output:
+        save(report, args.output)
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+from benchmarks.corpus import structure_definitions
+from benchmarks.harness import benchmark
+from gbq.instrumentation import HistogramInstrumentation
+from gbq.testing import fake_bigquery
+
+
+@benchmark("deploy.create_or_update_structure")
+def create_or_update_structure(quick: bool):
+    definitions = structure_definitions(30 if quick else 300)
+    bq = fake_bigquery(latency=0.001)
+
+    def deploy():
+        for index, definition in enumerate(definitions):
+            bq.create_or_update_structure(
+                "project", "dataset", f"table_{index}", dict(definition)
+            )
+
+    return deploy, len(definitions)
+
+
+@benchmark("deploy.create_or_update_structure.instrumented")
+def create_or_update_structure_instrumented(quick: bool):
+    definitions = structure_definitions(30 if quick else 300)
+    bq = fake_bigquery(latency=0.001)
+    bq.instrumentation = HistogramInstrumentation()
+
+    def deploy():
+        for index, definition in enumerate(definitions):
+            bq.create_or_update_structure(
+                "project", "dataset", f"table_{index}", dict(definition)
+            )
+
+    return deploy, len(definitions)
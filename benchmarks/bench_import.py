@@ -0,0 +1,10 @@
+import subprocess
+import sys
+
+from benchmarks.harness import benchmark
+
+
+@benchmark("import.gbq")
+def import_gbq(quick: bool):
+    command = [sys.executable, "-c", "import gbq"]
+    return lambda: subprocess.run(command, check=True), 1  # noqa: S603
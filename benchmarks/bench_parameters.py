@@ -0,0 +1,44 @@
+from benchmarks.harness import benchmark
+from gbq.parameters import QueryTemplate, QueryTemplateCache
+
+query = (
+    "SELECT * FROM `project.dataset.events` "
+    "WHERE user_id = @user_id AND day BETWEEN @start AND @end "
+    "AND kind IN UNNEST(@kinds) AND source = @source"
+)
+
+
+def parameter_sets(count: int) -> list[dict]:
+    return [
+        {
+            "user_id": index,
+            "start": "2024-01-01",
+            "end": "2024-01-31",
+            "kinds": ["click", "view", f"kind_{index % 7}"],
+            "source": {"name": "web", "version": index % 3},
+        }
+        for index in range(count)
+    ]
+
+
+@benchmark("parameters.uncached")
+def uncached(quick: bool):
+    parameters = parameter_sets(1_000 if quick else 10_000)
+
+    def bind():
+        for values in parameters:
+            QueryTemplate(query, values).job_config(values)
+
+    return bind, len(parameters)
+
+
+@benchmark("parameters.cached")
+def cached(quick: bool):
+    parameters = parameter_sets(1_000 if quick else 10_000)
+    cache = QueryTemplateCache()
+
+    def bind():
+        for values in parameters:
+            cache.get(query, values).job_config(values)
+
+    return bind, len(parameters)
@@ -0,0 +1,76 @@
+import datetime
+import decimal
+import json
+import random
+
+from google.cloud.bigquery import SchemaField
+
+from benchmarks.harness import benchmark
+from gbq.row_encoder import RowEncoder
+
+schema = [
+    SchemaField("id", "INTEGER"),
+    SchemaField("name", "STRING"),
+    SchemaField("created_at", "TIMESTAMP"),
+    SchemaField("day", "DATE"),
+    SchemaField("price", "NUMERIC"),
+    SchemaField("payload", "BYTES"),
+    SchemaField(
+        "items",
+        "RECORD",
+        mode="REPEATED",
+        fields=(SchemaField("sku", "STRING"), SchemaField("at", "TIME")),
+    ),
+]
+
+
+def make_rows(count: int) -> list[dict]:
+    rng = random.Random(0)  # noqa: S311
+    start = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        {
+            "id": index,
+            "name": f"name-{index}",
+            "created_at": start + datetime.timedelta(seconds=rng.randint(0, 10**7)),
+            "day": start.date() + datetime.timedelta(days=rng.randint(0, 365)),
+            "price": decimal.Decimal(rng.randint(0, 10**6)) / 100,
+            "payload": rng.randbytes(16),
+            "items": [
+                {"sku": f"sku-{item}", "at": datetime.time(item % 24, item % 60)}
+                for item in range(rng.randint(0, 5))
+            ],
+        }
+        for index in range(count)
+    ]
+
+
+def naive(rows: list[dict]) -> bytes:
+    return b"".join(json.dumps(row, default=str).encode() + b"\n" for row in rows)
+
+
+@benchmark("row_encoder.naive_json_dumps")
+def naive_json_dumps(quick: bool):
+    rows = make_rows(2_000 if quick else 20_000)
+    return lambda: naive(rows), len(rows)
+
+
+def encode(quick: bool, fast_json: bool):
+    rows = make_rows(2_000 if quick else 20_000)
+    encoder = RowEncoder(schema, fast_json=fast_json)
+    buffer = bytearray()
+
+    def write():
+        buffer.clear()
+        encoder.write_ndjson(rows, buffer)
+
+    return write, len(rows)
+
+
+@benchmark("row_encoder.json")
+def encode_json(quick: bool):
+    return encode(quick, fast_json=False)
+
+
+@benchmark("row_encoder.orjson")
+def encode_orjson(quick: bool):
+    return encode(quick, fast_json=True)
@@ -0,0 +1,21 @@
+from benchmarks.corpus import deep_schema, large_record, wide_schema
+from benchmarks.harness import benchmark
+from gbq.helpers import get_bq_schema_from_json_schema, get_bq_schema_from_record
+
+
+@benchmark("schema.json_schema.wide")
+def json_schema_wide(quick: bool):
+    schema = wide_schema(200 if quick else 2_000)
+    return lambda: get_bq_schema_from_json_schema(schema), len(schema)
+
+
+@benchmark("schema.json_schema.deep")
+def json_schema_deep(quick: bool):
+    schema = deep_schema(15, width=3 if quick else 20)
+    return lambda: get_bq_schema_from_json_schema(schema), 1
+
+
+@benchmark("schema.record.large")
+def record_large(quick: bool):
+    record = large_record(300 if quick else 3_000)
+    return lambda: get_bq_schema_from_record(record), len(record)
@@ -0,0 +1,37 @@
+from benchmarks.corpus import structure_definitions
+from benchmarks.harness import benchmark
+from gbq.dto import Structure
+from gbq.parsing import parse_structures
+
+
+@benchmark("structure.validate")
+def validate(quick: bool):
+    definitions = structure_definitions(100 if quick else 1_000)
+
+    def parse():
+        # Validators leave their input untouched, no copies needed
+        for definition in definitions:
+            Structure(**definition)
+
+    return parse, len(definitions)
+
+
+@benchmark("structure.parse_batch")
+def parse_batch(quick: bool):
+    definitions = structure_definitions(100 if quick else 1_000)
+
+    def parse():
+        parse_structures(definitions)
+
+    return parse, len(definitions)
+
+
+@benchmark("structure.parse_batch.processes")
+def parse_batch_processes(quick: bool):
+    # Includes starting the pool and pickling definitions and structures
+    definitions = structure_definitions(1_000 if quick else 4_000)
+
+    def parse():
+        parse_structures(definitions, processes=4, chunk_size=1_000)
+
+    return parse, len(definitions)
@@ -0,0 +1,105 @@
+"""
+Reproducible synthetic corpora used by the benchmarks.
+"""
+
+import datetime
+import random
+
+SCALAR_TYPES = ["STRING", "INTEGER", "FLOAT", "BOOLEAN", "TIMESTAMP", "DATE"]
+
+
+def _random(seed: int) -> random.Random:
+    return random.Random(seed)  # noqa: S311
+
+
+def wide_schema(columns: int, seed: int = 0) -> list[dict]:
+    """
+    Function returns a flat table schema with the given number of columns.
+    """
+    rng = _random(seed)
+    return [
+        {
+            "name": f"column_{index}",
+            "type": rng.choice(SCALAR_TYPES),
+            "mode": rng.choice(["NULLABLE", "REQUIRED"]),
+            "description": f"Column {index}",
+        }
+        for index in range(columns)
+    ]
+
+
+def deep_schema(depth: int, width: int = 3, seed: int = 0) -> list[dict]:
+    """
+    Function returns a schema of RECORD fields nested depth levels deep.
+    """
+    rng = _random(seed)
+    fields = wide_schema(width, seed)
+    for level in range(depth):
+        fields = [
+            *wide_schema(width, seed + level),
+            {
+                "name": f"record_{level}",
+                "type": "RECORD",
+                "mode": rng.choice(["NULLABLE", "REPEATED"]),
+                "fields": fields,
+            },
+        ]
+    return fields
+
+
+def large_record(keys: int, seed: int = 0) -> dict:
+    """
+    Function returns a raw record mixing scalars, maps, lists and nested objects.
+    """
+    rng = _random(seed)
+    record: dict = {}
+    for index in range(keys):
+        kind = index % 6
+        if kind == 0:
+            record[f"key_{index}"] = rng.randint(0, 10**6)
+        elif kind == 1:
+            record[f"key_{index}"] = f"value-{rng.random()}"
+        elif kind == 2:
+            record[f"key_{index}"] = datetime.date(2020, 1, 1 + index % 28)
+        elif kind == 3:
+            record[f"key_{index}"] = {str(n): rng.random() for n in range(5)}
+        elif kind == 4:
+            record[f"key_{index}"] = [{"a": n, "b": str(n)} for n in range(3)]
+        else:
+            record[f"key_{index}"] = {"nested": {"x": 1.5, "y": [1, 2, 3]}}
+    return record
+
+
+def structure_definitions(count: int, seed: int = 0) -> list[dict]:
+    """
+    Function returns structure definitions as accepted by create_or_update_structure.
+    """
+    rng = _random(seed)
+    definitions = []
+    for index in range(count):
+        kind = index % 10
+        if kind == 8:
+            definitions.append(
+                {"view_query": f"SELECT * FROM `project.dataset.table_{index - 1}`"}  # noqa: S608
+            )
+        elif kind == 9:
+            definitions.append(
+                {
+                    "body": ["DECLARE x INT64;", f"SET x = {index};"],
+                    "arguments": [{"name": "day", "data_type": "date"}],
+                }
+            )
+        else:
+            schema = wide_schema(rng.randint(5, 40), seed + index)
+            # The clustering column needs a type BigQuery can cluster on
+            schema[0]["type"] = "STRING"
+            definitions.append(
+                {
+                    "schema": schema,
+                    "partition": {"type": "time", "definition": {"type": "day"}},
+                    "clustering": ["column_0"],
+                    "labels": {"team": "data", "index": str(index)},
+                    "description": f"Table {index}",
+                }
+            )
+    return definitions
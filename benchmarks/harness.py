@@ -0,0 +1,106 @@
+"""
+Registry, runner and baseline comparison of the gbq benchmarks.
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+# A benchmark setup receives the `quick` flag and returns the measured callable and
+# the number of operations (rows, structures, fields...) one call processes.
+Setup = Callable[[bool], tuple[Callable[[], object], int]]
+
+BENCHMARKS: dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    """
+    Function registers a benchmark setup under a name.
+    """
+
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def run_benchmark(name: str, quick: bool = False, repeat: int = 5) -> dict:
+    """
+    Function runs a registered benchmark and returns its timings.
+    """
+    func, ops = BENCHMARKS[name](quick)
+    func()  # warm up caches and lazy imports
+
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+
+    best = min(timings)
+    return {
+        "ops": ops,
+        "repeat": repeat,
+        "seconds_min": best,
+        "seconds_median": statistics.median(timings),
+        "ops_per_second": ops / best if best else 0.0,
+    }
+
+
+def run_all(
+    quick: bool = False, repeat: int = 5, selected: list[str] | None = None
+) -> dict:
+    """
+    Function runs every registered benchmark, or the selected ones.
+    """
+    results = {}
+    for name in sorted(BENCHMARKS):
+        if selected and not any(pattern in name for pattern in selected):
+            continue
+        results[name] = run_benchmark(name, quick=quick, repeat=repeat)
+        print(
+            f"{name:<40} {results[name]['ops_per_second']:>14,.1f} ops/s"
+            f" {results[name]['seconds_min'] * 1000:>10.2f} ms",
+            file=sys.stderr,
+        )
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Function returns the benchmarks slower than the baseline by more than tolerance.
+    """
+    if report["quick"] != baseline.get("quick"):
+        raise ValueError("Cannot compare quick and full benchmark runs")
+
+    regressions = []
+    for name, result in report["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = result["seconds_min"] / reference["seconds_min"]
+        result["baseline_ratio"] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline")
+    return regressions
+
+
+def load(path: str) -> dict:
+    with open(path) as source:
+        return json.load(source)
+
+
+def save(report: dict, path: str):
+    with open(path, "w") as target:
+        json.dump(report, target, indent=2, sort_keys=True)
+        target.write("\n")
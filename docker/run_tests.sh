@@ -38,14 +38,14 @@ pytest tests --cov-report html
 echo "Running ruff..."
 if [ -z "${RUFF_FIX}" ]; then
     # ruff check: linter - finds code quality issues (unused imports, bugs, security issues)
-    ruff check gbq tests
+    ruff check gbq tests benchmarks
     # ruff format: formatter - ensures consistent code style (indentation, quotes, line length)
-    ruff format --check gbq tests
+    ruff format --check gbq tests benchmarks
 else
     # ruff check --fix: auto-fix linting issues where possible
-    ruff check --fix gbq tests
+    ruff check --fix gbq tests benchmarks
     # ruff format: auto-format code style
-    ruff format gbq tests
+    ruff format gbq tests benchmarks
 fi
 
 echo "Running mypy..."
@@ -0,0 +1,104 @@
+import contextvars
+import threading
+import time
+
+from gbq.dto import RpcCount, RpcReport
+from gbq.exceptions import BudgetExceededException
+from gbq.instrumentation import Instrumentation, Span
+
+# Accountings of the `BigQuery.rpc_run` blocks open in the current context, with the
+# BigQuery they count the calls of
+active_runs: contextvars.ContextVar[tuple[tuple[object, "RpcAccounting"], ...]] = (
+    contextvars.ContextVar("gbq_rpc_runs", default=())
+)
+
+
+class RpcAccounting(Instrumentation):
+    """
+    RpcAccounting counts the client calls of BigQuery per project, method and outcome,
+    and enforces an optional budget.
+
+    Calls are checked against the budget before they are sent, a call going over the
+    budget raises BudgetExceededException instead of reaching BigQuery. Bytes billed
+    are known once a query job finishes, so the query going over max_bytes_billed
+    completes and the next call is refused.
+
+    Args:
+        name (str):
+            Name of the run, used in reports and errors.
+        max_calls (Optional[int]):
+            Maximum number of client calls.
+        max_bytes_billed (Optional[int]):
+            Maximum number of bytes billed by query jobs.
+    """
+
+    def __init__(
+        self,
+        name: str = "run",
+        max_calls: int | None = None,
+        max_bytes_billed: int | None = None,
+    ):
+        self.name = name
+        self.max_calls = max_calls
+        self.max_bytes_billed = max_bytes_billed
+        self.calls = 0
+        self.bytes_billed = 0
+        self.started_at = time.monotonic()
+        self._counts: dict[tuple[str, str, str], RpcCount] = {}
+        self._lock = threading.Lock()
+
+    def on_start(self, span: Span) -> None:
+        if span.kind != "rpc":
+            return
+        with self._lock:
+            if self.max_calls is not None and self.calls >= self.max_calls:
+                raise BudgetExceededException(
+                    f"{self.name} made {self.calls} calls, "
+                    f"{span.name} goes over the budget of {self.max_calls} calls"
+                )
+            if (
+                self.max_bytes_billed is not None
+                and self.bytes_billed > self.max_bytes_billed
+            ):
+                raise BudgetExceededException(
+                    f"{self.name} was billed {self.bytes_billed} bytes, "
+                    f"over the budget of {self.max_bytes_billed} bytes"
+                )
+            # Counted when sent, so that concurrent calls cannot overrun the budget
+            self.calls += 1
+
+    def on_end(self, span: Span) -> None:
+        if span.bytes_billed:
+            with self._lock:
+                self.bytes_billed += span.bytes_billed
+        if span.kind != "rpc" or isinstance(span.error, BudgetExceededException):
+            return
+
+        key = (span.project or "", span.name, span.outcome)
+        with self._lock:
+            count = self._counts.get(key)
+            if count is None:
+                count = RpcCount(project=key[0], method=key[1], outcome=key[2])
+                self._counts[key] = count
+            count.calls += 1
+            count.seconds += span.duration
+
+    def report(self) -> RpcReport:
+        """
+        Function returns the client calls made so far.
+
+        Returns:
+            RpcReport: Counts sorted by number of calls, highest first.
+        """
+        with self._lock:
+            counts = [count.model_copy() for count in self._counts.values()]
+            return RpcReport(
+                name=self.name,
+                calls=self.calls,
+                bytes_billed=self.bytes_billed,
+                seconds=time.monotonic() - self.started_at,
+                counts=sorted(
+                    counts,
+                    key=lambda c: (-c.calls, c.project, c.method, c.outcome),
+                ),
+            )
@@ -0,0 +1,394 @@
+import json
+import re
+import threading
+from collections import defaultdict
+from collections.abc import Iterable
+
+from gbq.dto import ColumnUsage, TableRecommendation
+from gbq.telemetry import normalize_query
+
+time_types = {"DATE", "TIMESTAMP", "DATETIME"}
+clustering_types = {
+    "STRING",
+    "INTEGER",
+    "INT64",
+    "NUMERIC",
+    "BIGNUMERIC",
+    "BOOL",
+    "BOOLEAN",
+    "DATE",
+    "DATETIME",
+    "TIMESTAMP",
+    "GEOGRAPHY",
+}
+_keywords = {
+    "and",
+    "or",
+    "not",
+    "null",
+    "true",
+    "false",
+    "case",
+    "when",
+    "then",
+    "else",
+    "end",
+    "exists",
+    "where",
+    "on",
+    "using",
+    "left",
+    "right",
+    "inner",
+    "outer",
+    "full",
+    "cross",
+    "join",
+    "group",
+    "order",
+    "limit",
+    "having",
+    "qualify",
+    "window",
+    "union",
+    "select",
+    "from",
+    "unnest",
+}
+
+_table_pattern = re.compile(
+    r"\b(?:from|join)\s+(`[^`]+`|[a-z_][\w-]*(?:\.[\w-]+){1,2})"
+    r"(?:\s+(?:as\s+)?([a-z_]\w*))?"
+)
+_where_pattern = re.compile(
+    r"\bwhere\b(.*?)(?=\b(?:group|order|limit|having|qualify|window|union|except"
+    r"|intersect|select|from|join)\b|$)",
+    re.DOTALL,
+)
+_predicate_pattern = re.compile(
+    r"(?:\b[a-z_]\w*\s*\(\s*)?(?:([a-z_]\w*)\.)?([a-z_]\w*)\s*(?:,[^()]*)?\)?\s*"
+    r"(=|<=|>=|<>|!=|<|>|\bbetween\b|\bin\b|\blike\b|\bis\b)"
+)
+_point_operators = {"=", "in", "like", "is"}
+_range_operators = {"<", ">", "<=", ">=", "between"}
+
+# Query shape recorded per table: columns filtered by point and range predicates
+_Signature = tuple[str, frozenset[str], frozenset[str]]
+
+
+def get_job_history_query(region: str = "us") -> str:
+    """
+    Function returns the query reading the successful query jobs of a project from
+    INFORMATION_SCHEMA.JOBS_BY_PROJECT, over the last @days days.
+
+    Args:
+        region (str):
+            Region of the jobs, such as "us" or "europe-west1".
+
+    Returns:
+        str: BigQuery query string
+    """
+    # Identifiers cannot be query parameters, the region is one
+    return (
+        "SELECT project_id, query, total_bytes_processed, referenced_tables "  # noqa: S608
+        f"FROM `region-{region}`.INFORMATION_SCHEMA.JOBS_BY_PROJECT "
+        "WHERE creation_time >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days DAY) "
+        "AND job_type = 'QUERY' AND state = 'DONE' AND error_result IS NULL "
+        "AND statement_type = 'SELECT' AND NOT cache_hit"
+    )
+
+
+def load_job_history(path: str) -> list[dict]:
+    """
+    Function reads jobs exported as NDJSON, one INFORMATION_SCHEMA.JOBS row per line.
+
+    Args:
+        path (str):
+            Path of the NDJSON file.
+
+    Returns:
+        List[Dict]: The jobs.
+    """
+    with open(path) as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def _get_table_id(reference, default_project: str | None) -> str:
+    if isinstance(reference, dict):
+        return ".".join(
+            [reference["project_id"], reference["dataset_id"], reference["table_id"]]
+        )
+    parts = reference.strip("`").split(".")
+    if len(parts) == 2 and default_project:
+        parts.insert(0, default_project)
+    return ".".join(parts)
+
+
+def parse_query(
+    query: str, default_project: str | None = None
+) -> tuple[dict[str, str], list[tuple[str | None, str, str]]]:
+    """
+    Function extracts the tables read by a query and the columns of its filters.
+
+    Parsing is lexical: tables are read from FROM and JOIN clauses, and predicates
+    comparing a column, possibly wrapped in a function such as DATE(ts) or
+    TIMESTAMP_TRUNC(ts, DAY), from WHERE clauses. Names are lower case.
+
+    Args:
+        query (str):
+            BigQuery query string
+        default_project (Optional[str]):
+            Project of the tables referenced as dataset.table.
+
+    Returns:
+        Tuple[Dict[str, str], List[Tuple[Optional[str], str, str]]]: Table IDs by
+            alias and by table name, and the qualifier, column and kind, "point" or
+            "range", of every predicate.
+    """
+    normalized = normalize_query(query)
+    tables = {}
+    for match in _table_pattern.finditer(normalized):
+        table_id = _get_table_id(match.group(1), default_project)
+        tables[table_id.rsplit(".", 1)[-1]] = table_id
+        alias = match.group(2)
+        if alias and alias not in _keywords:
+            tables[alias] = table_id
+
+    predicates = []
+    for clause in _where_pattern.finditer(normalized):
+        for match in _predicate_pattern.finditer(clause.group(1)):
+            qualifier, column, operator = match.groups()
+            operator = operator.split()[0]
+            if column in _keywords:
+                continue
+            if operator in _point_operators:
+                predicates.append((qualifier, column, "point"))
+            elif operator in _range_operators:
+                predicates.append((qualifier, column, "range"))
+    return tables, predicates
+
+
+class JobHistoryAnalyzer:
+    """
+    JobHistoryAnalyzer aggregates the bytes scanned per table and filter column by
+    query jobs, and proposes partitioning and clustering for the scanned tables.
+
+    The bytes of a job reading several tables are split evenly between them.
+
+    Args:
+        default_project (Optional[str]):
+            Project of the tables referenced as dataset.table.
+    """
+
+    def __init__(self, default_project: str | None = None):
+        self.default_project = default_project
+        self._signatures: dict[_Signature, list[int]] = defaultdict(lambda: [0, 0])
+        self._lock = threading.Lock()
+
+    def add(
+        self,
+        query: str,
+        total_bytes_processed: int,
+        referenced_tables: list | None = None,
+        project: str | None = None,
+    ) -> None:
+        """
+        Function records a query job.
+
+        Args:
+            query (str):
+                BigQuery query string
+            total_bytes_processed (int):
+                Bytes scanned by the job.
+            referenced_tables (Optional[List]):
+                Tables read by the job, IDs or INFORMATION_SCHEMA.JOBS references.
+                Parsed from the query by default.
+            project (Optional[str]):
+                Project of the job, the default project of its tables.
+        """
+        project = project or self.default_project
+        tables, predicates = parse_query(query, project)
+        table_ids = sorted(
+            {_get_table_id(reference, project) for reference in referenced_tables}
+            if referenced_tables
+            else set(tables.values())
+        )
+        if not table_ids:
+            return
+
+        # Parsed table IDs are lower case, table IDs of jobs are case sensitive
+        lookup = {table_id.lower(): table_id for table_id in table_ids}
+        filters: dict[str, dict[str, set[str]]] = {
+            table_id: {"point": set(), "range": set()} for table_id in table_ids
+        }
+        for qualifier, column, kind in predicates:
+            if qualifier is not None:
+                table_id = lookup.get(tables.get(qualifier, "").lower())
+            elif len(table_ids) == 1:
+                table_id = table_ids[0]
+            else:
+                # Unqualified columns of joins cannot be attributed lexically
+                continue
+            if table_id is not None:
+                filters[table_id][kind].add(column)
+
+        share = (total_bytes_processed or 0) // len(table_ids)
+        with self._lock:
+            for table_id, columns in filters.items():
+                counts = self._signatures[
+                    (table_id, frozenset(columns["point"]), frozenset(columns["range"]))
+                ]
+                counts[0] += 1
+                counts[1] += share
+
+    def add_jobs(self, jobs: Iterable[dict]) -> None:
+        """
+        Function records INFORMATION_SCHEMA.JOBS rows, or jobs exported as NDJSON.
+
+        Args:
+            jobs (Iterable[Dict]):
+                Jobs with query, total_bytes_processed and optionally
+                referenced_tables and project_id.
+        """
+        for job in jobs:
+            if job.get("query"):
+                self.add(
+                    job["query"],
+                    job.get("total_bytes_processed") or 0,
+                    job.get("referenced_tables"),
+                    job.get("project_id"),
+                )
+
+    def usage(self) -> dict[str, list[ColumnUsage]]:
+        """
+        Function returns the filter columns of every table.
+
+        Returns:
+            Dict[str, List[ColumnUsage]]: Column usage by table ID, columns filtering
+                the most bytes first.
+        """
+        with self._lock:
+            signatures = dict(self._signatures)
+
+        columns: dict[str, dict[str, ColumnUsage]] = defaultdict(dict)
+        for (table_id, points, ranges), (jobs, scanned) in signatures.items():
+            for column in points | ranges:
+                usage = columns[table_id].setdefault(column, ColumnUsage(column=column))
+                usage.jobs += jobs
+                usage.bytes += scanned
+                usage.point_jobs += jobs if column in points else 0
+                usage.range_jobs += jobs if column in ranges else 0
+            columns.setdefault(table_id, {})
+        return {
+            table_id: sorted(
+                usage.values(), key=lambda usage: (-usage.bytes, usage.column)
+            )
+            for table_id, usage in columns.items()
+        }
+
+    def recommend(
+        self,
+        schemas: dict[str, list[dict]] | None = None,
+        max_clustering_columns: int = 4,
+        partition_scan_fraction: float = 0.1,
+        clustering_scan_fraction: float = 0.5,
+    ) -> list[TableRecommendation]:
+        """
+        Function proposes partitioning and clustering for the recorded tables.
+
+        The DATE, DATETIME or TIMESTAMP column filtering the most bytes is proposed
+        for daily partitioning, which requires the schema of the table. The other
+        columns filtering the most bytes are proposed for clustering.
+
+        Savings are estimates: jobs filtering on the partitioning column are assumed
+        to scan partition_scan_fraction of the table, and jobs filtering on a
+        clustering column clustering_scan_fraction of what remains.
+
+        Args:
+            schemas (Optional[Dict[str, List[Dict]]]):
+                Schema of the tables by table ID, fields with name and type.
+            max_clustering_columns (int):
+                Maximum number of clustering columns, BigQuery allows 4.
+            partition_scan_fraction (float):
+                Fraction of the bytes scanned with a partitioning filter.
+            clustering_scan_fraction (float):
+                Fraction of the bytes scanned with a clustering filter.
+
+        Returns:
+            List[TableRecommendation]: Recommendations, largest savings first, in the
+                format accepted by `create_or_update_structure`.
+        """
+        schemas = schemas or {}
+        with self._lock:
+            signatures = dict(self._signatures)
+
+        recommendations = []
+        for table_id, columns in self.usage().items():
+            schema = schemas.get(table_id)
+            types = (
+                {field["name"].lower(): field for field in schema}
+                if schema is not None
+                else None
+            )
+
+            def get_name(column: str, fields=types) -> str:
+                return fields[column]["name"] if fields else column
+
+            def get_type(column: str, fields=types) -> str | None:
+                if fields is None or column not in fields:
+                    return None
+                return fields[column].get("type", "").upper()
+
+            partition = next(
+                (
+                    usage.column
+                    for usage in columns
+                    if get_type(usage.column) in time_types
+                ),
+                None,
+            )
+            clustering = [
+                usage.column
+                for usage in columns
+                if usage.column != partition
+                and (types is None or get_type(usage.column) in clustering_types)
+            ][:max_clustering_columns]
+
+            structure: dict = {}
+            if partition is not None:
+                structure["partition"] = {
+                    "type": "time",
+                    "definition": {"type": "DAY", "field": get_name(partition)},
+                }
+            if clustering:
+                structure["clustering"] = [get_name(column) for column in clustering]
+            if not structure:
+                continue
+
+            recommendation = TableRecommendation(
+                table_id=table_id, columns=columns, structure=structure
+            )
+            savings = 0.0
+            for (signature_table, points, ranges), (
+                jobs,
+                scanned,
+            ) in signatures.items():
+                if signature_table != table_id:
+                    continue
+                recommendation.jobs += jobs
+                recommendation.total_bytes += scanned
+                filtered = points | ranges
+                fraction = 1.0
+                if partition in filtered:
+                    fraction *= partition_scan_fraction
+                if filtered & set(clustering):
+                    fraction *= clustering_scan_fraction
+                savings += scanned * (1 - fraction)
+            recommendation.estimated_savings_bytes = int(savings)
+            recommendations.append(recommendation)
+
+        recommendations.sort(
+            key=lambda recommendation: recommendation.estimated_savings_bytes,
+            reverse=True,
+        )
+        return recommendations
@@ -1,3 +1,13 @@
+import asyncio
+import datetime
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 from google.cloud.bigquery import QueryJob
@@ -5,16 +15,78 @@ from google.cloud.bigquery.dataset import DatasetListItem
 from google.cloud.bigquery.routine import Routine, RoutineArgument
 from google.cloud.bigquery.table import PartitionRange, Table
 
+from gbq.accounting import RpcAccounting, active_runs
+from gbq.analyzer import JobHistoryAnalyzer, get_job_history_query
+from gbq.copying import (
+    copy_operations,
+    get_structure_definition,
+    select_tables,
+)
+from gbq.deploying import ProjectRateLimits
 from gbq.dto import (
+    Argument,
+    CopyReport,
+    DeployOutcome,
+    ExportReport,
+    IndexStatus,
+    LoadJobReport,
     Partition,
+    PartitionInfo,
     PartitionType,
     RangeDefinition,
+    RebuildReport,
+    StatementResult,
     Structure,
     StructureType,
+    TableRecommendation,
     TimeDefinition,
+    UpsertReport,
+)
+from gbq.exceptions import (
+    GbqException,
+    InvalidDefinitionException,
+    JobCancelledException,
+    JobTimeoutException,
+)
+from gbq.exporting import export_stream, merge_files, plan_row_ranges, stream_writers
+from gbq.helpers import (
+    get_bq_credentials,
+    get_bq_schema_from_json_schema,
+    get_resource_project,
+)
+from gbq.indexes import get_index_options, get_indexes_query, plan_index_changes
+from gbq.instrumentation import (
+    CompositeInstrumentation,
+    Instrumentation,
+    current_span,
+    instrumented,
+    propagate_context,
+)
+from gbq.jobs import wait_for_job
+from gbq.journal import Journal
+from gbq.loading import LoadChunk, get_source_format, line_formats, plan_load_chunks
+from gbq.merging import build_merge, get_partition_key, get_staging_partitions_query
+from gbq.parameters import Parameters, QueryParameter, QueryTemplateCache
+from gbq.parsing import parse_structures
+from gbq.partitions import get_partitions_query, select_partitions
+from gbq.procedures import build_call, get_procedure_arguments
+from gbq.schema_validator import check_structure, validate_structure
+from gbq.scripting import build_script, get_statement_result, map_script_results
+from gbq.streaming import StreamingWriter
+from gbq.telemetry import QueryStatsSink, get_query_stats
+
+# Client methods taking a dataset, whose IDs of two parts are project.dataset
+dataset_methods = frozenset(
+    (
+        "create_dataset",
+        "get_dataset",
+        "update_dataset",
+        "delete_dataset",
+        "list_tables",
+        "list_routines",
+        "list_models",
+    )
 )
-from gbq.exceptions import GbqException, InvalidDefinitionException
-from gbq.helpers import get_bq_credentials, get_bq_schema_from_json_schema
 
 
 class BigQuery:
@@ -22,16 +94,199 @@ class BigQuery:
     BigQueryUtil represent a BigQuery Util resource.
 
     Args:
-        svc_account (str):
+        svc_account (Optional[str]):
             Stringified JSON service account value.
         project (Optional[str]):
             Project bound to the operation.
+        bq_client (Optional[bigquery.Client]):
+            Client used instead of one built from svc_account, such as
+            `gbq.testing.FakeBigQueryClient`.
+        instrumentation (Optional[Instrumentation]):
+            Receives a span for every public method, its phases and every client call,
+            see `gbq.instrumentation`. Disabled by default.
+        query_stats_sink (Optional[QueryStatsSink]):
+            Receives the statistics of every query job run by `execute`, such as
+            `gbq.telemetry.QueryAggregator`.
+        job_timeout (Optional[float]):
+            Default number of seconds `execute` waits for a query job before it is
+            cancelled, unlimited by default.
     """
 
-    def __init__(self, svc_account: str, project: str | None = None):
+    def __init__(
+        self,
+        svc_account: str | None = None,
+        project: str | None = None,
+        bq_client: bigquery.Client | None = None,
+        instrumentation: Instrumentation | None = None,
+        query_stats_sink: QueryStatsSink | None = None,
+        job_timeout: float | None = None,
+    ):
+        self.instrumentation = instrumentation
+        self.query_stats_sink = query_stats_sink
+        self.job_timeout = job_timeout
+        self.query_templates = QueryTemplateCache()
+        self._procedure_arguments: dict[str, list[Argument]] = {}
+        if bq_client is not None:
+            self.credentials = None
+            self.bq_client = bq_client
+            if project:
+                self.bq_client.project = project
+            return
+
+        if svc_account is None:
+            raise GbqException("Either svc_account or bq_client is required")
         self.credentials = get_bq_credentials(svc_account)
         self.bq_client = bigquery.Client(credentials=self.credentials, project=project)
 
+    @property
+    def instrumentation(self) -> Instrumentation | None:
+        """
+        Instrumentation of the client, combined with the accountings of the
+        `rpc_run` blocks open in the current context.
+        """
+        instrumentations: list[Instrumentation] = [
+            accounting for owner, accounting in active_runs.get() if owner is self
+        ]
+        if not instrumentations:
+            return self._instrumentation
+        if self._instrumentation is not None:
+            instrumentations.insert(0, self._instrumentation)
+        return CompositeInstrumentation(*instrumentations)
+
+    @instrumentation.setter
+    def instrumentation(self, instrumentation: Instrumentation | None):
+        self._instrumentation = instrumentation
+
+    def _rpc(self, name: str, func: Callable, *args, **kwargs):
+        """
+        Function calls a function sending a request to BigQuery in an "rpc" span,
+        such as a method of the client or of a job.
+
+        Args:
+            name (str):
+                Name of the request.
+            func (Callable):
+                Function sending the request.
+            args, kwargs:
+                Arguments of the function.
+
+        Returns:
+            The result of the function.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return func(*args, **kwargs)
+        project = self._get_rpc_project(name, func, args, kwargs)
+        with instrumentation.span("rpc", name, project=project):
+            return func(*args, **kwargs)
+
+    def _get_rpc_project(
+        self, name: str, func: Callable, args: tuple, kwargs: dict
+    ) -> str | None:
+        """
+        Function returns the project a request targets: the project of the job or
+        iterator sending it, of the resource or fully qualified ID it is about, the
+        project argument, the project of the current span, else the project of the
+        client.
+        """
+        owner = getattr(func, "__self__", None)
+        if owner is not None and owner is not self.bq_client:
+            project = get_resource_project(owner)
+            if project is not None:
+                return project
+        for value in (*args, *kwargs.values()):
+            project = get_resource_project(value, name in dataset_methods)
+            if project is not None:
+                return project
+        if kwargs.get("project"):
+            return kwargs["project"]
+        span = current_span.get()
+        if span is not None and span.project:
+            return span.project
+        return get_resource_project(self.bq_client)
+
+    def _call(self, method: str, *args, **kwargs):
+        """
+        Function calls a method of the BigQuery client in an "rpc" span.
+
+        Args:
+            method (str):
+                Name of the method of bq_client.
+            args, kwargs:
+                Arguments of the method.
+
+        Returns:
+            The result of the method.
+        """
+        return self._rpc(method, getattr(self.bq_client, method), *args, **kwargs)
+
+    def _span(
+        self,
+        kind: str,
+        name: str,
+        project: str | None = None,
+        dataset: str | None = None,
+        structure: str | None = None,
+    ):
+        """
+        Function returns a context manager timing a span, returning None when
+        instrumentation is disabled.
+        """
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return nullcontext()
+        return instrumentation.span(kind, name, project, dataset, structure)
+
+    @contextmanager
+    def rpc_run(
+        self,
+        name: str = "run",
+        max_calls: int | None = None,
+        max_bytes_billed: int | None = None,
+        summary: Callable[[str], None] | None = None,
+    ) -> Iterator[RpcAccounting]:
+        """
+        Function counts the client calls made within the block, see `RpcAccounting`.
+
+        Every request is counted, including job polling, export pages and streaming
+        inserts. The run is scoped to the current context: calls of other threads
+        are counted only when they run the work of the block, such as the workers
+        of bulk operations, so concurrent runs do not count each other's calls.
+        Calls are counted under the project they target, such as the project of
+        every target of `deploy_structures`.
+
+        Args:
+            name (str):
+                Name of the run.
+            max_calls (Optional[int]):
+                Maximum number of client calls, BudgetExceededException is raised by
+                the first call over the budget.
+            max_bytes_billed (Optional[int]):
+                Maximum number of bytes billed by query jobs.
+            summary (Optional[Callable[[str], None]]):
+                Receives the summary of the run when the block exits, such as `print`.
+
+        Examples:
+            with bq.rpc_run("deploy", max_calls=1000, summary=print) as run:
+                for structure_id, definition in definitions.items():
+                    bq.create_or_update_structure(project, dataset, structure_id, definition)
+            run.report().calls
+
+        Returns:
+            Iterator[RpcAccounting]: The accounting of the run.
+        """
+        accounting = RpcAccounting(name, max_calls, max_bytes_billed)
+        # Scoped to the current context and the worker threads it propagates to,
+        # so that concurrent runs do not count each other's calls
+        token = active_runs.set((*active_runs.get(), (self, accounting)))
+        try:
+            yield accounting
+        finally:
+            active_runs.reset(token)
+            if summary is not None:
+                summary(accounting.report().summary())
+
+    @instrumented
     def get_dataset_in_project(self, project: str) -> list[DatasetListItem]:
         """
         Function returns list of DatasetListItem objects of all the datasets in a project.
@@ -44,9 +299,10 @@ class BigQuery:
             List[DatasetListItem]: A list of object of BigQuery DatasetListItem.
         """
         self.bq_client.project = project
-        datasets: list[DatasetListItem] = list(self.bq_client.list_datasets())
+        datasets: list[DatasetListItem] = list(self._call("list_datasets"))
         return datasets
 
+    @instrumented
     def delete_dataset(self, project: str, dataset: str):
         """
         Function deletes a dataset.
@@ -63,13 +319,14 @@ class BigQuery:
         self.bq_client.project = project
 
         try:
-            bq_structure = self.bq_client.get_dataset(dataset)
-            self.bq_client.delete_dataset(bq_structure, delete_contents=True)
+            bq_structure = self._call("get_dataset", dataset)
+            self._call("delete_dataset", bq_structure, delete_contents=True)
         except NotFound:
             return False
 
         return True
 
+    @instrumented
     def get_table_in_project(self, project: str) -> list[Table]:
         """
         Function returns list of Table objects of all the tables and views in a project.
@@ -85,12 +342,13 @@ class BigQuery:
         self.bq_client.project = project
         datasets: list[DatasetListItem] = self.get_dataset_in_project(project)
         for dataset in datasets:
-            tables_in_dataset = self.bq_client.list_tables(
-                f"{dataset.project}.{dataset.dataset_id}"
+            tables_in_dataset = self._call(
+                "list_tables", f"{dataset.project}.{dataset.dataset_id}"
             )
             [tables.append(table) for table in tables_in_dataset]  # type: ignore
         return tables
 
+    @instrumented
     def get_structure(self, project: str, dataset: str, structure: str) -> Table:
         """
         Function returns a BigQuery Table object.
@@ -108,9 +366,10 @@ class BigQuery:
         """
         self.bq_client.project = project
         full_table_name = f"{project}.{dataset}.{structure}"
-        bq_table: Table = self.bq_client.get_table(full_table_name)
+        bq_table: Table = self._call("get_table", full_table_name)
         return bq_table
 
+    @instrumented
     def delete_table_or_view(self, project: str, dataset: str, structure: str):
         """
         Function deletes table or view.
@@ -130,12 +389,13 @@ class BigQuery:
 
         try:
             bq_structure = self.get_structure(project, dataset, structure)
-            self.bq_client.delete_table(bq_structure)
+            self._call("delete_table", bq_structure)
         except NotFound:
             return False
 
         return True
 
+    @instrumented
     def get_routine(self, project: str, dataset: str, routine_name: str) -> Routine:
         """
         Function returns a BigQuery Table object.
@@ -154,19 +414,26 @@ class BigQuery:
         """
         self.bq_client.project = project
         routine_id = f"{project}.{dataset}.{routine_name}"
-        routine: Routine = self.bq_client.get_routine(routine_id)
+        routine: Routine = self._call("get_routine", routine_id)
         return routine
 
+    @instrumented
     def create_or_update_structure(
         self,
         project: str,
         dataset: str,
         structure_id: str,
         json_schema: list[dict] | dict,
+        allow_rebuild: bool = False,
     ) -> Table | Routine:
         """
         Function creates/updates provided json schema to the structure.
 
+        Partitioning cannot be changed in place, and clustering changes only apply to
+        new data. With allow_rebuild, a table whose partitioning or clustering differs
+        from the definition is rebuilt, see `rebuild_table`, and a materialized view
+        whose query changed is recreated.
+
         Args:
             project (str):
                 Project bound to the operation.
@@ -178,6 +445,8 @@ class BigQuery:
                 Raw JSON schema of the table. If List[Dict] it is assumed that the value is
                     table schema, if Dict than value can include partitioning scheme, clustering,
                     table schema, view query, labels, etc
+            allow_rebuild (bool):
+                Whether tables and materialized views may be rebuilt to apply changes.
 
         Examples:
             List[Dict]:
@@ -224,13 +493,56 @@ class BigQuery:
         """
         self.bq_client.project = project
 
-        structure = self._get_structure(json_schema)
+        with self._span("phase", "parse"):
+            structure = self._get_structure(json_schema)
+            check_structure(structure, structure_id)
 
-        if (
-            structure.type == StructureType.table
-            or structure.type == StructureType.view
+        return self._apply_structure(
+            dataset, project, structure_id, structure, allow_rebuild
+        )
+
+    def _apply_structure(
+        self,
+        dataset: str,
+        project: str,
+        structure_id: str,
+        structure: Structure,
+        allow_rebuild: bool = False,
+    ) -> Table | Routine:
+        """
+        Function creates/updates a structure per its parsed definition, see
+        `create_or_update_structure`.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the structure.
+            structure_id (str):
+                ID of the structure.
+            structure (Structure):
+                An object of internal Structure class.
+            allow_rebuild (bool):
+                Whether tables and materialized views may be rebuilt to apply changes.
+
+        Returns:
+            Union[Table, Routine]: The BigQuery Table or Routine.
+        """
+        if structure.type in (
+            StructureType.table,
+            StructureType.view,
+            StructureType.materialized_view,
         ):
-            return self._handle_table_or_view(dataset, project, structure_id, structure)
+            bq_structure = self._handle_table_or_view(
+                dataset, project, structure_id, structure, allow_rebuild
+            )
+            if structure.type == StructureType.table and (
+                structure.search_indexes is not None
+                or structure.vector_indexes is not None
+            ):
+                with self._span("phase", "indexes"):
+                    self._handle_indexes(dataset, project, structure_id, structure)
+            return bq_structure
         elif structure.type == StructureType.stored_procedure:
             return self._handle_stored_procedure(
                 dataset, project, structure_id, structure
@@ -238,8 +550,131 @@ class BigQuery:
         else:
             raise InvalidDefinitionException("Missing required structure definition")
 
+    @instrumented
+    def deploy_structures(
+        self,
+        targets: list[str],
+        definitions: dict[str, list[dict] | dict],
+        allow_rebuild: bool = False,
+        max_workers: int = 8,
+        rate_limits: dict[str, float] | None = None,
+        journal: Journal | None = None,
+    ) -> dict[str, dict[str, DeployOutcome]]:
+        """
+        Function creates/updates the same structures in many datasets, such as
+        regional or tenant datasets, concurrently.
+
+        Definitions are parsed, validated and converted to BigQuery schemas once,
+        then applied to every target. The structures of a target are applied in
+        order, so views can follow the tables they read. A failed structure does not
+        raise, see the status of its outcome.
+
+        With a journal, the structures applied by a previous run of the journal are
+        skipped, so an interrupted deploy resumes with the structures left.
+
+        Args:
+            targets (List[str]):
+                Datasets, as project.dataset.
+            definitions (Dict[str, Union[List[Dict], Dict]]):
+                Definitions by structure ID, see `create_or_update_structure`.
+            allow_rebuild (bool):
+                Whether tables and materialized views may be rebuilt to apply changes.
+            max_workers (int):
+                Maximum number of targets deployed concurrently.
+            rate_limits (Optional[Dict[str, float]]):
+                Maximum number of structures applied per second by project, "*"
+                limits the projects without their own rate, unlimited by default.
+            journal (Optional[Journal]):
+                Journal recording the status of every structure, see `gbq.journal`.
+
+        Returns:
+            Dict[str, Dict[str, DeployOutcome]]: Outcomes by target and structure ID,
+                with status "done", "resumed" when applied by a previous run, or
+                "failed".
+        """
+        with self._span("phase", "parse"):
+            structures = dict(
+                zip(
+                    definitions,
+                    parse_structures(list(definitions.values()), ids=list(definitions)),
+                    strict=True,
+                )
+            )
+            errors = [
+                f"{structure_id}: {error}"
+                for structure_id, structure in structures.items()
+                for error in validate_structure(structure)
+            ]
+            if errors:
+                raise InvalidDefinitionException(
+                    "Invalid definitions:\n" + "\n".join(f"- {e}" for e in errors)
+                )
+        for structure in structures.values():
+            if structure.table_schema:
+                self._get_bq_schema(structure)
+        limits = ProjectRateLimits(rate_limits or {})
+        items = [
+            f"{target}.{structure_id}"
+            for target in targets
+            for structure_id in structures
+        ]
+        items_left = set(
+            journal.start("deploy", items) if journal is not None else items
+        )
+
+        def deploy(target: str) -> dict[str, DeployOutcome]:
+            project, dataset = target.split(".")
+            # Calls of the target are counted under its project
+            with self._span("phase", "target", project=project, dataset=dataset):
+                return deploy_target(project, dataset, target)
+
+        def deploy_target(
+            project: str, dataset: str, target: str
+        ) -> dict[str, DeployOutcome]:
+            outcomes = {}
+            for structure_id, structure in structures.items():
+                outcome = DeployOutcome(
+                    target=target, structure_id=structure_id, status="done"
+                )
+                outcomes[structure_id] = outcome
+                item = f"{target}.{structure_id}"
+                if item not in items_left:
+                    outcome.status = "resumed"
+                    continue
+                limits.acquire(project)
+                started_at = time.perf_counter()
+                try:
+                    self._apply_structure(
+                        dataset, project, structure_id, structure, allow_rebuild
+                    )
+                except Exception as e:
+                    outcome.status, outcome.error = "failed", str(e)
+                if journal is not None:
+                    journal.record(
+                        "deploy",
+                        item,
+                        Journal.failed if outcome.error else Journal.done,
+                        outcome.error,
+                    )
+                outcome.seconds = time.perf_counter() - started_at
+            return outcomes
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(
+                zip(
+                    targets,
+                    executor.map(propagate_context(deploy), targets),
+                    strict=True,
+                )
+            )
+
     def _handle_table_or_view(
-        self, dataset: str, project: str, structure_id: str, structure: Structure
+        self,
+        dataset: str,
+        project: str,
+        structure_id: str,
+        structure: Structure,
+        allow_rebuild: bool = False,
     ):
         """
         Function creates/updates BigQuery Table per the provided information.
@@ -253,6 +688,8 @@ class BigQuery:
                 ID of the routine.
             structure (Structure):
                 An object of internal Structure class.
+            allow_rebuild (bool):
+                Whether the structure may be rebuilt to apply changes.
 
         Returns:
             Routine: An object of BigQuery Routine.
@@ -260,26 +697,44 @@ class BigQuery:
         fields_to_update = []
 
         try:
-            bq_structure = self.get_structure(project, dataset, structure_id)
+            # The project of the shared client is left alone, deploy_structures
+            # applies structures to many projects concurrently
+            table_id = f"{project}.{dataset}.{structure_id}"
+            bq_structure = self._call("get_table", table_id)
+
+            if structure.type == StructureType.table and allow_rebuild:
+                reasons = self._get_rebuild_reasons(bq_structure, structure)
+                if reasons:
+                    _, rebuilt = self._rebuild_table(
+                        dataset, project, structure_id, structure, bq_structure, reasons
+                    )
+                    return rebuilt
 
             if structure.type == StructureType.table:
                 fields_to_update.append("schema")
-                schema = get_bq_schema_from_json_schema(structure.table_schema)
-                bq_structure.schema = schema
+                bq_structure.schema = self._get_bq_schema(structure)
             elif structure.type == StructureType.view:
                 fields_to_update.append("view_query")
                 bq_structure.view_query = structure.view_query
+            elif structure.type == StructureType.materialized_view:
+                if (bq_structure.mview_query or "").strip() != (
+                    structure.mview_query or ""
+                ).strip():
+                    if allow_rebuild:
+                        # Materialized views are computed from their query again
+                        self._call("delete_table", bq_structure)
+                        return self._handle_create_structure(
+                            dataset, project, structure_id, structure
+                        )
+                    raise InvalidDefinitionException(
+                        f"The query of materialized view {structure_id} cannot be "
+                        "updated, the view has to be recreated"
+                    )
+                fields_to_update.extend(
+                    self._set_materialized_view_options(bq_structure, structure)
+                )
 
-            if structure.labels and structure.labels != bq_structure.labels:
-                fields_to_update.append("labels")
-                bq_structure.labels = structure.labels
-
-            if (
-                structure.description
-                and structure.description != bq_structure.description
-            ):
-                fields_to_update.append("description")
-                bq_structure.description = structure.description
+            fields_to_update.extend(self._set_table_options(bq_structure, structure))
 
             if (
                 structure.clustering
@@ -288,7 +743,8 @@ class BigQuery:
                 fields_to_update.append("clustering")
                 bq_structure.clustering_fields = structure.clustering  # type: ignore
 
-            self.bq_client.update_table(bq_structure, fields_to_update)
+            if fields_to_update:
+                self._call("update_table", bq_structure, fields_to_update)
 
             return bq_structure
         except NotFound:
@@ -296,6 +752,298 @@ class BigQuery:
                 dataset, project, structure_id, structure
             )
 
+    def _set_table_options(
+        self, bq_structure: Table, structure: Structure
+    ) -> list[str]:
+        """
+        Function sets the options of a structure that differ on a table: the
+        partition filter requirement, the partition expiration, the labels and the
+        description.
+
+        Args:
+            bq_structure (Table):
+                An object of BigQuery Table, the existing table.
+            structure (Structure):
+                An object of internal Structure class.
+
+        Returns:
+            List[str]: The fields to update.
+        """
+        fields_to_update = []
+        if (
+            structure.require_partition_filter is not None
+            and structure.require_partition_filter
+            != bq_structure.require_partition_filter
+        ):
+            fields_to_update.append("require_partition_filter")
+            bq_structure.require_partition_filter = structure.require_partition_filter
+
+        expiration_ms = self._get_partition_expiration_ms(structure)
+        time_partitioning = bq_structure.time_partitioning
+        if (
+            expiration_ms is not None
+            and time_partitioning is not None
+            and expiration_ms != time_partitioning.expiration_ms
+        ):
+            fields_to_update.append("time_partitioning")
+            time_partitioning.expiration_ms = expiration_ms
+            bq_structure.time_partitioning = time_partitioning
+
+        if structure.labels and structure.labels != bq_structure.labels:
+            fields_to_update.append("labels")
+            bq_structure.labels = structure.labels
+
+        if structure.description and structure.description != bq_structure.description:
+            fields_to_update.append("description")
+            bq_structure.description = structure.description
+        return fields_to_update
+
+    def _get_rebuild_reasons(
+        self, bq_structure: Table, structure: Structure
+    ) -> list[str]:
+        """
+        Function returns the differences between the partitioning and clustering of a
+        table and its definition, which require rebuilding the table.
+
+        Args:
+            bq_structure (Table):
+                An object of BigQuery Table, the existing table.
+            structure (Structure):
+                An object of internal Structure class.
+
+        Returns:
+            List[str]: A description of every difference.
+        """
+        defined = bigquery.Table(bq_structure.reference)
+        if structure.partition:
+            defined = self._add_partitioning_scheme(defined, structure.partition)
+
+        reasons = []
+        existing_time = bq_structure.time_partitioning
+        defined_time = defined.time_partitioning
+        existing_spec = (
+            (existing_time.type_, existing_time.field) if existing_time else None
+        )
+        defined_spec = (
+            (defined_time.type_, defined_time.field) if defined_time else None
+        )
+        if existing_spec != defined_spec:
+            reasons.append(f"time partitioning {existing_spec} -> {defined_spec}")
+
+        existing_range = bq_structure.range_partitioning
+        defined_range = defined.range_partitioning
+        existing_spec = (
+            (existing_range.field, existing_range.range_) if existing_range else None
+        )
+        defined_spec = (
+            (defined_range.field, defined_range.range_) if defined_range else None
+        )
+        if existing_spec != defined_spec:
+            reasons.append(f"range partitioning {existing_spec} -> {defined_spec}")
+
+        if structure.clustering and structure.clustering != (
+            bq_structure.clustering_fields or []
+        ):
+            reasons.append(
+                f"clustering {bq_structure.clustering_fields} -> {structure.clustering}"
+            )
+        return reasons
+
+    @instrumented
+    def rebuild_table(
+        self,
+        project: str,
+        dataset: str,
+        structure_id: str,
+        json_schema: list[dict] | dict,
+    ) -> RebuildReport:
+        """
+        Function rebuilds a table per the provided definition, applying partitioning
+        and clustering changes to the existing data.
+
+        The rows are copied into a shadow table created from the definition. As
+        BigQuery refuses to replace a table by one partitioned differently, the
+        table is then dropped and copied back from the shadow table. The swap is
+        not atomic: between the drop and the end of the copy the table does not
+        exist, and if the copy fails the rows are kept in the shadow table,
+        `<table>__rebuild`. Rows written to the table while it is rebuilt are lost,
+        writers should be paused.
+
+        Columns missing from the definition are dropped. The labels, description,
+        partition filter requirement and partition expiration of the definition and
+        the expiration of the table are applied again after the copy. The IAM policy
+        of the table is restored and its search and vector indexes are recreated, see
+        the report for those that could not be. Row access policies and the policy tags of
+        columns missing from the definition are not carried over.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            json_schema (Union[List[Dict], Dict]):
+                Definition of the table, see `create_or_update_structure`.
+
+        Returns:
+            RebuildReport: The reasons of the rebuild and the bytes moved.
+        """
+        self.bq_client.project = project
+        structure = self._get_structure(json_schema)
+        bq_structure = self.get_structure(project, dataset, structure_id)
+        report, _ = self._rebuild_table(
+            dataset,
+            project,
+            structure_id,
+            structure,
+            bq_structure,
+            self._get_rebuild_reasons(bq_structure, structure),
+        )
+        return report
+
+    def _rebuild_table(
+        self,
+        dataset: str,
+        project: str,
+        structure_id: str,
+        structure: Structure,
+        bq_structure: Table,
+        reasons: list[str],
+    ) -> tuple[RebuildReport, Table]:
+        """
+        Function rebuilds a table through a shadow table, see `rebuild_table`.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            structure (Structure):
+                An object of internal Structure class.
+            bq_structure (Table):
+                An object of BigQuery Table, the existing table.
+            reasons (List[str]):
+                Differences requiring the rebuild.
+
+        Returns:
+            Tuple[RebuildReport, Table]: An object of RebuildReport and the rebuilt
+                table.
+        """
+        table_id = f"{project}.{dataset}.{structure_id}"
+        shadow_id = f"{structure_id}__rebuild"
+        shadow_table_id = f"{project}.{dataset}.{shadow_id}"
+        existing_columns = {field.name for field in bq_structure.schema}
+        # Rows are copied with INSERT ... SELECT over the shared columns
+        missing = [
+            field["name"]
+            for field in structure.table_schema
+            if str(field.get("mode", "NULLABLE")).upper() == "REQUIRED"
+            and field.get("name") not in existing_columns
+        ]
+        if missing:
+            raise InvalidDefinitionException(
+                f"Cannot rebuild {table_id}, the REQUIRED columns {missing} have no "
+                "values in the existing table"
+            )
+        # Reading a table requiring a partition filter needs one, this one keeps
+        # every row
+        where = ""
+        if bq_structure.time_partitioning is not None:
+            column = bq_structure.time_partitioning.field
+            column = f"`{column}`" if column else "_PARTITIONTIME"
+            where = f" WHERE {column} IS NULL OR {column} IS NOT NULL"
+        elif bq_structure.range_partitioning is not None:
+            column = f"`{bq_structure.range_partitioning.field}`"
+            where = f" WHERE {column} IS NULL OR {column} IS NOT NULL"
+        started_at = time.perf_counter()
+
+        with self._span("phase", "rebuild") as span:
+            indexes = [
+                index
+                for index in self.get_indexes(project, dataset, structure_id)
+                if index.ddl
+            ]
+            policy = self._call("get_iam_policy", table_id)
+
+            # A shadow table left by an interrupted rebuild is replaced
+            self._call("delete_table", shadow_table_id, not_found_ok=True)
+            shadow = self._handle_create_structure(
+                dataset, project, shadow_id, structure
+            )
+            try:
+                columns = ", ".join(
+                    f"`{field.name}`"
+                    for field in shadow.schema
+                    if field.name in existing_columns
+                )
+                copy_job = self.execute(
+                    f"INSERT INTO `{shadow.reference}` ({columns}) "  # noqa: S608
+                    f"SELECT {columns} FROM `{table_id}`{where}",
+                    project=project,
+                )
+            except Exception:
+                self._call("delete_table", shadow_table_id, not_found_ok=True)
+                raise
+
+            self._call("delete_table", table_id)
+            try:
+                wait_for_job(
+                    self._call(
+                        "copy_table", shadow_table_id, table_id, project=project
+                    ),
+                    self.job_timeout,
+                    rpc=self._rpc,
+                )
+            except Exception as e:
+                raise GbqException(
+                    f"Failed to copy {shadow_table_id} to {table_id}, the table was "
+                    f"dropped and its rows are kept in {shadow_table_id}: {e}"
+                ) from e
+            self._call("delete_table", shadow_table_id)
+
+            # The copy keeps the schema, partitioning and clustering only
+            table = self._call("get_table", table_id)
+            fields_to_update = self._set_table_options(table, structure)
+            if bq_structure.expires is not None:
+                fields_to_update.append("expires")
+                table.expires = bq_structure.expires
+            if fields_to_update:
+                table = self._call("update_table", table, fields_to_update)
+
+            report = RebuildReport(
+                table_id=table_id,
+                reasons=reasons,
+                rows=copy_job.num_dml_affected_rows,
+                bytes_processed=copy_job.total_bytes_processed or 0,
+                bytes_billed=copy_job.total_bytes_billed or 0,
+                indexes=[],
+                warnings=[],
+            )
+            if policy.bindings:
+                new_policy = self._call("get_iam_policy", table_id)
+                new_policy.bindings = policy.bindings
+                self._call("set_iam_policy", table_id, new_policy)
+            if indexes:
+                results = self.run_script(
+                    [str(index.ddl) for index in indexes], project=project
+                )
+                for index, result in zip(indexes, results, strict=True):
+                    if result.status == "done":
+                        report.indexes.append(index.name)
+                    else:
+                        report.warnings.append(
+                            f"{index.kind} index {index.name} was dropped: "
+                            f"{result.error}"
+                        )
+            report.seconds = time.perf_counter() - started_at
+            if span is not None:
+                span.bytes = report.bytes_processed
+                span.bytes_billed = report.bytes_billed
+        return report, table
+
     @staticmethod
     def _get_structure(json_schema: dict | list[dict]) -> Structure:
         """
@@ -317,6 +1065,18 @@ class BigQuery:
 
         return  # type: ignore
 
+    def _get_bq_schema(self, structure: Structure) -> list[bigquery.SchemaField]:
+        """
+        Function returns the BigQuery schema of a structure, converted from its JSON
+        schema once.
+        """
+        if structure._bq_schema is None:
+            with self._span("phase", "schema_conversion"):
+                structure._bq_schema = get_bq_schema_from_json_schema(
+                    structure.table_schema
+                )
+        return structure._bq_schema
+
     def _handle_create_structure(
         self, dataset: str, project: str, structure_id: str, structure: Structure
     ) -> Table:
@@ -339,10 +1099,14 @@ class BigQuery:
         # Create BQ Table object
         bq_structure = bigquery.Table(f"{project}.{dataset}.{structure_id}")
 
-        if structure.table_schema:
+        if structure.mview_query:
+            bq_structure.mview_query = structure.mview_query
+            self._set_materialized_view_options(bq_structure, structure)
+
+        if structure.table_schema or structure.mview_query:
             # Get BQ Schema from JSON provided
-            schema = get_bq_schema_from_json_schema(structure.table_schema)
-            bq_structure.schema = schema
+            if structure.table_schema:
+                bq_structure.schema = self._get_bq_schema(structure)
 
             # Configure Partition
             if structure.partition:
@@ -353,6 +1117,11 @@ class BigQuery:
             # Configure Clustering
             bq_structure.clustering_fields = structure.clustering  # type: ignore
 
+            if structure.require_partition_filter is not None:
+                bq_structure.require_partition_filter = (
+                    structure.require_partition_filter
+                )
+
         if structure.view_query:
             bq_structure.view_query = structure.view_query
 
@@ -362,9 +1131,173 @@ class BigQuery:
         if structure.description:
             bq_structure.description = structure.description
 
-        self.bq_client.create_table(bq_structure)
+        self._call("create_table", bq_structure)
         return bq_structure
 
+    def _handle_indexes(
+        self, dataset: str, project: str, structure_id: str, structure: Structure
+    ):
+        """
+        Function creates, recreates and drops the search and vector indexes of a
+        table per the provided definition, in a single script job.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            structure (Structure):
+                An object of internal Structure class.
+        """
+        statements = plan_index_changes(
+            f"{project}.{dataset}.{structure_id}",
+            self.get_indexes(project, dataset, structure_id),
+            structure.search_indexes,
+            structure.vector_indexes,
+        )
+        if not statements:
+            return
+
+        failed = [
+            result
+            for result in self.run_script(statements, project=project)
+            if result.status != "done"
+        ]
+        if failed:
+            raise GbqException(
+                f"Failed to update the indexes of {structure_id}: "
+                + "; ".join(f"{result.statement}: {result.error}" for result in failed)
+            )
+
+    @instrumented
+    def get_indexes(
+        self, project: str, dataset: str, structure_id: str
+    ) -> list[IndexStatus]:
+        """
+        Function returns the search and vector indexes of a table with their coverage.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+
+        Returns:
+            List[IndexStatus]: The indexes of the table.
+        """
+        query_job = self.execute(
+            get_indexes_query(project, dataset),
+            parameters={"table": structure_id},
+            project=project,
+        )
+        return [
+            IndexStatus(
+                name=row["index_name"],
+                kind=row["kind"],
+                status=row["index_status"],
+                coverage_percentage=row["coverage_percentage"],
+                ddl=row["ddl"],
+                columns=list(row["columns"]),
+                options=get_index_options(row["options"]),
+            )
+            for row in query_job.result()
+        ]
+
+    @instrumented
+    def wait_for_indexes(
+        self,
+        project: str,
+        dataset: str,
+        structure_id: str,
+        min_coverage: float = 100.0,
+        timeout: float | None = None,
+        interval: float = 10.0,
+    ) -> list[IndexStatus]:
+        """
+        Function waits until the indexes of a table cover min_coverage percent of it.
+
+        BigQuery builds indexes in the background, queries only use an index once
+        its coverage is complete.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            min_coverage (float):
+                Coverage percentage every index has to reach.
+            timeout (Optional[float]):
+                Maximum number of seconds to wait, unlimited by default.
+            interval (float):
+                Number of seconds between polls.
+
+        Returns:
+            List[IndexStatus]: The indexes of the table.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            indexes = [
+                index
+                for index in self.get_indexes(project, dataset, structure_id)
+                if index.ddl
+            ]
+            if all(
+                (index.coverage_percentage or 0) >= min_coverage for index in indexes
+            ):
+                return indexes
+            if deadline is not None and time.monotonic() + interval > deadline:
+                raise GbqException(
+                    f"Indexes of {structure_id} did not reach {min_coverage}% "
+                    f"coverage within {timeout}s"
+                )
+            time.sleep(interval)
+
+    @staticmethod
+    def _set_materialized_view_options(
+        bq_structure: Table, structure: Structure
+    ) -> list[str]:
+        """
+        Function sets the refresh and staleness options of a materialized view.
+
+        Args:
+            bq_structure (Table):
+                An object of BigQuery Table, the materialized view.
+            structure (Structure):
+                An object of internal Structure class.
+
+        Returns:
+            List[str]: Table properties that changed.
+        """
+        changed = []
+        if (
+            structure.enable_refresh is not None
+            and structure.enable_refresh != bq_structure.mview_enable_refresh
+        ):
+            bq_structure.mview_enable_refresh = structure.enable_refresh
+            changed.append("mview_enable_refresh")
+
+        if structure.refresh_interval_ms is not None:
+            refresh_interval = datetime.timedelta(
+                milliseconds=structure.refresh_interval_ms
+            )
+            if refresh_interval != bq_structure.mview_refresh_interval:
+                bq_structure.mview_refresh_interval = refresh_interval
+                changed.append("mview_refresh_interval")
+
+        if (
+            structure.max_staleness is not None
+            and structure.max_staleness != bq_structure.max_staleness
+        ):
+            bq_structure.max_staleness = structure.max_staleness
+            changed.append("max_staleness")
+        return changed
+
     def _handle_stored_procedure(
         self, dataset: str, project: str, structure_id: str, structure: Structure
     ) -> Routine:
@@ -386,16 +1319,17 @@ class BigQuery:
         Returns:
             Routine: An object of BigQuery Routine.
         """
-        self.bq_client.project = project
         routine_id = f"{project}.{dataset}.{structure_id}"
+        self._procedure_arguments.pop(routine_id, None)
 
         try:
-            routine = self.get_routine(project, dataset, structure_id)
+            routine = self._call("get_routine", routine_id)
             routine.body = structure.body
             routine.arguments = self._handle_routine_arguments(structure)
             routine.description = structure.description
 
-            routine = self.bq_client.update_routine(
+            routine = self._call(
+                "update_routine",
                 routine,
                 [
                     "body",
@@ -419,7 +1353,7 @@ class BigQuery:
             routine.description = structure.description
             routine.arguments = self._handle_routine_arguments(structure)
 
-            routine = self.bq_client.create_routine(routine)
+            routine = self._call("create_routine", routine)
         return routine
 
     @staticmethod
@@ -463,15 +1397,35 @@ class BigQuery:
         Returns:
             Table: An object of BigQuery Table.
         """
-        if partition_scheme.type.value == PartitionType.time.value:
-            time_partitioning = self._get_time_partitioned_scheme(partition_scheme)
+        time_partitioning, range_partitioning = self._get_partitioning_scheme(
+            partition_scheme
+        )
+        if time_partitioning is not None:
             bq_structure.time_partitioning = time_partitioning
-        elif partition_scheme.type.value == PartitionType.range.value:
-            range_partitioning = self._get_range_partitioned_scheme(partition_scheme)
+        elif range_partitioning is not None:
             bq_structure.range_partitioning = range_partitioning
 
         return bq_structure
 
+    def _get_partitioning_scheme(
+        self, partition_scheme: Partition
+    ) -> tuple[bigquery.TimePartitioning | None, bigquery.RangePartitioning | None]:
+        """
+        Function returns the time or range partitioning of a partitioning scheme,
+        shared by tables and load jobs.
+
+        Args:
+            partition_scheme (Partition):
+                An object of internal Partition.
+
+        Returns:
+            Tuple[Optional[bigquery.TimePartitioning], Optional[bigquery.RangePartitioning]]:
+                The time partitioning or the range partitioning, the other is None.
+        """
+        if partition_scheme.type.value == PartitionType.time.value:
+            return self._get_time_partitioned_scheme(partition_scheme), None
+        return None, self._get_range_partitioned_scheme(partition_scheme)
+
     @staticmethod
     def _get_time_partitioned_scheme(
         partition_scheme: Partition,
@@ -494,6 +1448,18 @@ class BigQuery:
             time_partitioning.expiration_ms = definition.expirationMs
         return time_partitioning
 
+    @staticmethod
+    def _get_partition_expiration_ms(structure: Structure) -> int | None:
+        """
+        Function returns the partition expiration of a time partitioned structure.
+        """
+        if structure.partition is None or not isinstance(
+            structure.partition.definition, TimeDefinition
+        ):
+            return None
+        expiration_ms = structure.partition.definition.expirationMs
+        return int(expiration_ms) if expiration_ms else None
+
     @staticmethod
     def _get_range_partitioned_scheme(
         partition_scheme: Partition,
@@ -513,24 +1479,1127 @@ class BigQuery:
         range_partitioning.range_ = PartitionRange(**definition.range.__dict__)
         return range_partitioning
 
-    def execute(self, query: str) -> QueryJob:
+    @instrumented
+    def list_partitions(
+        self, project: str, dataset: str, structure_id: str
+    ) -> list[PartitionInfo]:
+        """
+        Function returns the partitions of a table with their row counts and sizes.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+
+        Returns:
+            List[PartitionInfo]: The partitions of the table, by partition ID.
+        """
+        query_job = self.execute(
+            get_partitions_query(project, dataset),
+            parameters={"table": structure_id},
+            project=project,
+        )
+        return [PartitionInfo(**dict(row.items())) for row in query_job.result()]
+
+    @instrumented
+    def delete_partitions(
+        self,
+        project: str,
+        dataset: str,
+        structure_id: str,
+        partition_ids: list[str] | None = None,
+        start: str | None = None,
+        end: str | None = None,
+        max_workers: int = 8,
+    ) -> list[str]:
+        """
+        Function deletes partitions of a table, removing all of their rows.
+
+        Partitions are deleted through partition decorators, such as table$20240101,
+        which is a metadata operation: unlike DELETE statements it is neither billed
+        nor limited by DML quotas. Partitions are deleted concurrently.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            partition_ids (Optional[List[str]]):
+                Partitions to delete, such as "20240101".
+            start (Optional[str]):
+                First partition to delete when partition_ids is not given.
+            end (Optional[str]):
+                Last partition to delete when partition_ids is not given.
+            max_workers (int):
+                Maximum number of concurrent deletions.
+
+        Returns:
+            List[str]: IDs of the deleted partitions.
+        """
+        self.bq_client.project = project
+        if partition_ids is None:
+            if start is None and end is None:
+                raise GbqException("Either partition_ids, start or end is required")
+            partition_ids = select_partitions(
+                self.list_partitions(project, dataset, structure_id), start, end
+            )
+
+        table_id = f"{project}.{dataset}.{structure_id}"
+
+        def delete_partition(partition_id: str) -> str:
+            self._call("delete_table", f"{table_id}${partition_id}", not_found_ok=True)
+            return partition_id
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(propagate_context(delete_partition), partition_ids)
+            )
+
+    @instrumented
+    def set_partition_expiration(
+        self,
+        project: str,
+        dataset: str,
+        structure_id: str,
+        expiration_ms: int | None,
+    ) -> Table:
+        """
+        Function updates the partition expiration of a time partitioned table.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            expiration_ms (Optional[int]):
+                Milliseconds partitions are kept after their partition time, None to
+                keep them forever.
+
+        Returns:
+            Table: An object of BigQuery Table.
+        """
+        bq_structure = self.get_structure(project, dataset, structure_id)
+        time_partitioning = bq_structure.time_partitioning
+        if time_partitioning is None:
+            raise InvalidDefinitionException(
+                f"Table {structure_id} is not partitioned by time"
+            )
+        time_partitioning.expiration_ms = expiration_ms
+        bq_structure.time_partitioning = time_partitioning
+        return self._call("update_table", bq_structure, ["time_partitioning"])
+
+    @instrumented
+    def upsert(
+        self,
+        project: str,
+        dataset: str,
+        staging: str,
+        target: str,
+        keys: list[str],
+        update_columns: list[str] | None = None,
+        split_rows: int | None = None,
+        max_workers: int = 2,
+        timeout: float | None = None,
+    ) -> UpsertReport:
+        """
+        Function upserts the rows of a staging table into a target table with MERGE
+        statements built from the schema of the target.
+
+        When the target is partitioned by a column, the MERGE only reads the target
+        partitions between the minimum and maximum values of that column in the
+        staging data, instead of the whole target. The partitioning column of a row
+        must therefore not change, and keys must not be NULL.
+
+        Merges of more than split_rows staging rows run as a job per partition,
+        concurrently. BigQuery runs two mutating DML statements on a table at once
+        and queues the others.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the tables.
+            staging (str):
+                ID of the staging table, in the dataset unless given as
+                dataset.table or project.dataset.table.
+            target (str):
+                ID of the target table.
+            keys (List[str]):
+                Columns identifying a row.
+            update_columns (Optional[List[str]]):
+                Columns updated in existing rows, all columns but the keys by default.
+            split_rows (Optional[int]):
+                Number of staging rows above which the merge runs per partition,
+                never by default.
+            max_workers (int):
+                Maximum number of partitions merged concurrently.
+            timeout (Optional[float]):
+                Number of seconds to wait for a job, job_timeout by default.
+
+        Returns:
+            UpsertReport: The jobs run, the rows affected and the bytes processed.
+        """
+        self.bq_client.project = project
+        started_at = time.perf_counter()
+        target_table = self.get_structure(project, dataset, target)
+        staging_table = self._call(
+            "get_table", staging if "." in staging else f"{project}.{dataset}.{staging}"
+        )
+        target_id = f"{project}.{dataset}.{target}"
+        staging_id = str(staging_table.reference)
+
+        staging_columns = {field.name for field in staging_table.schema}
+        columns = [
+            field.name for field in target_table.schema if field.name in staging_columns
+        ]
+        missing_keys = [key for key in keys if key not in columns]
+        if missing_keys:
+            raise GbqException(
+                f"Keys missing from {target_id} or {staging_id}: {missing_keys}"
+            )
+
+        def merge(
+            partition_column: str | None = None,
+            bounds: dict | None = None,
+            nulls: bool = False,
+            filter_staging: bool = False,
+        ) -> QueryJob:
+            statement = build_merge(
+                target_id,
+                staging_id,
+                columns,
+                keys,
+                update_columns,
+                partition_column,
+                bounded=bounds is not None,
+                nulls=nulls,
+                filter_staging=filter_staging,
+            )
+            return self.execute(statement, timeout=timeout, parameters=bounds)
+
+        jobs = []
+        partition_key = get_partition_key(target_table)
+        if partition_key is None or partition_key[0] not in staging_columns:
+            jobs.append(merge())
+            partitions = []
+        else:
+            column, key = partition_key
+            bounds_job = self.execute(
+                get_staging_partitions_query(staging_id, column, key), timeout=timeout
+            )
+            jobs.append(bounds_job)
+            partitions = [dict(row.items()) for row in bounds_job.result()]
+            bounded = [row for row in partitions if row["min_value"] is not None]
+
+            def merge_partition(row: dict) -> QueryJob:
+                if row["min_value"] is None:
+                    return merge(column, nulls=True, filter_staging=True)
+                bounds = {"min_value": row["min_value"], "max_value": row["max_value"]}
+                return merge(column, bounds, filter_staging=True)
+
+            staging_rows = sum(row["row_count"] for row in partitions)
+            if split_rows is not None and staging_rows > split_rows:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    jobs.extend(
+                        executor.map(propagate_context(merge_partition), partitions)
+                    )
+            elif partitions:
+                bounds = None
+                if bounded:
+                    bounds = {
+                        "min_value": min(row["min_value"] for row in bounded),
+                        "max_value": max(row["max_value"] for row in bounded),
+                    }
+                jobs.append(merge(column, bounds, len(bounded) < len(partitions)))
+
+        return UpsertReport(
+            table_id=target_id,
+            jobs=len(jobs),
+            partitions=len(partitions),
+            rows=sum(job.num_dml_affected_rows or 0 for job in jobs),
+            bytes_processed=sum(job.total_bytes_processed or 0 for job in jobs),
+            bytes_billed=sum(job.total_bytes_billed or 0 for job in jobs),
+            seconds=time.perf_counter() - started_at,
+        )
+
+    @instrumented
+    def copy_tables(
+        self,
+        source: str,
+        destination: str,
+        include: list[str] | None = None,
+        exclude: list[str] | None = None,
+        operation: str = "COPY",
+        expiration: datetime.datetime | None = None,
+        max_workers: int = 8,
+        journal: Journal | None = None,
+        timeout: float | None = None,
+    ) -> list[CopyReport]:
+        """
+        Function copies, snapshots or clones the tables of a dataset into another
+        dataset, possibly of another project, with concurrent jobs.
+
+        Copied tables are created or updated from the definition and schema of their
+        source, see `create_or_update_structure`, then overwritten by a copy job.
+        Snapshots and clones are created by their job. Views are not copied.
+
+        With a journal, the tables copied by a previous run of the journal are
+        skipped, so an interrupted copy resumes with the tables left. A snapshot or
+        clone of the source found at its destination is also considered done.
+
+        A failed table does not raise, see the status of its report.
+
+        Args:
+            source (str):
+                Source dataset, as project.dataset.
+            destination (str):
+                Destination dataset, as project.dataset, created when missing.
+            include (Optional[List[str]]):
+                Shell-style patterns of the copied table names, all tables by default.
+            exclude (Optional[List[str]]):
+                Shell-style patterns of the table names not copied.
+            operation (str):
+                One of "COPY", "SNAPSHOT" or "CLONE".
+            expiration (Optional[datetime.datetime]):
+                Expiration time of the snapshots.
+            max_workers (int):
+                Maximum number of tables copied concurrently, the jobs in flight.
+            journal (Optional[Journal]):
+                Journal recording the status of every table, see `gbq.journal`.
+            timeout (Optional[float]):
+                Number of seconds to wait for a job, job_timeout by default.
+
+        Returns:
+            List[CopyReport]: The report of every table, with status "done",
+                "resumed" when copied by a previous run, or "failed".
+        """
+        operation = operation.upper()
+        if operation not in copy_operations:
+            raise GbqException(
+                f"Invalid operation {operation}, expected one of {copy_operations}"
+            )
+        # Every call names its project, workers never set the project of the client
+        destination_project, destination_dataset = destination.split(".")
+
+        source_location = self._call("get_dataset", source).location
+        dataset = bigquery.Dataset(destination)
+        dataset.location = source_location
+        self._call("create_dataset", dataset, exists_ok=True)
+
+        names = select_tables(list(self._call("list_tables", source)), include, exclude)
+        journal_operation = f"{operation.lower()} {source} {destination}"
+        names_left = set(
+            journal.start(journal_operation, names) if journal is not None else names
+        )
+        job_timeout = self.job_timeout if timeout is None else timeout
+
+        def copy_table(name: str) -> CopyReport:
+            # Calls of the table are counted under the destination project
+            with self._span(
+                "phase",
+                "table",
+                project=destination_project,
+                dataset=destination_dataset,
+                structure=name,
+            ):
+                return copy_one_table(name)
+
+        def copy_one_table(name: str) -> CopyReport:
+            source_id = f"{source}.{name}"
+            destination_id = f"{destination}.{name}"
+            report = CopyReport(
+                source_id=source_id,
+                destination_id=destination_id,
+                operation=operation,
+                status="done",
+            )
+            if name not in names_left:
+                report.status = "resumed"
+                return report
+
+            started_at = time.perf_counter()
+            try:
+                job_config = bigquery.CopyJobConfig(operation_type=operation)
+                if operation == "COPY":
+                    source_table = self._call("get_table", source_id)
+                    structure = self._get_structure(
+                        get_structure_definition(source_table)
+                    )
+                    check_structure(structure, name)
+                    # The fields of the source are kept as they are, with their
+                    # policy tags, default values and precision
+                    structure._bq_schema = list(source_table.schema)
+                    self._apply_structure(
+                        destination_dataset, destination_project, name, structure
+                    )
+                    job_config.write_disposition = (
+                        bigquery.WriteDisposition.WRITE_TRUNCATE
+                    )
+                elif self._is_copy_of(destination_id, source_id, operation):
+                    report.status = "resumed"
+                elif expiration is not None:
+                    job_config.destination_expiration_time = expiration.isoformat()
+
+                if report.status == "done":
+                    with self._span("phase", operation.lower()):
+                        copy_job = self._call(
+                            "copy_table",
+                            source_id,
+                            destination_id,
+                            job_config=job_config,
+                            project=destination_project,
+                        )
+                        wait_for_job(copy_job, job_timeout, rpc=self._rpc)
+            except Exception as e:
+                report.status, report.error = "failed", str(e)
+            if journal is not None:
+                journal.record(
+                    journal_operation,
+                    name,
+                    Journal.failed if report.error else Journal.done,
+                    report.error,
+                )
+            report.seconds = time.perf_counter() - started_at
+            return report
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(propagate_context(copy_table), names))
+
+    def _is_copy_of(self, table_id: str, source_id: str, operation: str) -> bool:
+        """
+        Function returns whether a table is a snapshot or clone of a source table.
+        """
+        try:
+            table = self._call("get_table", table_id)
+        except NotFound:
+            return False
+        definition = (
+            table.snapshot_definition
+            if operation == "SNAPSHOT"
+            else table.clone_definition
+        )
+        if definition is None:
+            return False
+        reference = definition.base_table_reference
+        return f"{reference.project}.{reference.dataset_id}.{reference.table_id}" == (
+            source_id
+        )
+
+    def snapshot_tables(
+        self, source: str, destination: str, **kwargs
+    ) -> list[CopyReport]:
+        """
+        Function snapshots the tables of a dataset, see `copy_tables`.
+        """
+        return self.copy_tables(source, destination, operation="SNAPSHOT", **kwargs)
+
+    def clone_tables(self, source: str, destination: str, **kwargs) -> list[CopyReport]:
+        """
+        Function clones the tables of a dataset, see `copy_tables`.
+        """
+        return self.copy_tables(source, destination, operation="CLONE", **kwargs)
+
+    @instrumented
+    def analyze_job_history(
+        self, project: str, region: str = "us", days: int = 30, **kwargs
+    ) -> list[TableRecommendation]:
+        """
+        Function proposes partitioning and clustering for the tables of a project from
+        the filters of its recent query jobs, see `gbq.analyzer.JobHistoryAnalyzer`.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            region (str):
+                Region of the jobs, such as "us" or "europe-west1".
+            days (int):
+                Number of days of job history analyzed.
+            kwargs:
+                Options of `JobHistoryAnalyzer.recommend`, such as
+                max_clustering_columns.
+
+        Returns:
+            List[TableRecommendation]: Recommendations, largest savings first.
+        """
+        self.bq_client.project = project
+        analyzer = JobHistoryAnalyzer(default_project=project)
+        query_job = self.execute(
+            get_job_history_query(region), parameters={"days": days}
+        )
+        analyzer.add_jobs(dict(row.items()) for row in query_job.result())
+
+        schemas = {}
+        for table_id in analyzer.usage():
+            try:
+                table = self._call("get_table", table_id)
+            except NotFound:
+                continue
+            schemas[table_id] = [
+                {"name": field.name, "type": field.field_type} for field in table.schema
+            ]
+        return analyzer.recommend(schemas, **kwargs)
+
+    def streaming_writer(self, project: str, dataset: str, **kwargs) -> StreamingWriter:
+        """
+        Function returns a StreamingWriter inserting rows in the tables of a dataset.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the tables.
+            kwargs:
+                Flushing, concurrency and retry options of StreamingWriter.
+
+        Examples:
+            with bq.streaming_writer("project", "dataset", max_rows=1000) as writer:
+                writer.write("table", rows)
+
+        Returns:
+            StreamingWriter: An object of StreamingWriter.
+        """
+        return StreamingWriter(
+            self.bq_client, project, dataset, rpc=self._rpc, **kwargs
+        )
+
+    @instrumented
+    def load_files(
+        self,
+        project: str,
+        dataset: str,
+        structure_id: str,
+        paths: list[str],
+        json_schema: list[dict] | dict | None = None,
+        source_format: str | None = None,
+        target_bytes: int = 256 * 1024 * 1024,
+        compress: bool = True,
+        max_workers: int = 4,
+        skip_leading_rows: int = 0,
+        allow_quoted_newlines: bool = False,
+    ) -> list[LoadJobReport]:
+        """
+        Function appends local NDJSON, CSV or Parquet files to a table with parallel load jobs.
+
+        Files are grouped or split into jobs of about target_bytes. Each job uploads its
+        input with a resumable upload and waits for the job while other workers upload,
+        so network time overlaps with BigQuery job overhead.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            paths (List[str]):
+                Local files to load.
+            json_schema (Optional[Union[List[Dict], Dict]]):
+                Definition of the table as accepted by `create_or_update_structure`, its
+                schema, partitioning and clustering are used if the table is created.
+            source_format (Optional[str]):
+                BigQuery source format, inferred from the file extensions by default.
+            target_bytes (int):
+                Approximate size of the input of a single load job.
+            compress (bool):
+                Whether NDJSON and CSV inputs are gzip compressed before upload.
+            max_workers (int):
+                Maximum number of concurrent load jobs.
+            skip_leading_rows (int):
+                Number of header lines of CSV files.
+            allow_quoted_newlines (bool):
+                Whether CSV values contain newlines, CSV files are not split if so.
+
+        Returns:
+            List[LoadJobReport]: Throughput of every load job, in input order.
+        """
+        self.bq_client.project = project
+        source_format = source_format or get_source_format(paths)
+        job_config = self._get_load_job_config(source_format, json_schema)
+        if source_format == bigquery.SourceFormat.CSV:
+            job_config.skip_leading_rows = skip_leading_rows
+            job_config.allow_quoted_newlines = allow_quoted_newlines
+
+        chunks = plan_load_chunks(
+            paths,
+            source_format,
+            target_bytes,
+            skip_leading_rows=skip_leading_rows,
+            split_files=not allow_quoted_newlines,
+        )
+        compress = compress and source_format in line_formats
+        destination = f"{project}.{dataset}.{structure_id}"
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    propagate_context(
+                        lambda chunk: self._load_chunk(
+                            chunk, destination, job_config, compress
+                        )
+                    ),
+                    chunks,
+                )
+            )
+
+    def _get_load_job_config(
+        self, source_format: str, json_schema: list[dict] | dict | None
+    ) -> bigquery.LoadJobConfig:
+        """
+        Function returns the configuration of load jobs appending to a table.
+
+        Args:
+            source_format (str):
+                BigQuery source format of the files.
+            json_schema (Optional[Union[List[Dict], Dict]]):
+                Definition of the table as accepted by `create_or_update_structure`.
+
+        Returns:
+            bigquery.LoadJobConfig: An object of bigquery.LoadJobConfig.
+        """
+        job_config = bigquery.LoadJobConfig(
+            source_format=source_format,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
+        )
+        if json_schema is None:
+            return job_config
+
+        structure = self._get_structure(json_schema)
+        if structure.table_schema:
+            job_config.schema = get_bq_schema_from_json_schema(structure.table_schema)
+        if structure.partition:
+            time_partitioning, range_partitioning = self._get_partitioning_scheme(
+                structure.partition
+            )
+            if time_partitioning is not None:
+                job_config.time_partitioning = time_partitioning
+            elif range_partitioning is not None:
+                job_config.range_partitioning = range_partitioning
+        if structure.clustering:
+            job_config.clustering_fields = structure.clustering
+        return job_config
+
+    def _load_chunk(
+        self,
+        chunk: LoadChunk,
+        destination: str,
+        job_config: bigquery.LoadJobConfig,
+        compress: bool,
+    ) -> LoadJobReport:
+        """
+        Function uploads a chunk, waits for its load job and reports its throughput.
+
+        Args:
+            chunk (LoadChunk):
+                Input of the load job.
+            destination (str):
+                Fully qualified ID of the table.
+            job_config (bigquery.LoadJobConfig):
+                Configuration of the load job.
+            compress (bool):
+                Whether the input is gzip compressed before upload.
+
+        Returns:
+            LoadJobReport: An object of LoadJobReport.
+        """
+        started_at = time.monotonic()
+        with self._span("phase", "upload") as span:
+            with chunk.open(compress=compress) as file_obj:
+                uploaded_bytes = file_obj.seek(0, 2)
+                file_obj.seek(0)
+                load_job = self._call(
+                    "load_table_from_file", file_obj, destination, job_config=job_config
+                )
+            if span is not None:
+                span.bytes = uploaded_bytes
+        uploaded_at = time.monotonic()
+
+        try:
+            with self._span("phase", "job_wait"):
+                wait_for_job(load_job, rpc=self._rpc)
+        except Exception as e:
+            raise GbqException(str(e)) from e
+        finished_at = time.monotonic()
+
+        return LoadJobReport(
+            job_id=load_job.job_id,
+            paths=chunk.paths,
+            input_bytes=chunk.size,
+            uploaded_bytes=uploaded_bytes,
+            output_rows=load_job.output_rows or 0,
+            upload_seconds=uploaded_at - started_at,
+            job_seconds=finished_at - uploaded_at,
+        )
+
+    @instrumented
+    def export_table(
+        self,
+        project: str,
+        dataset: str,
+        structure_id: str,
+        destination: str,
+        file_format: str = "ndjson",
+        num_streams: int = 4,
+        single_file: bool = False,
+        page_size: int = 10_000,
+        min_rows_per_stream: int = 10_000,
+        selected_fields: list[str] | None = None,
+    ) -> ExportReport:
+        """
+        Function downloads a table to local NDJSON or Parquet files with parallel streams.
+
+        The table is split into contiguous row ranges read concurrently, every stream
+        holds a single page of rows in memory and writes it to its own file. The ranges
+        are planned from the number of rows of the table, which leaves out the
+        streaming buffer, so tables with a streaming buffer are refused.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the table.
+            structure_id (str):
+                ID of the table.
+            destination (str):
+                Directory receiving one file per stream, or path of the file when
+                single_file is set.
+            file_format (str):
+                Either "ndjson" or "parquet", Parquet requires pyarrow.
+            num_streams (int):
+                Maximum number of concurrent streams.
+            single_file (bool):
+                Whether the streams are merged into a single file in table order.
+            page_size (int):
+                Number of rows a stream holds in memory.
+            min_rows_per_stream (int):
+                Minimum number of rows read by a stream.
+            selected_fields (Optional[List[str]]):
+                Names of the top level fields to export, all fields by default.
+
+        Returns:
+            ExportReport: An object of ExportReport.
+        """
+        if file_format not in stream_writers:
+            raise GbqException(f"Unsupported export format {file_format}")
+
+        started_at = time.monotonic()
+        table = self.get_structure(project, dataset, structure_id)
+        if table.streaming_buffer is not None:
+            # Rows in the streaming buffer are not counted in num_rows
+            raise GbqException(
+                f"Cannot export {table.full_table_id}, it has rows in its streaming "
+                "buffer"
+            )
+        fields = None
+        if selected_fields:
+            names = {field.name for field in table.schema}
+            unknown = [name for name in selected_fields if name not in names]
+            if unknown:
+                raise GbqException(f"Unknown fields {unknown} in {structure_id}")
+            fields = [field for field in table.schema if field.name in selected_fields]
+
+        row_ranges = plan_row_ranges(
+            table.num_rows or 0, num_streams, min_rows_per_stream
+        )
+        directory = os.path.dirname(destination) if single_file else destination
+        os.makedirs(directory or ".", exist_ok=True)
+        paths = [
+            os.path.join(directory, f"{structure_id}-{index:05d}.{file_format}")
+            for index in range(len(row_ranges))
+        ]
+        if single_file:
+            paths = [f"{destination}.part{index:05d}" for index in range(len(paths))]
+
+        with ThreadPoolExecutor(max_workers=len(row_ranges)) as executor:
+            num_rows = sum(
+                executor.map(
+                    propagate_context(
+                        lambda row_range, path: self._export_stream(
+                            table, row_range, path, file_format, page_size, fields
+                        )
+                    ),
+                    row_ranges,
+                    paths,
+                )
+            )
+
+        if single_file:
+            merge_files(paths, destination, file_format)
+            paths = [destination]
+
+        return ExportReport(
+            paths=paths,
+            num_rows=num_rows,
+            num_bytes=sum(os.path.getsize(path) for path in paths),
+            seconds=time.monotonic() - started_at,
+        )
+
+    def _export_stream(
+        self,
+        table: Table,
+        row_range: tuple[int, int],
+        path: str,
+        file_format: str,
+        page_size: int,
+        fields: list | None,
+    ) -> int:
+        """
+        Function writes a range of rows of a table to a file in an "export_stream" span.
+
+        Returns:
+            int: Number of rows written.
+        """
+        with self._span("phase", "export_stream") as span:
+            num_rows = export_stream(
+                self.bq_client,
+                table,
+                row_range,
+                path,
+                file_format,
+                page_size,
+                fields,
+                rpc=self._rpc,
+            )
+            if span is not None:
+                span.bytes = os.path.getsize(path)
+        return num_rows
+
+    @instrumented
+    def export_query(self, query: str, destination: str, **kwargs) -> ExportReport:
+        """
+        Function runs a query and downloads its results, see `export_table`.
+
+        Args:
+            query (str):
+                BigQuery query string
+            destination (str):
+                Directory or file receiving the results.
+            kwargs:
+                Options of `export_table`.
+
+        Returns:
+            ExportReport: An object of ExportReport.
+        """
+        query_job = self.execute(query)
+        table = query_job.destination
+        return self.export_table(
+            table.project, table.dataset_id, table.table_id, destination, **kwargs
+        )
+
+    @instrumented
+    def execute(
+        self,
+        query: str,
+        *,
+        timeout: float | None = None,
+        cancel_event: threading.Event | None = None,
+        parameters: Parameters | None = None,
+        project: str | None = None,
+    ) -> QueryJob:
         """
         Function return a QueryJob object after executing a SQL statement
 
+        The job is polled adaptively, see `gbq.jobs.wait_for_job`, and cancelled when
+        the timeout expires, when cancel_event is set or when waiting is interrupted.
+
+        Parameter types are inferred once per query, see `gbq.parameters.QueryTemplate`.
+        Keeping literals out of the query text lets BigQuery reuse cached results.
+
         Args:
             query (str):
                 BigQuery query string
+            timeout (Optional[float]):
+                Number of seconds to wait for the job, job_timeout by default.
+            cancel_event (Optional[threading.Event]):
+                Event set by another thread to cancel the job.
+            parameters (Optional[Union[Mapping[str, Any], Sequence[Any]]]):
+                Values of named parameters referenced as @name, or a sequence of
+                values of positional parameters referenced as ?. Dicts are bound as
+                STRUCT and lists as ARRAY parameters.
+            project (Optional[str]):
+                Project running and billed for the job, the project of the client by
+                default.
 
         Returns:
             QueryJob
                 An object of QueryJob.
         """
+        if timeout is None:
+            timeout = self.job_timeout
+        query_job = None
         try:
-            query_job = self.bq_client.query(query)
+            if parameters is None:
+                query_job = self._call("query", query, project=project)
+            else:
+                template = self.query_templates.get(query, parameters)
+                query_job = self._call(
+                    "query",
+                    query,
+                    job_config=template.job_config(parameters),
+                    project=project,
+                )
 
             # Wait for query job to finish.
-            query_job.result()
+            with self._span("phase", "job_wait") as span:
+                wait_for_job(query_job, timeout, cancel_event, rpc=self._rpc)
+                if span is not None:
+                    span.bytes = query_job.total_bytes_processed
+                    span.bytes_billed = query_job.total_bytes_billed
 
             return query_job
+        except GbqException:
+            raise
+        except Exception as e:
+            raise GbqException(str(e)) from e
+        finally:
+            if self.query_stats_sink is not None and query_job is not None:
+                self.query_stats_sink.record(get_query_stats(query_job, query))
+
+    @instrumented
+    def run_script(
+        self,
+        statements: list[str],
+        transaction: bool = False,
+        timeout: float | None = None,
+        query_parameters: list[QueryParameter] | None = None,
+        project: str | None = None,
+    ) -> list[StatementResult]:
+        """
+        Function runs statements as one multi-statement script job and maps the
+        results and errors of its child jobs back to the statements.
+
+        A failed statement does not raise, see `gbq.scripting.map_script_results` for
+        the status of every statement, and `gbq.scripting.StatementBatcher` to pack
+        statements into scripts.
+
+        Args:
+            statements (List[str]):
+                Statements, without trailing semicolons.
+            transaction (bool):
+                Whether the statements run inside a transaction, rolled back if one
+                of them fails.
+            timeout (Optional[float]):
+                Number of seconds to wait for the script, job_timeout by default.
+            query_parameters (Optional[List[QueryParameter]]):
+                Named query parameters referenced by the statements.
+            project (Optional[str]):
+                Project running and billed for the script, the project of the client
+                by default.
+
+        Returns:
+            List[StatementResult]: The result of every statement, in order.
+        """
+        script, line_ranges = build_script(statements, transaction)
+        job_config = None
+        if query_parameters:
+            job_config = bigquery.QueryJobConfig(query_parameters=query_parameters)
+        try:
+            query_job = self._call(
+                "query", script, job_config=job_config, project=project
+            )
+        except GbqException:
+            raise
         except Exception as e:
             raise GbqException(str(e)) from e
+
+        script_error = None
+        try:
+            with self._span("phase", "job_wait"):
+                wait_for_job(
+                    query_job,
+                    self.job_timeout if timeout is None else timeout,
+                    rpc=self._rpc,
+                )
+        except (JobTimeoutException, JobCancelledException):
+            raise
+        except Exception as e:
+            script_error = e
+        finally:
+            if self.query_stats_sink is not None:
+                self.query_stats_sink.record(get_query_stats(query_job, script))
+
+        child_jobs = list(
+            self._call("list_jobs", parent_job=query_job, project=query_job.project)
+        )
+        if not child_jobs and len(statements) == 1 and not transaction:
+            # A single statement does not run as a script, its job is the statement
+            return [get_statement_result(statements[0], query_job)]
+        return map_script_results(
+            statements, line_ranges, child_jobs, script_error, transaction
+        )
+
+    def _get_procedure_arguments(
+        self, project: str, dataset: str, name: str
+    ) -> list[Argument]:
+        """
+        Function returns the arguments of a procedure, read from BigQuery once.
+        """
+        routine_id = f"{project}.{dataset}.{name}"
+        arguments = self._procedure_arguments.get(routine_id)
+        if arguments is None:
+            routine = self.get_routine(project, dataset, name)
+            arguments = get_procedure_arguments(routine)
+            self._procedure_arguments[routine_id] = arguments
+        return arguments
+
+    @instrumented
+    def call_procedure(
+        self,
+        project: str,
+        dataset: str,
+        routine_name: str,
+        args: Parameters | None = None,
+        arguments: list[Argument] | None = None,
+        timeout: float | None = None,
+    ) -> QueryJob:
+        """
+        Function calls a stored procedure with its arguments bound as query parameters.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the procedure.
+            routine_name (str):
+                ID of the procedure.
+            args (Optional[Union[Mapping[str, Any], Sequence[Any]]]):
+                Values by argument name, or in argument order.
+            arguments (Optional[List[Argument]]):
+                Arguments of the procedure, such as the arguments of its Structure.
+                Read from the routine and cached by default.
+            timeout (Optional[float]):
+                Number of seconds to wait for the job, job_timeout by default.
+
+        Returns:
+            QueryJob: An object of QueryJob.
+        """
+        self.bq_client.project = project
+        if arguments is None:
+            arguments = self._get_procedure_arguments(project, dataset, routine_name)
+        statement, parameters = build_call(
+            f"{project}.{dataset}.{routine_name}", arguments, args
+        )
+        return self.execute(
+            statement,
+            timeout=timeout,
+            parameters={parameter.name: parameter for parameter in parameters},
+        )
+
+    @instrumented
+    def call_procedures(
+        self,
+        project: str,
+        dataset: str,
+        routine_name: str,
+        calls: list[Parameters | None],
+        arguments: list[Argument] | None = None,
+        batch_size: int = 100,
+        max_workers: int = 1,
+        transaction: bool = False,
+        timeout: float | None = None,
+    ) -> list[StatementResult]:
+        """
+        Function calls a stored procedure many times, batching the CALL statements
+        into multi-statement script jobs instead of running a job per call.
+
+        A failed call does not raise, the following calls of its script are skipped,
+        see `run_script`.
+
+        Args:
+            project (str):
+                Project bound to the operation.
+            dataset (str):
+                ID of dataset containing the procedure.
+            routine_name (str):
+                ID of the procedure.
+            calls (List[Optional[Union[Mapping[str, Any], Sequence[Any]]]]):
+                Values of the arguments of every call.
+            arguments (Optional[List[Argument]]):
+                Arguments of the procedure, read from the routine by default.
+            batch_size (int):
+                Maximum number of calls of a script.
+            max_workers (int):
+                Maximum number of scripts running concurrently.
+            transaction (bool):
+                Whether the calls of a script run inside a transaction.
+            timeout (Optional[float]):
+                Number of seconds to wait for a script, job_timeout by default.
+
+        Returns:
+            List[StatementResult]: The result of every call, in order.
+        """
+        self.bq_client.project = project
+        if arguments is None:
+            arguments = self._get_procedure_arguments(project, dataset, routine_name)
+        routine_id = f"{project}.{dataset}.{routine_name}"
+
+        batches = []
+        for start in range(0, len(calls), batch_size):
+            statements = []
+            parameters = []
+            for index, args in enumerate(calls[start : start + batch_size]):
+                statement, call_parameters = build_call(
+                    routine_id, arguments, args, prefix=f"c{index}_"
+                )
+                statements.append(statement)
+                parameters.extend(call_parameters)
+            batches.append((statements, parameters))
+
+        def run_batch(batch):
+            statements, parameters = batch
+            return self.run_script(
+                statements,
+                transaction=transaction,
+                timeout=timeout,
+                query_parameters=parameters,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(propagate_context(run_batch), batches)
+            return [result for batch_results in results for result in batch_results]
+
+    async def execute_async(
+        self,
+        query: str,
+        *,
+        timeout: float | None = None,
+        parameters: Parameters | None = None,
+    ) -> QueryJob:
+        """
+        Function executes a SQL statement in a worker thread, see `execute`.
+
+        Cancelling the awaiting task cancels the job.
+
+        Args:
+            query (str):
+                BigQuery query string
+            timeout (Optional[float]):
+                Number of seconds to wait for the job, job_timeout by default.
+            parameters (Optional[Union[Mapping[str, Any], Sequence[Any]]]):
+                Values of the query parameters.
+
+        Returns:
+            QueryJob
+                An object of QueryJob.
+        """
+        cancel_event = threading.Event()
+        try:
+            return await asyncio.to_thread(
+                functools.partial(
+                    self.execute,
+                    query,
+                    timeout=timeout,
+                    cancel_event=cancel_event,
+                    parameters=parameters,
+                )
+            )
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
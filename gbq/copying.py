@@ -0,0 +1,88 @@
+import fnmatch
+
+from google.cloud.bigquery.table import Table, TableListItem
+
+copy_operations = ("COPY", "SNAPSHOT", "CLONE")
+
+
+def select_tables(
+    tables: list[TableListItem],
+    include: list[str] | None = None,
+    exclude: list[str] | None = None,
+) -> list[str]:
+    """
+    Function returns the names of the tables matching the include patterns and none
+    of the exclude patterns, such as "events_*". Views and snapshots are never
+    selected.
+
+    Args:
+        tables (List[TableListItem]):
+            Tables of the dataset.
+        include (Optional[List[str]]):
+            Shell-style patterns of the selected table names, all tables by default.
+        exclude (Optional[List[str]]):
+            Shell-style patterns of the excluded table names.
+
+    Returns:
+        List[str]: The names of the selected tables.
+    """
+    selected = []
+    for table in tables:
+        name = table.table_id
+        if table.table_type != "TABLE":
+            continue
+        if include and not any(fnmatch.fnmatchcase(name, p) for p in include):
+            continue
+        if exclude and any(fnmatch.fnmatchcase(name, p) for p in exclude):
+            continue
+        selected.append(name)
+    return selected
+
+
+def get_structure_definition(table: Table) -> dict:
+    """
+    Function returns the definition of a table in the format accepted by
+    `BigQuery.create_or_update_structure`.
+
+    Args:
+        table (Table):
+            An object of BigQuery Table.
+
+    Returns:
+        Dict: The schema, partitioning, clustering, labels and description.
+    """
+    definition: dict = {
+        "schema": [field.to_api_repr() for field in table.schema],
+        "clustering": table.clustering_fields,
+        "labels": table.labels or {},
+        "description": table.description,
+        "require_partition_filter": table.require_partition_filter,
+    }
+    if table.time_partitioning is not None:
+        time_partitioning = table.time_partitioning
+        definition["partition"] = {
+            "type": "time",
+            "definition": {
+                "type": time_partitioning.type_,
+                "field": time_partitioning.field,
+                "expirationMs": (
+                    str(time_partitioning.expiration_ms)
+                    if time_partitioning.expiration_ms
+                    else None
+                ),
+            },
+        }
+    elif table.range_partitioning is not None:
+        range_ = table.range_partitioning.range_
+        definition["partition"] = {
+            "type": "range",
+            "definition": {
+                "field": table.range_partitioning.field,
+                "range": {
+                    "start": range_.start,
+                    "end": range_.end,
+                    "interval": range_.interval,
+                },
+            },
+        }
+    return definition
@@ -0,0 +1,70 @@
+import threading
+import time
+
+from gbq.exceptions import GbqException
+
+
+class RateLimiter:
+    """
+    RateLimiter spaces operations so that at most `rate` of them start per second,
+    across threads.
+
+    Args:
+        rate (float):
+            Maximum number of operations per second.
+    """
+
+    def __init__(self, rate: float):
+        if rate <= 0:
+            raise GbqException(f"Invalid rate {rate}, it must be positive")
+        self.interval = 1.0 / rate
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Function waits until the next operation may start.
+
+        Returns:
+            float: Number of seconds waited.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        delay = start_at - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class ProjectRateLimits:
+    """
+    ProjectRateLimits holds a RateLimiter per project.
+
+    Args:
+        rates (Dict[str, float]):
+            Maximum number of operations per second by project, "*" limits the
+            projects without their own rate.
+    """
+
+    def __init__(self, rates: dict[str, float]):
+        self.rates = rates
+        self._limiters: dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, project: str) -> float:
+        """
+        Function waits until the next operation on a project may start.
+
+        Returns:
+            float: Number of seconds waited.
+        """
+        rate = self.rates.get(project, self.rates.get("*"))
+        if rate is None:
+            return 0.0
+        with self._lock:
+            limiter = self._limiters.get(project)
+            if limiter is None:
+                limiter = self._limiters[project] = RateLimiter(rate)
+        return limiter.acquire()
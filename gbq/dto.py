@@ -1,11 +1,14 @@
+import bisect
+import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_validator
 
 
 class StructureType(Enum):
     table = "table"
     view = "view"
+    materialized_view = "materialized_view"
     stored_procedure = "stored_procedure"
 
 
@@ -44,12 +47,12 @@ class TimeDefinition(BaseModel):
     expirationMs: str | None = None
     field: str | None = None
 
-    @model_validator(mode="before")
+    @field_validator("type", mode="before")
     @classmethod
-    def str_or_list_(cls, data):
-        if isinstance(data, dict) and isinstance(data.get("type"), str):
-            data["type"] = TimeType[data.get("type", "").upper()]
-        return data
+    def str_or_list_(cls, value):
+        if isinstance(value, str) and value.upper() in TimeType.__members__:
+            return TimeType[value.upper()]
+        return value
 
 
 class RangeFieldDefinition(BaseModel):
@@ -67,56 +70,337 @@ class Partition(BaseModel):
     type: PartitionType
     definition: TimeDefinition | RangeDefinition
 
-    @model_validator(mode="before")
+    @field_validator("type", mode="before")
     @classmethod
-    def convert_type(cls, data):
-        if isinstance(data, dict) and isinstance(data.get("type"), str):
-            data["type"] = PartitionType[data.get("type", "").lower()]
-        return data
+    def convert_type(cls, value):
+        if isinstance(value, str) and value.lower() in PartitionType.__members__:
+            return PartitionType[value.lower()]
+        return value
 
 
 class Argument(BaseModel):
     name: str
     data_type: BigQueryDataType
 
-    @model_validator(mode="before")
+    @field_validator("data_type", mode="before")
     @classmethod
-    def str_or_list_(cls, data):
-        if isinstance(data, dict) and isinstance(data.get("data_type"), str):
-            data["data_type"] = BigQueryDataType[data.get("data_type", "").upper()]
-        return data
+    def str_or_list_(cls, value):
+        if isinstance(value, str) and value.upper() in BigQueryDataType.__members__:
+            return BigQueryDataType[value.upper()]
+        return value
+
+
+class SearchIndex(BaseModel):
+    name: str
+    columns: list[str] | None = None
+    analyzer: str | None = None
+    data_types: list[str] | None = None
+
+
+class VectorIndex(BaseModel):
+    name: str
+    column: str
+    index_type: str = "IVF"
+    distance_type: str | None = None
+    options: dict | None = None
+    stored_columns: list[str] | None = None
 
 
 class Structure(BaseModel):
     table_schema: list[dict] = Field([], alias="schema")
     partition: Partition | None = None
+    require_partition_filter: bool | None = None
     clustering: list[str] | None = None
     labels: dict[str, str] = Field({})
     description: str | None = None
     view_query: str | None = None
+    mview_query: str | None = None
+    enable_refresh: bool | None = None
+    refresh_interval_ms: int | None = None
+    max_staleness: str | None = None
     body: str | None = None
     type: StructureType | None = None
     arguments: list[Argument] | None = None
+    search_indexes: list[SearchIndex] | None = None
+    vector_indexes: list[VectorIndex] | None = None
+    # BigQuery schema converted from table_schema, see `BigQuery._get_bq_schema`
+    _bq_schema: list | None = PrivateAttr(None)
 
     @model_validator(mode="before")
     @classmethod
     def validate_type(cls, data):
         if isinstance(data, dict) and not data.get("type", None):
-            if data.get("view_query"):
-                data["type"] = StructureType.view
+            if data.get("mview_query"):
+                type_ = StructureType.materialized_view
+            elif data.get("view_query"):
+                type_ = StructureType.view
             elif data.get("body"):
-                data["type"] = StructureType.stored_procedure
+                type_ = StructureType.stored_procedure
             else:
-                data["type"] = StructureType.table
+                type_ = StructureType.table
+            # A copy, the definitions of the caller are left untouched
+            data = {**data, "type": type_}
         return data
 
-    @model_validator(mode="before")
+    @field_validator("body", mode="before")
     @classmethod
-    def str_or_list_body(cls, data):
-        if (
-            isinstance(data, dict)
-            and isinstance(data.get("body"), list)
-            and not [s for s in data.get("body") if not isinstance(s, str)]
-        ):
-            data["body"] = "\n".join(data["body"])
-        return data
+    def str_or_list_body(cls, value):
+        if isinstance(value, list) and all(isinstance(s, str) for s in value):
+            return "\n".join(value)
+        return value
+
+
+class RowValidationSample(BaseModel):
+    index: int
+    row: dict
+    errors: list[str]
+
+
+class RowValidationReport(BaseModel):
+    total_rows: int
+    invalid_rows: int
+    error_counts: dict[str, int] = Field({})
+    samples: list[RowValidationSample] = Field([])
+
+    @property
+    def is_valid(self) -> bool:
+        return self.invalid_rows == 0
+
+
+class StreamingFailure(BaseModel):
+    table: str
+    row: dict
+    errors: list[dict]
+
+
+class StreamingStats(BaseModel):
+    requests: int = 0
+    rows_sent: int = 0
+    rows_failed: int = 0
+
+
+class LoadJobReport(BaseModel):
+    job_id: str
+    paths: list[str]
+    input_bytes: int
+    uploaded_bytes: int
+    output_rows: int
+    upload_seconds: float
+    job_seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        seconds = self.upload_seconds + self.job_seconds
+        return self.input_bytes / seconds if seconds else 0.0
+
+
+class ExportReport(BaseModel):
+    paths: list[str]
+    num_rows: int
+    num_bytes: int
+    seconds: float
+
+
+class SpanHistogram(BaseModel):
+    count: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float | None = None
+    max_seconds: float | None = None
+    total_bytes: int = 0
+    bucket_bounds: list[float]
+    bucket_counts: list[int]
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def add(self, seconds: float, error: bool = False, num_bytes: int | None = None):
+        self.count += 1
+        self.errors += error
+        self.total_seconds += seconds
+        if self.min_seconds is None or seconds < self.min_seconds:
+            self.min_seconds = seconds
+        if self.max_seconds is None or seconds > self.max_seconds:
+            self.max_seconds = seconds
+        self.total_bytes += num_bytes or 0
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds, seconds)] += 1
+
+    def quantile(self, q: float) -> float | None:
+        """
+        Upper bound of the bucket holding the q-th quantile, max_seconds for the last bucket.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(self.bucket_bounds):
+                    return self.bucket_bounds[index]
+                break
+        return self.max_seconds
+
+
+class RpcCount(BaseModel):
+    project: str
+    method: str
+    outcome: str
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class RpcReport(BaseModel):
+    name: str
+    calls: int
+    bytes_billed: int
+    seconds: float
+    counts: list[RpcCount] = Field([])
+
+    def summary(self) -> str:
+        """
+        Human readable report of the run, one line per project, method and outcome.
+        """
+        lines = [
+            f"RPC report for {self.name}: {self.calls} calls, "
+            f"{self.bytes_billed} bytes billed in {self.seconds:.3f}s"
+        ]
+        for count in self.counts:
+            lines.append(
+                f"  {count.project:<20} {count.method:<24} {count.outcome:<20} "
+                f"{count.calls:>6} {count.seconds:>9.3f}s"
+            )
+        return "\n".join(lines)
+
+
+class QueryStageTiming(BaseModel):
+    name: str | None = None
+    status: str | None = None
+    duration_ms: float | None = None
+    wait_ms_max: int | None = None
+    read_ms_max: int | None = None
+    compute_ms_max: int | None = None
+    write_ms_max: int | None = None
+    records_read: int | None = None
+    records_written: int | None = None
+    slot_ms: int | None = None
+
+
+class QueryStats(BaseModel):
+    job_id: str
+    fingerprint: str
+    query: str
+    statement_type: str | None = None
+    total_bytes_processed: int = 0
+    total_bytes_billed: int = 0
+    slot_millis: int = 0
+    cache_hit: bool = False
+    queue_seconds: float | None = None
+    run_seconds: float | None = None
+    error: str | None = None
+    stages: list[QueryStageTiming] = Field([])
+
+
+class QueryAggregate(BaseModel):
+    fingerprint: str
+    query: str
+    jobs: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    total_bytes_processed: int = 0
+    total_bytes_billed: int = 0
+    total_slot_millis: int = 0
+    total_run_seconds: float = 0.0
+    max_run_seconds: float = 0.0
+
+    @property
+    def mean_run_seconds(self) -> float:
+        return self.total_run_seconds / self.jobs if self.jobs else 0.0
+
+
+class StatementResult(BaseModel):
+    statement: str
+    status: str
+    job_id: str | None = None
+    statement_type: str | None = None
+    num_dml_affected_rows: int | None = None
+    total_bytes_processed: int | None = None
+    error: str | None = None
+
+
+class IndexStatus(BaseModel):
+    name: str
+    kind: str
+    status: str | None = None
+    coverage_percentage: float | None = None
+    ddl: str | None = None
+    # From INFORMATION_SCHEMA.SEARCH_INDEX_COLUMNS and SEARCH_INDEX_OPTIONS, or the
+    # VECTOR_INDEX equivalents
+    columns: list[str] = Field([])
+    options: dict = Field({})
+
+
+class PartitionInfo(BaseModel):
+    partition_id: str
+    total_rows: int | None = None
+    total_logical_bytes: int | None = None
+    total_billable_bytes: int | None = None
+    last_modified_time: datetime.datetime | None = None
+    storage_tier: str | None = None
+
+
+class RebuildReport(BaseModel):
+    table_id: str
+    reasons: list[str] = Field([])
+    rows: int | None = None
+    bytes_processed: int = 0
+    bytes_billed: int = 0
+    seconds: float = 0.0
+    # Search and vector indexes recreated on the rebuilt table
+    indexes: list[str] = Field([])
+    warnings: list[str] = Field([])
+
+
+class UpsertReport(BaseModel):
+    table_id: str
+    jobs: int = 0
+    partitions: int = 0
+    rows: int = 0
+    bytes_processed: int = 0
+    bytes_billed: int = 0
+    seconds: float = 0.0
+
+
+class CopyReport(BaseModel):
+    source_id: str
+    destination_id: str
+    operation: str
+    status: str
+    error: str | None = None
+    seconds: float = 0.0
+
+
+class DeployOutcome(BaseModel):
+    target: str
+    structure_id: str
+    status: str
+    error: str | None = None
+    seconds: float = 0.0
+
+
+class ColumnUsage(BaseModel):
+    column: str
+    jobs: int = 0
+    bytes: int = 0
+    point_jobs: int = 0
+    range_jobs: int = 0
+
+
+class TableRecommendation(BaseModel):
+    table_id: str
+    jobs: int = 0
+    total_bytes: int = 0
+    columns: list[ColumnUsage] = Field([])
+    structure: dict = Field({})
+    estimated_savings_bytes: int = 0
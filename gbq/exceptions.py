@@ -8,3 +8,21 @@ class InvalidDefinitionException(GbqException):
     """
     Invalid Definition Exception
     """
+
+
+class BudgetExceededException(GbqException):
+    """
+    Raised when a run goes over its budget of client calls or bytes billed
+    """
+
+
+class JobTimeoutException(GbqException):
+    """
+    Raised when a job did not finish in time, the job is cancelled
+    """
+
+
+class JobCancelledException(GbqException):
+    """
+    Raised when waiting for a job is cancelled, the job is cancelled
+    """
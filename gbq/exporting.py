@@ -0,0 +1,272 @@
+import os
+import shutil
+from collections.abc import Callable, Iterator
+from typing import Protocol
+
+from google.cloud import bigquery
+from google.cloud.bigquery import SchemaField
+
+from gbq.exceptions import GbqException
+from gbq.instrumentation import Rpc, call_rpc
+from gbq.row_encoder import RowEncoder
+
+arrow_types = {
+    "STRING": "string",
+    "BYTES": "binary",
+    "INTEGER": "int64",
+    "INT64": "int64",
+    "FLOAT": "float64",
+    "FLOAT64": "float64",
+    "BOOLEAN": "bool_",
+    "BOOL": "bool_",
+    "DATE": "date32",
+    "GEOGRAPHY": "string",
+    "JSON": "string",
+}
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:  # pragma: no cover
+        raise GbqException("Exporting to Parquet requires pyarrow") from e
+    return pyarrow
+
+
+class StreamWriter(Protocol):
+    def write(self, rows: list[dict]) -> None: ...
+
+    def close(self) -> int: ...
+
+
+def plan_row_ranges(
+    num_rows: int, num_streams: int, min_rows_per_stream: int = 1
+) -> list[tuple[int, int]]:
+    """
+    Function splits the rows of a table into contiguous ranges read independently.
+
+    Args:
+        num_rows (int):
+            Number of rows of the table.
+        num_streams (int):
+            Maximum number of ranges.
+        min_rows_per_stream (int):
+            Minimum number of rows of a range, avoids streams too small to pay off.
+
+    Returns:
+        List[Tuple[int, int]]: Start index and number of rows of every range.
+    """
+    num_streams = max(1, min(num_streams, num_rows // max(1, min_rows_per_stream)))
+    size, remainder = divmod(num_rows, num_streams)
+    ranges = []
+    start = 0
+    for index in range(num_streams):
+        count = size + (1 if index < remainder else 0)
+        ranges.append((start, count))
+        start += count
+    return ranges
+
+
+def read_row_range(
+    bq_client: bigquery.Client,
+    table: bigquery.Table,
+    start: int,
+    count: int,
+    page_size: int,
+    selected_fields: list[SchemaField] | None = None,
+    rpc: Rpc = call_rpc,
+) -> Iterator[list[dict]]:
+    """
+    Function yields the rows of a range of a table, one page at a time.
+
+    Args:
+        bq_client (bigquery.Client):
+            Client used to read the rows.
+        table (bigquery.Table):
+            Table to read.
+        start (int):
+            Index of the first row.
+        count (int):
+            Number of rows to read.
+        page_size (int):
+            Number of rows held in memory at once.
+        selected_fields (Optional[List[SchemaField]]):
+            Fields to read, all fields by default.
+        rpc (Rpc):
+            Sends the request of every page, see `BigQuery._rpc`.
+
+    Returns:
+        Iterator[List[Dict]]: Pages of rows keyed by field name.
+    """
+    if not count:
+        return
+
+    row_iterator = bq_client.list_rows(
+        table,
+        selected_fields=selected_fields,
+        start_index=start,
+        max_results=count,
+        page_size=min(page_size, count),
+    )
+    # Every page is a request, list_rows itself sends none, and none is sent once
+    # max_results rows are read
+    pages = iter(row_iterator.pages)
+    read = 0
+    while read < count and (page := rpc("list_rows", next, pages, None)) is not None:
+        rows = [dict(row.items()) for row in page]
+        read += len(rows)
+        yield rows
+
+
+class NdjsonStreamWriter:
+    """
+    NdjsonStreamWriter appends pages of rows to a newline delimited JSON file.
+
+    Args:
+        path (str):
+            Path of the file.
+        schema (List[SchemaField]):
+            Schema of the rows.
+    """
+
+    def __init__(self, path: str, schema: list[SchemaField]):
+        self._encoder = RowEncoder(schema)
+        self._buffer = bytearray()
+        self._file = open(path, "wb")  # noqa: SIM115
+        self._rows = 0
+
+    def write(self, rows: list[dict]) -> None:
+        self._buffer.clear()
+        self._rows += self._encoder.write_ndjson(rows, self._buffer)
+        self._file.write(self._buffer)
+
+    def close(self) -> int:
+        self._file.close()
+        return self._rows
+
+
+class ParquetStreamWriter:
+    """
+    ParquetStreamWriter appends pages of rows to a Parquet file, one row group per page.
+
+    Requires the optional `pyarrow` dependency.
+
+    Args:
+        path (str):
+            Path of the file.
+        schema (List[SchemaField]):
+            Schema of the rows.
+    """
+
+    def __init__(self, path: str, schema: list[SchemaField]):
+        self._pyarrow = _import_pyarrow()
+        self._schema = get_arrow_schema(schema)
+        self._writer = self._pyarrow.parquet.ParquetWriter(path, self._schema)
+        self._rows = 0
+
+    def write(self, rows: list[dict]) -> None:
+        self._writer.write_table(
+            self._pyarrow.Table.from_pylist(rows, schema=self._schema)
+        )
+        self._rows += len(rows)
+
+    def close(self) -> int:
+        self._writer.close()
+        return self._rows
+
+
+stream_writers: dict[str, Callable[[str, list[SchemaField]], StreamWriter]] = {
+    "ndjson": NdjsonStreamWriter,
+    "parquet": ParquetStreamWriter,
+}
+
+
+def get_arrow_schema(schema: list[SchemaField] | tuple):
+    """
+    Function converts a BigQuery schema to a pyarrow schema.
+    """
+    pyarrow = _import_pyarrow()
+    return pyarrow.schema([_get_arrow_field(pyarrow, field) for field in schema])
+
+
+def _get_arrow_field(pyarrow, field: SchemaField):
+    field_type = field.field_type.upper()
+    if field_type in ("RECORD", "STRUCT"):
+        arrow_type = pyarrow.struct(
+            [_get_arrow_field(pyarrow, f) for f in field.fields]
+        )
+    elif field_type == "NUMERIC":
+        arrow_type = pyarrow.decimal128(38, 9)
+    elif field_type == "BIGNUMERIC":
+        arrow_type = pyarrow.decimal256(76, 38)
+    elif field_type == "TIME":
+        arrow_type = pyarrow.time64("us")
+    elif field_type == "DATETIME":
+        arrow_type = pyarrow.timestamp("us")
+    elif field_type == "TIMESTAMP":
+        arrow_type = pyarrow.timestamp("us", tz="UTC")
+    elif field_type in arrow_types:
+        arrow_type = getattr(pyarrow, arrow_types[field_type])()
+    else:
+        raise GbqException(f"Cannot export {field_type} field {field.name} to Parquet")
+
+    if field.mode == "REPEATED":
+        return pyarrow.field(field.name, pyarrow.list_(arrow_type))
+    return pyarrow.field(field.name, arrow_type, nullable=field.mode != "REQUIRED")
+
+
+def export_stream(
+    bq_client: bigquery.Client,
+    table: bigquery.Table,
+    row_range: tuple[int, int],
+    path: str,
+    file_format: str,
+    page_size: int,
+    selected_fields: list[SchemaField] | None = None,
+    rpc: Rpc = call_rpc,
+) -> int:
+    """
+    Function writes a range of rows of a table to a file, holding one page in memory.
+
+    Returns:
+        int: Number of rows written.
+    """
+    schema = selected_fields or table.schema
+    writer = stream_writers[file_format](path, schema)
+    try:
+        start, count = row_range
+        for rows in read_row_range(
+            bq_client, table, start, count, page_size, selected_fields, rpc
+        ):
+            writer.write(rows)
+    finally:
+        num_rows = writer.close()
+    return num_rows
+
+
+def merge_files(paths: list[str], destination: str, file_format: str):
+    """
+    Function concatenates exported files in order and removes them.
+    """
+    if file_format == "parquet":
+        pyarrow = _import_pyarrow()
+        writer = None
+        for path in paths:
+            parquet_file = pyarrow.parquet.ParquetFile(path)
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(
+                    destination, parquet_file.schema_arrow
+                )
+            for index in range(parquet_file.num_row_groups):
+                writer.write_table(parquet_file.read_row_group(index))
+        if writer is not None:
+            writer.close()
+    else:
+        with open(destination, "wb") as target:
+            for path in paths:
+                with open(path, "rb") as source:
+                    shutil.copyfileobj(source, target)
+
+    for path in paths:
+        os.remove(path)
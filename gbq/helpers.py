@@ -19,6 +19,31 @@ field_type = {
 }
 
 
+def get_resource_project(value, dataset_id: bool = False) -> str | None:
+    """
+    Function returns the project of a BigQuery resource, such as a table, a job or a
+    fully qualified ID, or None when the value does not name one.
+
+    Args:
+        value:
+            A resource with a project attribute, or an ID.
+        dataset_id (bool):
+            Whether an ID of two parts is a dataset ID, as project.dataset, rather
+            than a table ID relative to the project of the client, as dataset.table.
+
+    Returns:
+        Optional[str]: The project of the resource.
+    """
+    if isinstance(value, str):
+        parts = value.split(".")
+        # Queries and other text are not IDs
+        if len(value.split()) != 1 or len(parts) < (2 if dataset_id else 3):
+            return None
+        return parts[0]
+    project = getattr(value, "project", None)
+    return project if isinstance(project, str) and project else None
+
+
 def get_bq_credentials(credential: str):
     """
     Function takes a stringified JSON Service Account and returns a Google Service Account object.
@@ -38,7 +63,7 @@ def get_bq_schema_from_json_schema(source: list[dict]) -> list[SchemaField]:
         fields = None
 
         # If it is a STRUCT / RECORD field we need to recursively process nested fields
-        if value.get("type") == "RECORD":
+        if str(value.get("type")).upper() in ("RECORD", "STRUCT"):
             fields = get_bq_schema_from_json_schema(value.get("fields", []))
 
         schema_field = SchemaField(
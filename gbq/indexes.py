@@ -0,0 +1,235 @@
+import json
+import re
+from functools import partial
+
+from gbq.dto import IndexStatus, SearchIndex, VectorIndex
+
+
+def get_indexes_query(project: str, dataset: str) -> str:
+    """
+    Function returns the query listing the search and vector indexes of a table,
+    with their columns and options, with the table name as the @table parameter.
+    """
+    schema = f"`{project}.{dataset}`.INFORMATION_SCHEMA"
+    # Identifiers cannot be query parameters, the table name is one
+    return "\nUNION ALL\n".join(
+        f"SELECT '{kind}' AS kind, i.index_name, i.index_status, "  # noqa: S608
+        "i.coverage_percentage, i.ddl, "
+        f"ARRAY(SELECT DISTINCT c.index_column_name FROM {schema}.{view}_COLUMNS c "
+        "WHERE c.table_name = i.table_name AND c.index_name = i.index_name "
+        "ORDER BY 1) AS columns, "
+        "ARRAY(SELECT AS STRUCT o.option_name, o.option_type, o.option_value "
+        f"FROM {schema}.{view}_OPTIONS o "
+        "WHERE o.table_name = i.table_name AND o.index_name = i.index_name) AS options "
+        f"FROM {schema}.{view}ES i WHERE i.table_name = @table"
+        for kind, view in (("search", "SEARCH_INDEX"), ("vector", "VECTOR_INDEX"))
+    )
+
+
+def get_index_options(rows: list[dict]) -> dict:
+    """
+    Function converts rows of INFORMATION_SCHEMA.SEARCH_INDEX_OPTIONS or
+    VECTOR_INDEX_OPTIONS to a dictionary of options, arrays are decoded.
+    """
+    return {
+        row["option_name"]: json.loads(row["option_value"])
+        if row["option_type"].upper().startswith("ARRAY")
+        else row["option_value"]
+        for row in rows
+    }
+
+
+def _literal(value) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_literal(item) for item in value)}]"
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def _options(options: dict) -> str:
+    options = {name: value for name, value in options.items() if value is not None}
+    if not options:
+        return ""
+    return (
+        " OPTIONS ("
+        + ", ".join(f"{name} = {_literal(value)}" for name, value in options.items())
+        + ")"
+    )
+
+
+def get_search_index_ddl(table_id: str, index: SearchIndex) -> str:
+    """
+    Function returns the statement creating a search index.
+
+    Args:
+        table_id (str):
+            ID of the table, as project.dataset.table.
+        index (SearchIndex):
+            Definition of the index, on all columns unless columns are given.
+
+    Returns:
+        str: A CREATE SEARCH INDEX statement.
+    """
+    columns = (
+        ", ".join(f"`{column}`" for column in index.columns)
+        if index.columns
+        else "ALL COLUMNS"
+    )
+    options = _options({"analyzer": index.analyzer, "data_types": index.data_types})
+    return f"CREATE SEARCH INDEX `{index.name}` ON `{table_id}`({columns}){options}"
+
+
+def get_vector_index_ddl(table_id: str, index: VectorIndex) -> str:
+    """
+    Function returns the statement creating a vector index.
+
+    Args:
+        table_id (str):
+            ID of the table, as project.dataset.table.
+        index (VectorIndex):
+            Definition of the index, options are sent as ivf_options or
+            tree_ah_options depending on the index type.
+
+    Returns:
+        str: A CREATE VECTOR INDEX statement.
+    """
+    storing = ""
+    if index.stored_columns:
+        storing = (
+            " STORING("
+            + ", ".join(f"`{column}`" for column in index.stored_columns)
+            + ")"
+        )
+    index_type = index.index_type.upper()
+    options = _options(
+        {
+            "index_type": index_type,
+            "distance_type": index.distance_type,
+            f"{index_type.lower()}_options": json.dumps(index.options)
+            if index.options
+            else None,
+        }
+    )
+    return (
+        f"CREATE VECTOR INDEX `{index.name}` ON `{table_id}`(`{index.column}`)"
+        f"{storing}{options}"
+    )
+
+
+def _get_ddl_columns(ddl: str | None, clause: str) -> list[str] | None:
+    # INFORMATION_SCHEMA lists the columns an ALL COLUMNS index covers and leaves
+    # out stored columns, both are read from the statement
+    match = re.search(rf"{clause}\s*\(([^)]*)\)", ddl or "", re.IGNORECASE)
+    if match is None:
+        return None
+    return [
+        " ".join(column.strip("` \n\t").split())
+        for column in match.group(1).split(",")
+        if column.strip()
+    ]
+
+
+def _search_index_matches(index: SearchIndex, status: IndexStatus) -> bool:
+    ddl_columns = _get_ddl_columns(status.ddl, r"\bON\s+\S+") or []
+    all_columns = [column.upper() for column in ddl_columns] == ["ALL COLUMNS"]
+    if all_columns != (not index.columns):
+        return False
+    if index.columns and set(index.columns) != set(status.columns):
+        return False
+    analyzer = status.options.get("analyzer") or "LOG_ANALYZER"
+    data_types = status.options.get("data_types") or ["STRING"]
+    return (index.analyzer or "LOG_ANALYZER").upper() == analyzer.upper() and {
+        data_type.upper() for data_type in index.data_types or ["STRING"]
+    } == {data_type.upper() for data_type in data_types}
+
+
+def _vector_index_matches(index: VectorIndex, status: IndexStatus) -> bool:
+    index_type = index.index_type.upper()
+    if (
+        status.columns != [index.column]
+        or index_type != str(status.options.get("index_type", "")).upper()
+    ):
+        return False
+    distance_type = status.options.get("distance_type") or "EUCLIDEAN"
+    if (index.distance_type or "EUCLIDEAN").upper() != distance_type.upper():
+        return False
+    # BigQuery fills in the options left out, only the defined ones are compared
+    options = json.loads(status.options.get(f"{index_type.lower()}_options") or "{}")
+    if any(options.get(name) != value for name, value in (index.options or {}).items()):
+        return False
+    stored_columns = _get_ddl_columns(status.ddl, "STORING") or []
+    return set(index.stored_columns or []) == set(stored_columns)
+
+
+def plan_index_changes(
+    table_id: str,
+    existing: list[IndexStatus],
+    search_indexes: list[SearchIndex] | None = None,
+    vector_indexes: list[VectorIndex] | None = None,
+) -> list[str]:
+    """
+    Function returns the statements turning the existing indexes of a table into
+    the defined ones.
+
+    Indexes whose columns or options changed are dropped and created again, indexes
+    that are no longer defined are dropped. Kinds of index defined as None are left
+    unmanaged.
+
+    Args:
+        table_id (str):
+            ID of the table, as project.dataset.table.
+        existing (List[IndexStatus]):
+            Indexes of the table.
+        search_indexes (Optional[List[SearchIndex]]):
+            Defined search indexes.
+        vector_indexes (Optional[List[VectorIndex]]):
+            Defined vector indexes.
+
+    Returns:
+        List[str]: DROP statements, followed by CREATE statements.
+    """
+    drops = []
+    creates = []
+    for kind, defined in (
+        (
+            "search",
+            None
+            if search_indexes is None
+            else {
+                index.name: (
+                    get_search_index_ddl(table_id, index),
+                    partial(_search_index_matches, index),
+                )
+                for index in search_indexes
+            },
+        ),
+        (
+            "vector",
+            None
+            if vector_indexes is None
+            else {
+                index.name: (
+                    get_vector_index_ddl(table_id, index),
+                    partial(_vector_index_matches, index),
+                )
+                for index in vector_indexes
+            },
+        ),
+    ):
+        if defined is None:
+            continue
+        current = {index.name: index for index in existing if index.kind == kind}
+        for name, (ddl, matches) in defined.items():
+            if name in current and not matches(current[name]):
+                drops.append(f"DROP {kind.upper()} INDEX `{name}` ON `{table_id}`")
+                creates.append(ddl)
+            elif name not in current:
+                creates.append(ddl)
+        for name in current:
+            if name not in defined:
+                drops.append(f"DROP {kind.upper()} INDEX `{name}` ON `{table_id}`")
+    return drops + creates
@@ -0,0 +1,374 @@
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from gbq.dto import SpanHistogram
+from gbq.exceptions import GbqException
+
+current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "gbq_current_span", default=None
+)
+
+default_bucket_bounds = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Sends a request to BigQuery as rpc(name, func, *args, **kwargs), see `BigQuery._rpc`
+Rpc = Callable[..., Any]
+
+
+def call_rpc(name: str, func: Callable, *args, **kwargs):
+    """
+    Function calls func without instrumentation, the default Rpc.
+    """
+    return func(*args, **kwargs)
+
+
+class Span:
+    """
+    Span represents the execution of an operation, one of its phases or a single RPC.
+
+    Spans started while another span is open become its children and inherit its
+    project, dataset and structure.
+
+    Args:
+        kind (str):
+            Either "operation" for public methods of BigQuery, "phase" for steps of an
+            operation such as parsing and schema conversion, or "rpc" for client calls.
+        name (str):
+            Name of the method, phase or client call.
+        project (Optional[str]):
+            Project bound to the operation.
+        dataset (Optional[str]):
+            ID of dataset bound to the operation.
+        structure (Optional[str]):
+            ID of the structure bound to the operation.
+        parent (Optional[Span]):
+            Span open when this span started.
+    """
+
+    __slots__ = (
+        "kind",
+        "name",
+        "project",
+        "dataset",
+        "structure",
+        "parent",
+        "started_at",
+        "duration",
+        "outcome",
+        "error",
+        "bytes",
+        "bytes_billed",
+        "context",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        project: str | None = None,
+        dataset: str | None = None,
+        structure: str | None = None,
+        parent: "Span | None" = None,
+    ):
+        if parent is not None:
+            project = project or parent.project
+            dataset = dataset or parent.dataset
+            structure = structure or parent.structure
+        self.kind = kind
+        self.name = name
+        self.project: str | None = project
+        self.dataset: str | None = dataset
+        self.structure: str | None = structure
+        self.parent = parent
+        self.started_at = 0.0
+        self.duration = 0.0
+        self.outcome = "ok"
+        self.error: BaseException | None = None
+        self.bytes: int | None = None
+        self.bytes_billed: int | None = None
+        # Per span state of instrumentations, such as the span of a tracing backend
+        self.context: dict[str, Any] = {}
+
+    @property
+    def path(self) -> str:
+        """
+        Names of the span and its parents, from the outermost span.
+        """
+        if self.parent is None:
+            return self.name
+        return f"{self.parent.path}/{self.name}"
+
+
+class _SpanScope:
+    __slots__ = ("instrumentation", "span", "token")
+
+    def __init__(self, instrumentation: "Instrumentation", span: Span):
+        self.instrumentation = instrumentation
+        self.span = span
+
+    def __enter__(self) -> Span:
+        self.token = current_span.set(self.span)
+        self.span.started_at = time.perf_counter()
+        try:
+            self.instrumentation.on_start(self.span)
+        except BaseException as e:
+            # The span is ended here since the with block does not run
+            self.__exit__(type(e), e, e.__traceback__)
+            raise
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        span = self.span
+        span.duration = time.perf_counter() - span.started_at
+        if exc is not None:
+            span.outcome = type(exc).__name__
+            span.error = exc
+        current_span.reset(self.token)
+        self.instrumentation.on_end(span)
+
+
+class Instrumentation:
+    """
+    Instrumentation receives a callback when a span starts and when it ends.
+
+    Subclasses override `on_start` and `on_end`, both are called from the thread
+    running the span and must be thread safe.
+    """
+
+    def span(
+        self,
+        kind: str,
+        name: str,
+        project: str | None = None,
+        dataset: str | None = None,
+        structure: str | None = None,
+    ) -> _SpanScope:
+        """
+        Function returns a context manager timing a span, nested in the current span.
+
+        Returns:
+            _SpanScope: Context manager returning the Span.
+        """
+        span = Span(kind, name, project, dataset, structure, current_span.get())
+        return _SpanScope(self, span)
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+
+class CompositeInstrumentation(Instrumentation):
+    """
+    CompositeInstrumentation forwards the callbacks to several instrumentations.
+
+    Args:
+        instrumentations (Instrumentation):
+            Instrumentations receiving the callbacks, in order.
+    """
+
+    def __init__(self, *instrumentations: Instrumentation):
+        self.instrumentations = list(instrumentations)
+
+    def on_start(self, span: Span) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.on_start(span)
+
+    def on_end(self, span: Span) -> None:
+        for instrumentation in reversed(self.instrumentations):
+            instrumentation.on_end(span)
+
+
+class LoggingInstrumentation(Instrumentation):
+    """
+    LoggingInstrumentation logs every span when it ends.
+
+    Args:
+        logger (Optional[logging.Logger]):
+            Logger receiving the records, the "gbq" logger by default.
+        level (int):
+            Level of the records.
+        kinds (Optional[Tuple[str, ...]]):
+            Kinds of spans logged, all kinds by default.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+        kinds: tuple[str, ...] | None = None,
+    ):
+        self.logger = logger or logging.getLogger("gbq")
+        self.level = level
+        self.kinds = kinds
+
+    def on_end(self, span: Span) -> None:
+        if self.kinds is not None and span.kind not in self.kinds:
+            return
+        if not self.logger.isEnabledFor(self.level):
+            return
+        self.logger.log(
+            self.level,
+            "%s %s project=%s dataset=%s structure=%s outcome=%s "
+            "duration_ms=%.3f bytes=%s",
+            span.kind,
+            span.path,
+            span.project,
+            span.dataset,
+            span.structure,
+            span.outcome,
+            span.duration * 1000,
+            span.bytes,
+        )
+
+
+class HistogramInstrumentation(Instrumentation):
+    """
+    HistogramInstrumentation aggregates span durations in memory, per kind and name.
+
+    Args:
+        bucket_bounds (Tuple[float, ...]):
+            Upper bounds in seconds of the histogram buckets, in increasing order.
+    """
+
+    def __init__(self, bucket_bounds: tuple[float, ...] = default_bucket_bounds):
+        self.bucket_bounds = list(bucket_bounds)
+        self._histograms: dict[str, SpanHistogram] = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        key = f"{span.kind}.{span.name}"
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = SpanHistogram(
+                    bucket_bounds=self.bucket_bounds,
+                    bucket_counts=[0] * (len(self.bucket_bounds) + 1),
+                )
+                self._histograms[key] = histogram
+            histogram.add(span.duration, span.outcome != "ok", span.bytes)
+
+    def histograms(self) -> dict[str, SpanHistogram]:
+        """
+        Function returns a copy of the histograms keyed by "<kind>.<name>".
+
+        Returns:
+            Dict[str, SpanHistogram]: Histograms, such as "rpc.get_table".
+        """
+        with self._lock:
+            return {
+                key: histogram.model_copy(deep=True)
+                for key, histogram in self._histograms.items()
+            }
+
+    def reset(self) -> None:
+        """
+        Function drops all recorded spans.
+        """
+        with self._lock:
+            self._histograms.clear()
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    OpenTelemetryInstrumentation records spans with OpenTelemetry tracing.
+
+    Spans are made current while open, so spans of the application and of the
+    BigQuery client library started meanwhile are nested in them.
+
+    Requires the optional `opentelemetry-api` dependency.
+
+    Args:
+        tracer (Optional[opentelemetry.trace.Tracer]):
+            Tracer creating the spans, the "gbq" tracer of the global provider by default.
+    """
+
+    def __init__(self, tracer: Any = None):
+        if tracer is None:  # pragma: no cover
+            try:
+                from opentelemetry import trace
+            except ImportError as e:
+                raise GbqException(
+                    "OpenTelemetryInstrumentation requires opentelemetry-api"
+                ) from e
+            tracer = trace.get_tracer("gbq")
+        self.tracer = tracer
+
+    def on_start(self, span: Span) -> None:
+        attributes = {"gbq.kind": span.kind}
+        for key in ("project", "dataset", "structure"):
+            value = getattr(span, key)
+            if value is not None:
+                attributes[f"gbq.{key}"] = value
+        scope = self.tracer.start_as_current_span(
+            f"gbq.{span.name}", attributes=attributes
+        )
+        span.context["otel"] = (scope, scope.__enter__())
+
+    def on_end(self, span: Span) -> None:
+        entry = span.context.pop("otel", None)
+        if entry is None:
+            # Another instrumentation failed the span before it started here
+            return
+        scope, otel_span = entry
+        otel_span.set_attribute("gbq.outcome", span.outcome)
+        if span.bytes is not None:
+            otel_span.set_attribute("gbq.bytes", span.bytes)
+        error = span.error
+        if error is None:
+            scope.__exit__(None, None, None)
+        else:
+            scope.__exit__(type(error), error, error.__traceback__)
+
+
+def instrumented(func: Callable) -> Callable:
+    """
+    Function decorates a method of BigQuery so that it runs in an "operation" span.
+
+    The project, dataset and structure of the span are read from the arguments of
+    the method. Calls are forwarded untouched when instrumentation is disabled.
+    """
+    signature = inspect.signature(func)
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return func(self, *args, **kwargs)
+
+        arguments = signature.bind_partial(self, *args, **kwargs).arguments
+        structure = (
+            arguments.get("structure_id")
+            or arguments.get("structure")
+            or arguments.get("routine_name")
+        )
+        with instrumentation.span(
+            "operation",
+            name,
+            project=arguments.get("project"),
+            dataset=arguments.get("dataset"),
+            structure=structure if isinstance(structure, str) else None,
+        ):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def propagate_context(func: Callable) -> Callable:
+    """
+    Function binds a callable to the context of the caller, so that spans started
+    by it in worker threads are nested in the current span.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return run
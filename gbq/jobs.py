@@ -0,0 +1,97 @@
+import contextlib
+import threading
+import time
+
+from google.cloud import bigquery
+
+from gbq.exceptions import (
+    BudgetExceededException,
+    JobCancelledException,
+    JobTimeoutException,
+)
+from gbq.instrumentation import Rpc, call_rpc
+
+initial_poll_interval = 0.05
+max_poll_interval = 5.0
+poll_multiplier = 1.5
+
+Job = bigquery.QueryJob | bigquery.LoadJob | bigquery.CopyJob | bigquery.ExtractJob
+
+
+def cancel_job(job: Job, rpc: Rpc = call_rpc) -> None:
+    """
+    Function requests the cancellation of a job, ignoring failures since the job
+    may have finished meanwhile.
+    """
+    with contextlib.suppress(Exception):
+        try:
+            rpc("job.cancel", job.cancel)
+        except BudgetExceededException:
+            # Refused by the budget, the job is cancelled all the same
+            job.cancel()
+
+
+def wait_for_job(
+    job: Job,
+    timeout: float | None = None,
+    cancel_event: threading.Event | None = None,
+    initial_interval: float = initial_poll_interval,
+    max_interval: float = max_poll_interval,
+    multiplier: float = poll_multiplier,
+    rpc: Rpc = call_rpc,
+):
+    """
+    Function waits for a job with adaptive polling and returns its result.
+
+    The job is polled after initial_interval, then the interval grows by multiplier
+    up to max_interval, so short jobs return quickly while long jobs are not polled
+    needlessly. The job is cancelled server-side when the timeout expires, when
+    cancel_event is set, or when waiting is interrupted, e.g. by KeyboardInterrupt.
+
+    Args:
+        job (Job):
+            Query, load, copy or extract job.
+        timeout (Optional[float]):
+            Maximum number of seconds to wait, unlimited by default.
+        cancel_event (Optional[threading.Event]):
+            Event set by another thread or task to abandon the job.
+        initial_interval (float):
+            Seconds before the first poll.
+        max_interval (float):
+            Maximum number of seconds between polls.
+        multiplier (float):
+            Growth of the interval between polls.
+        rpc (Rpc):
+            Sends the polling, result and cancellation requests, see
+            `BigQuery._rpc`.
+
+    Returns:
+        The result of the job, rows for a query job.
+    """
+    event = cancel_event or threading.Event()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = initial_interval
+
+    try:
+        while not rpc("job.done", job.done):
+            wait = interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    cancel_job(job, rpc)
+                    raise JobTimeoutException(
+                        f"Job {job.job_id} did not finish within {timeout}s and was cancelled"
+                    )
+                wait = min(wait, remaining)
+            if event.wait(wait):
+                cancel_job(job, rpc)
+                raise JobCancelledException(f"Job {job.job_id} was cancelled")
+            interval = min(interval * multiplier, max_interval)
+    except (JobTimeoutException, JobCancelledException):
+        raise
+    except BaseException:
+        # Abandoned, e.g. interrupted, the job would keep using slots otherwise
+        cancel_job(job, rpc)
+        raise
+
+    return rpc("job.result", job.result)
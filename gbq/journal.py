@@ -0,0 +1,139 @@
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+
+_schema = """
+CREATE TABLE IF NOT EXISTS journal (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    item TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_items ON journal (run_id, operation, item);
+"""
+
+
+class Journal:
+    """
+    Journal records the status of the items of bulk operations, such as the tables of
+    `BigQuery.copy_tables` or the structures of `BigQuery.deploy_structures`, in a
+    local SQLite database.
+
+    The journal is append-only, the status of an item is its latest entry. A run
+    given the same run_id skips the items done by previous runs and retries the
+    failed and pending ones.
+
+        with Journal("refresh.db", run_id="refresh-2024-01-01") as journal:
+            bq.copy_tables("prod.sales", "dev.sales", journal=journal)
+
+    Args:
+        path (str):
+            Path of the SQLite database, created when missing.
+        run_id (str):
+            ID of the run, shared by the runs resuming it.
+    """
+
+    pending = "pending"
+    done = "done"
+    failed = "failed"
+
+    def __init__(self, path: str, run_id: str):
+        self.path = path
+        self.run_id = run_id
+        self._lock = threading.Lock()
+        # Items are recorded from the worker threads of bulk operations
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_schema)
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """
+        Function closes the database.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def statuses(self, operation: str) -> dict[str, str]:
+        """
+        Function returns the status of the items of an operation in this run.
+
+        Args:
+            operation (str):
+                Name of the operation, such as "copy".
+
+        Returns:
+            Dict[str, str]: Status by item, "pending", "done" or "failed".
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT item, status FROM journal WHERE run_id = ? AND operation = ? "
+                "ORDER BY id",
+                (self.run_id, operation),
+            ).fetchall()
+        return dict(rows)
+
+    def start(self, operation: str, items: Iterable[str]) -> list[str]:
+        """
+        Function returns the items of an operation not done yet, recording the new
+        ones as pending.
+
+        Args:
+            operation (str):
+                Name of the operation, such as "copy".
+            items (Iterable[str]):
+                Items of the operation.
+
+        Returns:
+            List[str]: The items left, in order.
+        """
+        statuses = self.statuses(operation)
+        items = list(items)
+        now = time.time()
+        new_items = [
+            (self.run_id, operation, item, self.pending, None, now)
+            for item in items
+            if item not in statuses
+        ]
+        if new_items:
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT INTO journal "
+                    "(run_id, operation, item, status, error, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    new_items,
+                )
+        return [item for item in items if statuses.get(item) != self.done]
+
+    def record(
+        self, operation: str, item: str, status: str, error: str | None = None
+    ) -> None:
+        """
+        Function records the status of an item.
+
+        Args:
+            operation (str):
+                Name of the operation, such as "copy".
+            item (str):
+                The item.
+            status (str):
+                "pending", "done" or "failed".
+            error (Optional[str]):
+                Error of a failed item.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO journal "
+                "(run_id, operation, item, status, error, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.run_id, operation, item, status, error, time.time()),
+            )
@@ -0,0 +1,168 @@
+import gzip
+import os
+import tempfile
+from typing import IO
+
+from google.cloud.bigquery import SourceFormat
+
+from gbq.exceptions import GbqException
+
+source_formats = {
+    ".json": SourceFormat.NEWLINE_DELIMITED_JSON,
+    ".jsonl": SourceFormat.NEWLINE_DELIMITED_JSON,
+    ".ndjson": SourceFormat.NEWLINE_DELIMITED_JSON,
+    ".csv": SourceFormat.CSV,
+    ".parquet": SourceFormat.PARQUET,
+}
+
+# Formats where a file can be cut at any line boundary and files can be concatenated.
+line_formats = frozenset({SourceFormat.NEWLINE_DELIMITED_JSON, SourceFormat.CSV})
+
+# Load jobs read at most this many bytes into memory before spilling to disk.
+SPOOL_BYTES = 16 * 1024 * 1024
+
+_COPY_BYTES = 1024 * 1024
+
+
+class LoadChunk:
+    """
+    LoadChunk is the input of a single load job, byte ranges of one or more files.
+
+    Args:
+        pieces (List[Tuple[str, int, int]]):
+            Path, start offset and end offset of every range, in order.
+        header (bytes):
+            Header written once before the ranges, used for CSV files.
+    """
+
+    def __init__(self, pieces: list[tuple[str, int, int]], header: bytes = b""):
+        self.pieces = pieces
+        self.header = header
+
+    @property
+    def paths(self) -> list[str]:
+        return list(dict.fromkeys(path for path, _start, _end in self.pieces))
+
+    @property
+    def size(self) -> int:
+        return len(self.header) + sum(end - start for _path, start, end in self.pieces)
+
+    def write_to(self, target: IO[bytes]):
+        """
+        Function copies the header and every byte range to a file object.
+        """
+        target.write(self.header)
+        for path, start, end in self.pieces:
+            data = b""
+            with open(path, "rb") as source:
+                source.seek(start)
+                remaining = end - start
+                while remaining:
+                    data = source.read(min(_COPY_BYTES, remaining))
+                    if not data:
+                        break
+                    target.write(data)
+                    remaining -= len(data)
+
+            # Files without a trailing newline would merge with the next piece
+            if data and not data.endswith(b"\n"):
+                target.write(b"\n")
+
+    def open(self, compress: bool = False) -> IO[bytes]:
+        """
+        Function returns a rewound file object with the content of the chunk.
+
+        Content stays in memory up to SPOOL_BYTES and spills to a temporary file above.
+
+        Args:
+            compress (bool):
+                Whether the content is gzip compressed.
+
+        Returns:
+            IO[bytes]: A file object, closing it discards the content.
+        """
+        spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)  # noqa: SIM115
+        if compress:
+            with gzip.GzipFile(fileobj=spool, mode="wb", compresslevel=6) as target:
+                self.write_to(target)  # type: ignore[arg-type]
+        else:
+            self.write_to(spool)  # type: ignore[arg-type]
+        spool.seek(0)
+        return spool  # type: ignore[return-value]
+
+
+def get_source_format(paths: list[str]) -> str:
+    """
+    Function returns the BigQuery source format matching the extension of the files.
+    """
+    extensions = {os.path.splitext(path)[1].lower() for path in paths}
+    formats = {source_formats.get(extension) for extension in extensions}
+    if len(formats) != 1 or None in formats:
+        raise GbqException(
+            f"Cannot infer a single source format from {sorted(extensions)}"
+        )
+    return formats.pop()  # type: ignore[return-value]
+
+
+def plan_load_chunks(
+    paths: list[str],
+    source_format: str,
+    target_bytes: int,
+    skip_leading_rows: int = 0,
+    split_files: bool = True,
+) -> list[LoadChunk]:
+    """
+    Function groups small files and splits large files into chunks of about target_bytes.
+
+    Files are only split at line boundaries. Parquet files are neither split nor grouped.
+
+    Args:
+        paths (List[str]):
+            Local files to load.
+        source_format (str):
+            BigQuery source format of the files.
+        target_bytes (int):
+            Approximate size of the input of a single load job.
+        skip_leading_rows (int):
+            Number of header lines of CSV files, the header is written once per chunk.
+        split_files (bool):
+            Whether files larger than target_bytes are split, disabled for CSV files
+            with quoted newlines.
+
+    Returns:
+        List[LoadChunk]: The inputs of the load jobs.
+    """
+    if source_format not in line_formats:
+        return [LoadChunk([(path, 0, os.path.getsize(path))]) for path in paths]
+
+    chunks: list[LoadChunk] = []
+    pieces: list[tuple[str, int, int]] = []
+    pending_bytes = 0
+    header = b""
+
+    for path in paths:
+        size = os.path.getsize(path)
+        with open(path, "rb") as source:
+            file_header = b"".join(source.readline() for _ in range(skip_leading_rows))
+            header = header or file_header
+            start = len(file_header)
+
+            while start < size:
+                end = size
+                if split_files and size - start > target_bytes - pending_bytes:
+                    source.seek(max(start, start + target_bytes - pending_bytes - 1))
+                    source.readline()
+                    end = min(source.tell(), size)
+
+                pieces.append((path, start, end))
+                pending_bytes += end - start
+                start = end
+
+                if pending_bytes >= target_bytes:
+                    chunks.append(LoadChunk(pieces, header))
+                    pieces, pending_bytes = [], 0
+
+    if pieces:
+        chunks.append(LoadChunk(pieces, header))
+
+    return chunks
@@ -0,0 +1,130 @@
+from google.cloud.bigquery.table import Table
+
+_truncate_functions = {
+    "DATE": "DATE_TRUNC",
+    "DATETIME": "DATETIME_TRUNC",
+    "TIMESTAMP": "TIMESTAMP_TRUNC",
+}
+
+
+def get_partition_key(table: Table) -> tuple[str, str] | None:
+    """
+    Function returns the partitioning column of a table and the expression mapping
+    its values to partitions, None for unpartitioned and ingestion time partitioned
+    tables.
+
+    Args:
+        table (Table):
+            An object of BigQuery Table.
+
+    Returns:
+        Optional[Tuple[str, str]]: The column and the expression of its partition.
+    """
+    if table.range_partitioning is not None:
+        column = table.range_partitioning.field
+        range_ = table.range_partitioning.range_
+        return column, (
+            f"RANGE_BUCKET(`{column}`, "
+            f"GENERATE_ARRAY({range_.start}, {range_.end}, {range_.interval}))"
+        )
+
+    time_partitioning = table.time_partitioning
+    if time_partitioning is None or time_partitioning.field is None:
+        return None
+    column = time_partitioning.field
+    field_type = next(
+        field.field_type for field in table.schema if field.name == column
+    ).upper()
+    function = _truncate_functions.get(field_type, "TIMESTAMP_TRUNC")
+    return column, f"{function}(`{column}`, {time_partitioning.type_})"
+
+
+def get_staging_partitions_query(staging_id: str, column: str, key: str) -> str:
+    """
+    Function returns the query reading the bounds of the partitioning column in every
+    partition of the staging data.
+    """
+    return (
+        f"SELECT {key} AS partition_key, MIN(`{column}`) AS min_value, "  # noqa: S608
+        f"MAX(`{column}`) AS max_value, COUNT(*) AS row_count "
+        f"FROM `{staging_id}` GROUP BY partition_key ORDER BY partition_key"
+    )
+
+
+def _get_partition_filter(alias: str, column: str, bounded: bool, nulls: bool) -> str:
+    conditions = []
+    if bounded:
+        conditions.append(f"{alias}.`{column}` BETWEEN @min_value AND @max_value")
+    if nulls:
+        conditions.append(f"{alias}.`{column}` IS NULL")
+    if len(conditions) == 1:
+        return conditions[0]
+    return f"({' OR '.join(conditions)})"
+
+
+def build_merge(
+    target_id: str,
+    staging_id: str,
+    columns: list[str],
+    keys: list[str],
+    update_columns: list[str] | None = None,
+    partition_column: str | None = None,
+    bounded: bool = False,
+    nulls: bool = False,
+    filter_staging: bool = False,
+) -> str:
+    """
+    Function returns a MERGE statement upserting staging rows into a target table.
+
+    Target rows matching the keys of a staging row are updated, the other staging
+    rows are inserted. With a partition column, the target is pruned to the values
+    between the @min_value and @max_value parameters, and to NULL values if nulls.
+
+    Args:
+        target_id (str):
+            ID of the target table, as project.dataset.table.
+        staging_id (str):
+            ID of the staging table, as project.dataset.table.
+        columns (List[str]):
+            Columns written to the target.
+        keys (List[str]):
+            Columns identifying a row.
+        update_columns (Optional[List[str]]):
+            Columns updated in matched rows, all columns but the keys by default.
+        partition_column (Optional[str]):
+            Partitioning column of the target.
+        bounded (bool):
+            Whether partition values are bounded by @min_value and @max_value.
+        nulls (bool):
+            Whether partition values can be NULL.
+        filter_staging (bool):
+            Whether staging rows are filtered like the target, to merge a single
+            partition.
+
+    Returns:
+        str: A MERGE statement.
+    """
+    source = f"`{staging_id}`"
+    conditions = [f"T.`{key}` = S.`{key}`" for key in keys]
+    if partition_column is not None and (bounded or nulls):
+        conditions.append(_get_partition_filter("T", partition_column, bounded, nulls))
+        if filter_staging:
+            source = (
+                f"(SELECT * FROM {source} AS P WHERE "  # noqa: S608
+                f"{_get_partition_filter('P', partition_column, bounded, nulls)})"
+            )
+
+    if update_columns is None:
+        update_columns = [column for column in columns if column not in keys]
+    clauses = [
+        f"MERGE `{target_id}` AS T USING {source} AS S ON {' AND '.join(conditions)}"
+    ]
+    if update_columns:
+        assignments = ", ".join(
+            f"`{column}` = S.`{column}`" for column in update_columns
+        )
+        clauses.append(f"WHEN MATCHED THEN UPDATE SET {assignments}")
+    names = ", ".join(f"`{column}`" for column in columns)
+    values = ", ".join(f"S.`{column}`" for column in columns)
+    clauses.append(f"WHEN NOT MATCHED THEN INSERT ({names}) VALUES ({values})")  # noqa: S608
+    return "\n".join(clauses)
@@ -0,0 +1,309 @@
+import datetime
+import decimal
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+
+from google.cloud import bigquery
+
+from gbq.exceptions import GbqException
+
+QueryParameter = (
+    bigquery.ScalarQueryParameter
+    | bigquery.ArrayQueryParameter
+    | bigquery.StructQueryParameter
+)
+Parameters = Mapping[str, object] | Sequence[object]
+
+_placeholder_pattern = re.compile(
+    r"`[^`]*`"
+    r"|--[^\n]*|#[^\n]*|/\*.*?\*/"
+    r"""|'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*\""""
+    r"|@@\w+|@(?P<name>\w+)|(?P<positional>\?)",
+    re.DOTALL,
+)
+
+
+def get_scalar_type(value) -> str | None:
+    """
+    Function returns the BigQuery type of a Python value, None if it is not a scalar.
+
+    Args:
+        value (Any):
+            Python value.
+
+    Returns:
+        Optional[str]: The BigQuery standard SQL type, such as "INT64".
+    """
+    # bool is a subclass of int and datetime of date, they are checked first
+    if isinstance(value, bool):
+        return "BOOL"
+    if isinstance(value, int):
+        return "INT64"
+    if isinstance(value, float):
+        return "FLOAT64"
+    if isinstance(value, decimal.Decimal):
+        return "NUMERIC"
+    if isinstance(value, str):
+        return "STRING"
+    if isinstance(value, bytes):
+        return "BYTES"
+    if isinstance(value, datetime.datetime):
+        return "TIMESTAMP" if value.tzinfo is not None else "DATETIME"
+    if isinstance(value, datetime.date):
+        return "DATE"
+    if isinstance(value, datetime.time):
+        return "TIME"
+    return None
+
+
+class _ScalarBinder:
+    def __init__(self, type_: str):
+        self.type_ = type_
+
+    def matches(self, value) -> bool:
+        return value is None or get_scalar_type(value) == self.type_
+
+    def bind(self, name: str | None, value) -> QueryParameter:
+        return bigquery.ScalarQueryParameter(name, self.type_, value)
+
+    def query_type(self, name: str | None = None):
+        return bigquery.ScalarQueryParameterType(self.type_, name=name)
+
+
+class _StructBinder:
+    def __init__(
+        self, fields: dict[str, "_ScalarBinder | _StructBinder | _ArrayBinder"]
+    ):
+        self.fields = fields
+
+    def matches(self, value) -> bool:
+        return (
+            isinstance(value, Mapping)
+            and value.keys() == self.fields.keys()
+            and all(self.fields[key].matches(value[key]) for key in self.fields)
+        )
+
+    def bind(self, name: str | None, value) -> QueryParameter:
+        return bigquery.StructQueryParameter(
+            name,
+            *[binder.bind(key, value[key]) for key, binder in self.fields.items()],
+        )
+
+    def query_type(self, name: str | None = None):
+        return bigquery.StructQueryParameterType(
+            *[binder.query_type(key) for key, binder in self.fields.items()],
+            name=name,
+        )
+
+
+class _ArrayBinder:
+    def __init__(self, element: _ScalarBinder | _StructBinder):
+        self.element = element
+        self.array_type = (
+            element.type_
+            if isinstance(element, _ScalarBinder)
+            else element.query_type()
+        )
+
+    def matches(self, value) -> bool:
+        return isinstance(value, (list, tuple)) and all(
+            item is not None and self.element.matches(item) for item in value
+        )
+
+    def bind(self, name: str | None, value) -> QueryParameter:
+        if isinstance(self.element, _StructBinder):
+            value = [self.element.bind(None, item) for item in value]
+        return bigquery.ArrayQueryParameter(name, self.array_type, list(value))
+
+    def query_type(self, name: str | None = None):
+        return bigquery.ArrayQueryParameterType(self.element.query_type(), name=name)
+
+
+Binder = _ScalarBinder | _StructBinder | _ArrayBinder
+
+
+def get_binder(name: str, value, in_array: bool = False) -> Binder:
+    """
+    Function infers the BigQuery type of a parameter from its value.
+
+    Args:
+        name (str):
+            Name or position of the parameter, used in errors.
+        value (Any):
+            Value of the parameter, scalars, dicts for STRUCT and lists for ARRAY.
+        in_array (bool):
+            Whether the value is an element of an array.
+
+    Returns:
+        Binder: An object building query parameters of the inferred type.
+    """
+    scalar_type = get_scalar_type(value)
+    if scalar_type is not None:
+        return _ScalarBinder(scalar_type)
+    if isinstance(value, Mapping):
+        if not value:
+            raise GbqException(
+                f"Cannot infer the type of empty STRUCT parameter {name}"
+            )
+        return _StructBinder(
+            {key: get_binder(f"{name}.{key}", item) for key, item in value.items()}
+        )
+    if isinstance(value, (list, tuple)):
+        if in_array:
+            raise GbqException(f"ARRAY parameter {name} cannot contain arrays")
+        items = [item for item in value if item is not None]
+        if not items:
+            raise GbqException(
+                f"Cannot infer the element type of empty ARRAY parameter {name}"
+            )
+        element = get_binder(name, items[0], in_array=True)
+        return _ArrayBinder(element)  # type: ignore[arg-type]
+    if value is None:
+        raise GbqException(
+            f"Cannot infer the type of parameter {name} from None, pass a "
+            "bigquery.ScalarQueryParameter instead"
+        )
+    raise GbqException(f"Unsupported type {type(value).__name__} of parameter {name}")
+
+
+class QueryTemplate:
+    """
+    QueryTemplate holds a parameterized query and the types of its parameters.
+
+    Types are inferred from the parameters of the first call and reused by the
+    following calls. A value that does not match the inferred type, such as a float
+    bound to an INT64 parameter, is inferred again for that call only.
+
+    Args:
+        query (str):
+            Query referencing named parameters as @name, or positional parameters as ?.
+        parameters (Union[Mapping[str, Any], Sequence[Any]]):
+            Values of the parameters, a mapping for named parameters and a sequence
+            for positional parameters. bigquery query parameter objects are used as is.
+    """
+
+    def __init__(self, query: str, parameters: Parameters):
+        self.query = query
+        self.named = isinstance(parameters, Mapping)
+        names = []
+        positional = 0
+        for match in _placeholder_pattern.finditer(query):
+            if match.group("name"):
+                names.append(match.group("name"))
+            elif match.group("positional"):
+                positional += 1
+
+        self.binders: dict[str | int, Binder | None] = {}
+        items: list[tuple[str | int, object]]
+        if isinstance(parameters, Mapping):
+            missing = sorted(set(names) - set(parameters))
+            if missing:
+                raise GbqException(f"Missing query parameters {', '.join(missing)}")
+            items = list(parameters.items())
+        else:
+            if positional != len(parameters):
+                raise GbqException(
+                    f"Query has {positional} positional parameters, "
+                    f"{len(parameters)} given"
+                )
+            items = list(enumerate(parameters))
+
+        for key, value in items:
+            # Parameters given as query parameter objects are not inferred
+            self.binders[key] = (
+                None
+                if isinstance(value, QueryParameter)
+                else get_binder(str(key), value)
+            )
+
+    def bind(self, parameters: Parameters) -> list[QueryParameter]:
+        """
+        Function returns the query parameters of a call.
+
+        Args:
+            parameters (Union[Mapping[str, Any], Sequence[Any]]):
+                Values of the parameters, with the same names or length as the
+                parameters the template was created with.
+
+        Returns:
+            List[QueryParameter]: Query parameters of the job configuration.
+        """
+        items = parameters.items() if self.named else enumerate(parameters)  # type: ignore[union-attr]
+        query_parameters = []
+        for key, value in items:
+            name = str(key) if self.named else None
+            if isinstance(value, QueryParameter):
+                query_parameters.append(value)
+                continue
+            binder = self.binders.get(key)
+            if binder is None or not binder.matches(value):
+                binder = get_binder(str(key), value)
+            query_parameters.append(binder.bind(name, value))
+        return query_parameters
+
+    def job_config(self, parameters: Parameters, **options) -> bigquery.QueryJobConfig:
+        """
+        Function returns the configuration of a query job running the template.
+
+        Args:
+            parameters (Union[Mapping[str, Any], Sequence[Any]]):
+                Values of the parameters.
+            options:
+                Other properties of QueryJobConfig.
+
+        Returns:
+            bigquery.QueryJobConfig: An object of bigquery.QueryJobConfig.
+        """
+        return bigquery.QueryJobConfig(
+            query_parameters=self.bind(parameters), **options
+        )
+
+
+class QueryTemplateCache:
+    """
+    QueryTemplateCache keeps the most recently used query templates.
+
+    Templates are keyed by query and parameter names, or number of positional
+    parameters.
+
+    Args:
+        maxsize (int):
+            Maximum number of templates.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[tuple, QueryTemplate] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, query: str, parameters: Parameters) -> QueryTemplate:
+        """
+        Function returns the template of a query, created from the parameters if the
+        query was not seen with the same parameter names before.
+
+        Returns:
+            QueryTemplate: An object of QueryTemplate.
+        """
+        if isinstance(parameters, Mapping):
+            key: tuple = (query, tuple(parameters))
+        else:
+            key = (query, len(parameters))
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self.hits += 1
+                self._templates.move_to_end(key)
+                return template
+            self.misses += 1
+
+        template = QueryTemplate(query, parameters)
+        with self._lock:
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        return template
@@ -0,0 +1,96 @@
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from gbq.dto import Structure
+from gbq.exceptions import GbqException, InvalidDefinitionException
+
+# Built once, the validators of Structure are reused by every batch
+structures_adapter: TypeAdapter[list[Structure]] = TypeAdapter(list[Structure])
+
+
+def _get_definition(json_schema):
+    # A list is the table schema, see `BigQuery._get_structure`
+    if isinstance(json_schema, list):
+        return {"schema": json_schema}
+    return json_schema
+
+
+def _format_error(error: ErrorDetails) -> str:
+    location = ".".join(str(part) for part in error["loc"][1:])
+    return f"{location}: {error['msg']}" if location else error["msg"]
+
+
+def _parse_chunk(
+    definitions: Sequence,
+) -> tuple[list[Structure], list[tuple[int, str]]]:
+    """
+    Function parses a chunk of definitions, returning the structures or the errors
+    by index in the chunk.
+    """
+    try:
+        structures = structures_adapter.validate_python(
+            [_get_definition(json_schema) for json_schema in definitions]
+        )
+    except ValidationError as e:
+        return [], [
+            (int(error["loc"][0]), _format_error(error)) for error in e.errors()
+        ]
+    return structures, []
+
+
+def parse_structures(
+    definitions: Sequence[dict | list[dict]],
+    ids: Sequence[str] | None = None,
+    processes: int | None = None,
+    chunk_size: int = 1_000,
+) -> list[Structure]:
+    """
+    Function parses many definitions at once, see
+    `BigQuery.create_or_update_structure`. The definitions are not modified.
+
+    Args:
+        definitions (List[Union[List[Dict], Dict]]):
+            Raw definitions, a list is the table schema.
+        ids (Optional[List[str]]):
+            IDs of the definitions, used in the message, their index by default.
+        processes (Optional[int]):
+            Number of processes parsing chunks of definitions, in this process by
+            default. Definitions and structures are pickled between processes,
+            which often costs more than parsing, so measure before using them.
+        chunk_size (int):
+            Number of definitions parsed by a process at once.
+
+    Returns:
+        List[Structure]: The structures, in order.
+
+    Raises:
+        InvalidDefinitionException: Listing the errors of every definition.
+    """
+    if ids is not None and len(ids) != len(definitions):
+        raise GbqException(f"Got {len(ids)} IDs for {len(definitions)} definitions")
+    if chunk_size < 1:
+        raise GbqException(f"Invalid chunk size {chunk_size}, it must be positive")
+
+    if not processes or len(definitions) <= chunk_size:
+        chunk_size = max(len(definitions), 1)
+    offsets = range(0, max(len(definitions), 1), chunk_size)
+    chunks = [definitions[offset : offset + chunk_size] for offset in offsets]
+    if len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_parse_chunk, chunks))
+    else:
+        results = [_parse_chunk(chunks[0])]
+
+    structures: list[Structure] = []
+    errors: list[str] = []
+    for offset, (chunk_structures, chunk_errors) in zip(offsets, results, strict=True):
+        structures.extend(chunk_structures)
+        for index, error in chunk_errors:
+            label = ids[offset + index] if ids is not None else offset + index
+            errors.append(f"- {label}: {error}")
+    if errors:
+        raise InvalidDefinitionException("Invalid definitions:\n" + "\n".join(errors))
+    return structures
@@ -0,0 +1,58 @@
+from gbq.dto import PartitionInfo
+
+# Partitions of rows with NULL or out of range partitioning values, and of rows
+# still in the streaming buffer
+special_partitions = {"__NULL__", "__UNPARTITIONED__", "__STREAMING_UNPARTITIONED__"}
+
+
+def get_partitions_query(project: str, dataset: str) -> str:
+    """
+    Function returns the query listing the partitions of a table, with the table name
+    as the @table parameter.
+    """
+    schema = f"`{project}.{dataset}`.INFORMATION_SCHEMA"
+    columns = (
+        "partition_id, total_rows, total_logical_bytes, total_billable_bytes, "
+        "last_modified_time, storage_tier"
+    )
+    # Identifiers cannot be query parameters, the table name is one
+    return f"SELECT {columns} FROM {schema}.PARTITIONS WHERE table_name = @table ORDER BY partition_id"  # noqa: S608
+
+
+def select_partitions(
+    partitions: list[PartitionInfo], start: str | None = None, end: str | None = None
+) -> list[str]:
+    """
+    Function returns the IDs of the partitions between start and end, inclusive.
+
+    Time partition IDs, such as 20240101 or 2024010112, are compared as strings and
+    range partition IDs as integers. NULL and unpartitioned partitions are never
+    selected by a range.
+
+    Args:
+        partitions (List[PartitionInfo]):
+            Partitions of the table.
+        start (Optional[str]):
+            First partition ID, unbounded by default.
+        end (Optional[str]):
+            Last partition ID, unbounded by default.
+
+    Returns:
+        List[str]: The selected partition IDs, in order.
+    """
+
+    def key(partition_id: str):
+        numeric = partition_id.lstrip("-").isdigit()
+        return (0, int(partition_id), "") if numeric else (1, 0, partition_id)
+
+    selected = []
+    for partition in partitions:
+        partition_id = partition.partition_id
+        if partition_id in special_partitions:
+            continue
+        if start is not None and key(partition_id) < key(start):
+            continue
+        if end is not None and key(partition_id) > key(end):
+            continue
+        selected.append(partition_id)
+    return sorted(selected, key=key)
@@ -0,0 +1,127 @@
+import copy
+from collections.abc import Mapping
+
+from google.cloud import bigquery
+from google.cloud.bigquery.routine import Routine
+
+from gbq.dto import Argument, BigQueryDataType
+from gbq.exceptions import GbqException
+from gbq.parameters import Parameters, QueryParameter, get_binder
+
+# Types whose element or field types are not part of an Argument, they are inferred
+_inferred_types = {
+    BigQueryDataType.ARRAY,
+    BigQueryDataType.STRUCT,
+    BigQueryDataType.TYPE_KIND_UNSPECIFIED,
+}
+
+
+def get_procedure_arguments(routine: Routine) -> list[Argument]:
+    """
+    Function returns the arguments of a BigQuery routine as Argument objects.
+
+    Args:
+        routine (Routine):
+            An object of BigQuery Routine.
+
+    Returns:
+        List[Argument]: The arguments of the routine, in order. Types missing from
+            BigQueryDataType, such as JSON, INTERVAL or RANGE, are inferred from the
+            values.
+    """
+    arguments = []
+    for argument in routine.arguments:
+        type_kind = argument.data_type.type_kind if argument.data_type else None
+        arguments.append(
+            Argument(
+                name=argument.name,
+                data_type=BigQueryDataType.__members__.get(
+                    type_kind.name, BigQueryDataType.TYPE_KIND_UNSPECIFIED
+                )
+                if type_kind is not None
+                else BigQueryDataType.TYPE_KIND_UNSPECIFIED,
+            )
+        )
+    return arguments
+
+
+def bind_arguments(
+    arguments: list[Argument], args: Parameters | None, prefix: str = ""
+) -> list[QueryParameter]:
+    """
+    Function binds the values of a call to the arguments of a procedure.
+
+    Scalar arguments are bound with their declared type, so None is passed as a
+    typed NULL. The element and field types of ARRAY and STRUCT arguments are
+    inferred from their values.
+
+    Args:
+        arguments (List[Argument]):
+            Arguments of the procedure.
+        args (Optional[Union[Mapping[str, Any], Sequence[Any]]]):
+            Values by argument name, or in argument order.
+        prefix (str):
+            Prefix of the query parameter names, to call a procedure more than once
+            in a script.
+
+    Returns:
+        List[QueryParameter]: A query parameter per argument, in order.
+    """
+    args = {} if args is None else args
+    values: list
+    if isinstance(args, Mapping):
+        unknown = sorted(set(args) - {argument.name for argument in arguments})
+        if unknown:
+            raise GbqException(f"Unknown procedure arguments {', '.join(unknown)}")
+        missing = [argument.name for argument in arguments if argument.name not in args]
+        if missing:
+            raise GbqException(f"Missing procedure arguments {', '.join(missing)}")
+        values = [args[argument.name] for argument in arguments]
+    else:
+        if len(args) != len(arguments):
+            raise GbqException(
+                f"Procedure has {len(arguments)} arguments, {len(args)} given"
+            )
+        values = list(args)
+
+    parameters = []
+    for argument, value in zip(arguments, values, strict=True):
+        name = f"{prefix}{argument.name}"
+        if isinstance(value, QueryParameter):
+            parameter = copy.copy(value)
+            parameter.name = name
+            parameters.append(parameter)
+        elif argument.data_type in _inferred_types:
+            parameters.append(get_binder(argument.name, value).bind(name, value))
+        else:
+            parameters.append(
+                bigquery.ScalarQueryParameter(name, argument.data_type.value, value)
+            )
+    return parameters
+
+
+def build_call(
+    routine_id: str,
+    arguments: list[Argument],
+    args: Parameters | None,
+    prefix: str = "",
+) -> tuple[str, list[QueryParameter]]:
+    """
+    Function returns a CALL statement of a procedure and its query parameters.
+
+    Args:
+        routine_id (str):
+            ID of the procedure, as project.dataset.name.
+        arguments (List[Argument]):
+            Arguments of the procedure.
+        args (Optional[Union[Mapping[str, Any], Sequence[Any]]]):
+            Values by argument name, or in argument order.
+        prefix (str):
+            Prefix of the query parameter names.
+
+    Returns:
+        Tuple[str, List[QueryParameter]]: The statement and its query parameters.
+    """
+    parameters = bind_arguments(arguments, args, prefix)
+    placeholders = ", ".join(f"@{parameter.name}" for parameter in parameters)
+    return f"CALL `{routine_id}`({placeholders})", parameters
@@ -0,0 +1,265 @@
+import base64
+import datetime
+import decimal
+import json
+import math
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from google.cloud.bigquery import SchemaField
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+Converter = Callable[[Any], Any]
+
+
+def _json_dumps(value) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def dumps_json(value) -> bytes:
+    """
+    Function serializes a JSON compatible value, using `orjson` when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return _json_dumps(value)  # pragma: no cover
+
+
+def _timestamp_to_json(value):
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def _datetime_to_json(value):
+    if isinstance(value, datetime.datetime):
+        # DATETIME has no time zone, BigQuery rejects values carrying an offset, so
+        # aware values are stored as their UTC time
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc)
+        return value.replace(tzinfo=None).isoformat()
+    return value
+
+
+def _date_to_json(value):
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _time_to_json(value):
+    if isinstance(value, datetime.time):
+        return value.isoformat()
+    return value
+
+
+def _decimal_to_json(value):
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    return value
+
+
+def _float_to_json(value):
+    # JSON has no NaN nor infinities, orjson writes them as null and json as invalid
+    # bare literals, BigQuery accepts them as strings
+    if isinstance(value, float) and not math.isfinite(value):
+        if math.isnan(value):
+            return "NaN"
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+
+def _json_to_json(value):
+    # JSON columns take their value serialized, strings are already serialized
+    if isinstance(value, dict | list):
+        return dumps_json(value).decode()
+    return value
+
+
+def _bytes_to_json(value):
+    if isinstance(value, bytes):
+        return base64.standard_b64encode(value).decode("ascii")
+    return value
+
+
+converters: dict[str, Converter] = {
+    "TIMESTAMP": _timestamp_to_json,
+    "DATETIME": _datetime_to_json,
+    "DATE": _date_to_json,
+    "TIME": _time_to_json,
+    "NUMERIC": _decimal_to_json,
+    "BIGNUMERIC": _decimal_to_json,
+    "BYTES": _bytes_to_json,
+    "FLOAT": _float_to_json,
+    "FLOAT64": _float_to_json,
+    "JSON": _json_to_json,
+}
+
+
+class RowEncoder:
+    """
+    RowEncoder converts rows to JSON compatible values for a BigQuery table schema.
+
+    The schema is compiled once into a converter per field that needs one, fields
+    such as STRING or INTEGER are passed through untouched.
+
+    Args:
+        schema (List[SchemaField]):
+            Schema of the table, as returned by `get_bq_schema_from_json_schema`
+            or `Table.schema`.
+        fast_json (bool):
+            Whether to serialize with `orjson` when it is installed.
+    """
+
+    def __init__(self, schema: list[SchemaField], fast_json: bool = True):
+        self._encode_row = _compile_record(schema)
+        self._dumps: Callable[[Any], bytes] = (
+            orjson.dumps if fast_json and orjson is not None else _json_dumps
+        )
+
+    def encode(self, row: dict) -> dict:
+        """
+        Function returns a copy of the row with every value JSON compatible.
+
+        Args:
+            row (Dict):
+                Row keyed by field name.
+
+        Returns:
+            Dict: Row that can be passed to `insert_rows_json`.
+        """
+        return self._encode_row(row)
+
+    def encode_many(self, rows: Iterable[dict]) -> list[dict]:
+        """
+        Function returns a JSON compatible copy of every row.
+
+        Args:
+            rows (Iterable[Dict]):
+                Rows keyed by field name.
+
+        Returns:
+            List[Dict]: Rows that can be passed to `insert_rows_json`.
+        """
+        encode_row = self._encode_row
+        return [encode_row(row) for row in rows]
+
+    def dumps(self, row: dict) -> bytes:
+        """
+        Function returns a single row serialized as JSON.
+
+        Args:
+            row (Dict):
+                Row keyed by field name.
+
+        Returns:
+            bytes: UTF-8 encoded JSON object.
+        """
+        return self._dumps(self._encode_row(row))
+
+    def write_ndjson(self, rows: Iterable[dict], buffer: bytearray) -> int:
+        """
+        Function appends rows as newline delimited JSON to a buffer.
+
+        The buffer is not cleared, callers reuse it between batches with
+        `buffer.clear()` to avoid reallocating it.
+
+        Args:
+            rows (Iterable[Dict]):
+                Rows keyed by field name.
+            buffer (bytearray):
+                Buffer the rows are appended to.
+
+        Returns:
+            int: Number of rows written.
+        """
+        encode_row = self._encode_row
+        dumps = self._dumps
+        count = 0
+        for row in rows:
+            buffer += dumps(encode_row(row))
+            buffer += b"\n"
+            count += 1
+        return count
+
+    def to_ndjson(self, rows: Iterable[dict]) -> bytes:
+        """
+        Function returns rows serialized as newline delimited JSON.
+
+        Args:
+            rows (Iterable[Dict]):
+                Rows keyed by field name.
+
+        Returns:
+            bytes: UTF-8 encoded NDJSON payload.
+        """
+        buffer = bytearray()
+        self.write_ndjson(rows, buffer)
+        return bytes(buffer)
+
+
+def _compile_record(schema: list[SchemaField] | tuple) -> Converter:
+    """
+    Function compiles the fields of a table or RECORD into a single row converter.
+    """
+    field_converters = _compile_fields(schema)
+    if not field_converters:
+        return dict
+    return _record_converter(field_converters)
+
+
+def _record_converter(field_converters: list[tuple[str, Converter]]) -> Converter:
+    """
+    Function returns a converter applying field converters to a copy of a record.
+    """
+
+    def encode_record(row):
+        encoded = dict(row)
+        for name, converter in field_converters:
+            value = encoded.get(name)
+            if value is not None:
+                encoded[name] = converter(value)
+        return encoded
+
+    return encode_record
+
+
+def _compile_fields(schema: list[SchemaField] | tuple) -> list[tuple[str, Converter]]:
+    """
+    Function returns the converters of the fields whose values need converting.
+    """
+    field_converters: list[tuple[str, Converter]] = []
+    for field in schema:
+        converter = _compile_field(field)
+        if converter is not None:
+            field_converters.append((field.name, converter))
+    return field_converters
+
+
+def _compile_field(field: SchemaField) -> Converter | None:
+    """
+    Function returns the converter of a field, None when values need no conversion.
+    """
+    field_type = field.field_type.upper() if field.field_type else ""
+
+    converter: Converter | None
+    if field_type in ("RECORD", "STRUCT"):
+        # Nested records only need copying when one of their fields is converted
+        nested = _compile_fields(field.fields)
+        converter = _record_converter(nested) if nested else None
+    else:
+        converter = converters.get(field_type)
+
+    if converter is None or field.mode != "REPEATED":
+        return converter
+
+    convert_item = converter
+
+    def encode_repeated(values):
+        return [None if value is None else convert_item(value) for value in values]
+
+    return encode_repeated
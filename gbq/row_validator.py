@@ -0,0 +1,342 @@
+import base64
+import binascii
+import datetime
+import decimal
+import math
+import re
+import zoneinfo
+from collections import Counter
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from gbq.dto import RowValidationReport, RowValidationSample
+from gbq.exceptions import InvalidDefinitionException
+
+# A compiled field check appends (path, reason) tuples for every problem it finds.
+FieldCheck = Callable[[Any, str, list], None]
+
+_INTEGER_CHARS = frozenset("0123456789")
+
+# Canonical formats of BigQuery, such as 2020-1-5, 12:30:00.5 or
+# 2020-01-05 12:30:00 America/Los_Angeles
+_date = r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})"
+_time = r"(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})(?:\.\d{1,6})?"
+_zone = r"\s*(?:Z|[+-]\d{1,2}(?::\d{2})?)|\s+(?P<zone>\S+)"
+_date_pattern = re.compile(_date)
+_time_pattern = re.compile(_time)
+_datetime_pattern = re.compile(rf"{_date}(?:[ T]{_time})?")
+_timestamp_pattern = re.compile(rf"{_date}(?:[ T]{_time})?(?:{_zone})?")
+
+
+def _is_integer(value) -> bool:
+    if isinstance(value, int):
+        return not isinstance(value, bool)
+    if isinstance(value, str):
+        digits = value[1:] if value[:1] == "-" else value
+        return bool(digits) and _INTEGER_CHARS.issuperset(digits)
+    return False
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _is_float(value) -> bool:
+    # BigQuery also takes numeric strings, "NaN", "Infinity" and "-Infinity"
+    if isinstance(value, str):
+        if "_" in value or value != value.strip():
+            return False
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return True
+    return _is_number(value)
+
+
+def _is_numeric(value) -> bool:
+    # NUMERIC and BIGNUMERIC have no NaN or infinity
+    if isinstance(value, str):
+        if "_" in value or value != value.strip():
+            return False
+        try:
+            value = decimal.Decimal(value)
+        except decimal.InvalidOperation:
+            return False
+    if isinstance(value, decimal.Decimal):
+        return value.is_finite()
+    return _is_number(value) and math.isfinite(value)
+
+
+def _is_string(value) -> bool:
+    return isinstance(value, str)
+
+
+def _is_bytes(value) -> bool:
+    # Strings are base64 encoded bytes
+    if isinstance(value, str):
+        try:
+            base64.b64decode(value, validate=True)
+        except binascii.Error:
+            return False
+        return True
+    return isinstance(value, bytes)
+
+
+def _is_boolean(value) -> bool:
+    return isinstance(value, bool)
+
+
+def _matches(pattern: re.Pattern, value: str) -> bool:
+    match = pattern.fullmatch(value)
+    if match is None:
+        return False
+    parts = match.groupdict()
+    try:
+        if parts.get("year") is not None:
+            datetime.date(int(parts["year"]), int(parts["month"]), int(parts["day"]))
+        if parts.get("hour") is not None:
+            datetime.time(
+                int(parts["hour"]), int(parts["minute"]), int(parts["second"])
+            )
+        if parts.get("zone") not in (None, "UTC"):
+            zoneinfo.ZoneInfo(parts["zone"])
+    except (ValueError, zoneinfo.ZoneInfoNotFoundError):
+        return False
+    return True
+
+
+def _is_timestamp(value) -> bool:
+    if isinstance(value, str):
+        return _matches(_timestamp_pattern, value)
+    return isinstance(value, datetime.datetime) or _is_number(value)
+
+
+def _is_datetime(value) -> bool:
+    if isinstance(value, str):
+        return _matches(_datetime_pattern, value)
+    return isinstance(value, datetime.datetime)
+
+
+def _is_date(value) -> bool:
+    if isinstance(value, str):
+        return _matches(_date_pattern, value)
+    # datetime is a subclass of date, but BigQuery will not accept it for a DATE
+    return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+
+
+def _is_time(value) -> bool:
+    if isinstance(value, str):
+        return _matches(_time_pattern, value)
+    return isinstance(value, datetime.time)
+
+
+def _is_any(value) -> bool:
+    return True
+
+
+type_checks: dict[str, Callable[[Any], bool]] = {
+    "STRING": _is_string,
+    "BYTES": _is_bytes,
+    "INTEGER": _is_integer,
+    "INT64": _is_integer,
+    "FLOAT": _is_float,
+    "FLOAT64": _is_float,
+    "NUMERIC": _is_numeric,
+    "BIGNUMERIC": _is_numeric,
+    "BOOLEAN": _is_boolean,
+    "BOOL": _is_boolean,
+    "TIMESTAMP": _is_timestamp,
+    "DATETIME": _is_datetime,
+    "DATE": _is_date,
+    "TIME": _is_time,
+    "GEOGRAPHY": _is_string,
+    "JSON": _is_any,
+}
+
+
+class RowValidator:
+    """
+    RowValidator checks rows against a BigQuery table schema.
+
+    The schema is compiled once into one closure per field, so validating a row
+    only runs the checks that apply to that row's fields instead of walking the
+    schema definition again.
+
+    Args:
+        json_schema (List[Dict]):
+            Raw JSON schema of the table, the same input accepted by
+            `get_bq_schema_from_json_schema`.
+        allow_unknown_fields (bool):
+            Whether fields missing from the schema are accepted.
+    """
+
+    def __init__(self, json_schema: list[dict], allow_unknown_fields: bool = False):
+        self.allow_unknown_fields = allow_unknown_fields
+        self._check_row = _compile_record(json_schema, "", allow_unknown_fields)
+
+    def validate(self, row: dict) -> list[str]:
+        """
+        Function returns the list of problems found in a single row.
+
+        Args:
+            row (Dict):
+                Row to validate, as it would be passed to `insert_rows_json`.
+
+        Returns:
+            List[str]: Human readable errors, empty when the row is valid.
+        """
+        errors: list = []
+        self._check_row(row, "", errors)
+        return [f"{path}: {reason}" for path, reason in errors]
+
+    def is_valid(self, row: dict) -> bool:
+        """
+        Function returns whether a single row matches the schema.
+
+        Args:
+            row (Dict):
+                Row to validate.
+
+        Returns:
+            Bool: Whether the row is valid or not.
+        """
+        errors: list = []
+        self._check_row(row, "", errors)
+        return not errors
+
+    def validate_batch(
+        self, rows: Iterable[dict], sample_size: int = 10
+    ) -> RowValidationReport:
+        """
+        Function validates many rows and summarises the failures.
+
+        Args:
+            rows (Iterable[Dict]):
+                Rows to validate.
+            sample_size (int):
+                Maximum number of failing rows kept in the report.
+
+        Returns:
+            RowValidationReport: Counts per error and a sample of failing rows.
+        """
+        check_row = self._check_row
+        error_counts: Counter = Counter()
+        samples: list[RowValidationSample] = []
+        total_rows = 0
+        invalid_rows = 0
+
+        for index, row in enumerate(rows):
+            total_rows += 1
+            errors: list = []
+            check_row(row, "", errors)
+            if not errors:
+                continue
+
+            invalid_rows += 1
+            error_counts.update(f"{path}: {reason}" for path, reason in errors)
+            if len(samples) < sample_size:
+                samples.append(
+                    RowValidationSample(
+                        index=index,
+                        row=row,
+                        errors=[f"{path}: {reason}" for path, reason in errors],
+                    )
+                )
+
+        return RowValidationReport(
+            total_rows=total_rows,
+            invalid_rows=invalid_rows,
+            error_counts=dict(error_counts.most_common()),
+            samples=samples,
+        )
+
+
+def _compile_record(
+    json_schema: list[dict], prefix: str, allow_unknown_fields: bool
+) -> FieldCheck:
+    """
+    Function compiles the fields of a table or RECORD into a single row check.
+    """
+    field_checks: list[tuple[str, FieldCheck]] = []
+    for field in json_schema:
+        name = str(field.get("name"))
+        path = f"{prefix}.{name}" if prefix else name
+        field_checks.append((name, _compile_field(field, path, allow_unknown_fields)))
+
+    known_fields = frozenset(name for name, _check in field_checks)
+
+    def check_record(value, path, errors):
+        if not isinstance(value, dict):
+            errors.append((path or "<row>", "expected RECORD"))
+            return
+        for name, check in field_checks:
+            check(value.get(name), path, errors)
+        if not allow_unknown_fields and not known_fields.issuperset(value):
+            for name in value:
+                if name not in known_fields:
+                    errors.append((f"{path}.{name}" if path else name, "no such field"))
+
+    return check_record
+
+
+def _compile_field(field: dict, path: str, allow_unknown_fields: bool) -> FieldCheck:
+    """
+    Function compiles a single schema field into a closure checking its value.
+    """
+    field_type = str(field.get("type", "")).upper()
+    mode = str(field.get("mode", "NULLABLE")).upper()
+
+    if field_type in ("RECORD", "STRUCT"):
+        nested = _compile_record(field.get("fields", []), path, allow_unknown_fields)
+
+        def check_value(value):
+            errors = []
+            nested(value, path, errors)
+            return errors
+
+    elif field_type in type_checks:
+        is_valid_type = type_checks[field_type]
+        type_error = [(path, f"expected {field_type}")]
+
+        def check_value(value):
+            return () if is_valid_type(value) else type_error
+
+    else:
+        raise InvalidDefinitionException(f"Unknown type {field_type!r} for {path}")
+
+    if mode == "REPEATED":
+
+        def check_repeated(value, _parent, errors):
+            if value is None:
+                return
+            if not isinstance(value, list | tuple):
+                errors.append((path, "expected REPEATED"))
+                return
+            for item in value:
+                if item is None:
+                    errors.append((path, "null in REPEATED"))
+                else:
+                    errors.extend(check_value(item))
+
+        return check_repeated
+
+    if mode == "REQUIRED":
+
+        def check_required(value, _parent, errors):
+            if value is None:
+                errors.append((path, "missing REQUIRED"))
+            else:
+                errors.extend(check_value(value))
+
+        return check_required
+
+    if mode == "NULLABLE":
+
+        def check_nullable(value, _parent, errors):
+            if value is not None:
+                errors.extend(check_value(value))
+
+        return check_nullable
+
+    raise InvalidDefinitionException(f"Unknown mode {mode!r} for {path}")
@@ -0,0 +1,225 @@
+import re
+
+from gbq.dto import Partition, Structure, TimeDefinition
+from gbq.exceptions import InvalidDefinitionException
+from gbq.helpers import field_type
+
+# Legacy and standard SQL names of the column types of BigQuery tables
+bigquery_types = set(field_type.values()) | {
+    "INT64",
+    "FLOAT64",
+    "BOOL",
+    "NUMERIC",
+    "BIGNUMERIC",
+    "DECIMAL",
+    "BIGDECIMAL",
+    "TIMESTAMP",
+    "GEOGRAPHY",
+    "JSON",
+    "INTERVAL",
+    "RANGE",
+    "STRUCT",
+}
+record_types = {"RECORD", "STRUCT"}
+modes = {"NULLABLE", "REQUIRED", "REPEATED"}
+time_partitioning_types = {"DATE", "TIMESTAMP", "DATETIME"}
+range_partitioning_types = {"INTEGER", "INT64"}
+clustering_types = {
+    "STRING",
+    "INTEGER",
+    "INT64",
+    "NUMERIC",
+    "BIGNUMERIC",
+    "DECIMAL",
+    "BIGDECIMAL",
+    "BOOLEAN",
+    "BOOL",
+    "DATE",
+    "DATETIME",
+    "TIMESTAMP",
+    "GEOGRAPHY",
+}
+
+max_columns = 10_000
+max_depth = 15
+max_name_length = 300
+max_clustering_fields = 4
+max_partitions = 10_000
+reserved_prefixes = (
+    "_TABLE_",
+    "_FILE_",
+    "_PARTITION",
+    "_ROW_TIMESTAMP",
+    "__ROOT__",
+    "_COLIDENTIFIER",
+)
+# Characters not allowed in flexible column names
+_invalid_name_pattern = re.compile(r"[!\"$()*,./;?@\[\\\]^`{}~\n\r\t]")
+
+
+def _validate_name(name, path: str, errors: list[str]) -> None:
+    if not isinstance(name, str) or not name:
+        errors.append(f"{path}: missing name")
+        return
+    if len(name) > max_name_length:
+        errors.append(f"{path}: name longer than {max_name_length} characters")
+    if _invalid_name_pattern.search(name):
+        errors.append(f"{path}: invalid characters in name {name!r}")
+    if name.upper().startswith(reserved_prefixes):
+        errors.append(f"{path}: name {name!r} uses a reserved prefix")
+
+
+def _validate_fields(
+    fields: list[dict], parent: str, depth: int, errors: list[str]
+) -> int:
+    """
+    Function validates the fields of a record, returning their number of columns.
+    """
+    columns = 0
+    names: set[str] = set()
+    for index, field in enumerate(fields):
+        name = field.get("name") if isinstance(field, dict) else None
+        path = (
+            f"{parent}{name}"
+            if isinstance(name, str) and name
+            else (f"{parent}[{index}]")
+        )
+        if not isinstance(field, dict):
+            errors.append(f"{path}: expected a field definition")
+            continue
+        _validate_name(name, path, errors)
+        if isinstance(name, str):
+            if name.lower() in names:
+                errors.append(f"{path}: duplicate field name")
+            names.add(name.lower())
+
+        type_ = str(field.get("type", "")).upper()
+        mode = str(field.get("mode", "NULLABLE")).upper()
+        columns += 1
+        if type_ not in bigquery_types:
+            errors.append(f"{path}: unknown type {field.get('type')!r}")
+        if mode not in modes:
+            errors.append(f"{path}: unknown mode {field.get('mode')!r}")
+
+        nested = field.get("fields")
+        if type_ in record_types:
+            if not nested:
+                errors.append(f"{path}: {type_} without fields")
+            elif depth >= max_depth:
+                errors.append(f"{path}: nested deeper than {max_depth} levels")
+            else:
+                columns += _validate_fields(nested, f"{path}.", depth + 1, errors)
+        elif nested:
+            errors.append(f"{path}: fields are only allowed in RECORD fields")
+    return columns
+
+
+def _get_top_level_field(structure: Structure, name: str | None) -> dict | None:
+    for field in structure.table_schema:
+        if isinstance(field, dict) and field.get("name") == name:
+            return field
+    return None
+
+
+def _validate_partition(
+    structure: Structure, partition: Partition, errors: list[str]
+) -> None:
+    definition = partition.definition
+    if isinstance(definition, TimeDefinition):
+        if definition.field is None:
+            # Ingestion time partitioning
+            return
+        allowed = time_partitioning_types
+    else:
+        range_ = definition.range
+        if range_.interval <= 0 or range_.end <= range_.start:
+            errors.append("partition: range needs start < end and a positive interval")
+        elif (range_.end - range_.start) / range_.interval > max_partitions:
+            errors.append(
+                f"partition: range creates more than {max_partitions} partitions"
+            )
+        allowed = range_partitioning_types
+
+    field = _get_top_level_field(structure, definition.field)
+    if field is None:
+        errors.append(f"partition: field {definition.field} is not a top level column")
+        return
+    type_ = str(field.get("type", "")).upper()
+    if type_ not in allowed:
+        errors.append(
+            f"partition: field {definition.field} has type {type_}, "
+            f"expected one of {sorted(allowed)}"
+        )
+    elif (
+        isinstance(definition, TimeDefinition)
+        and type_ == "DATE"
+        and definition.type.value == "HOUR"
+    ):
+        errors.append(f"partition: DATE field {definition.field} cannot use HOUR")
+    if str(field.get("mode", "NULLABLE")).upper() == "REPEATED":
+        errors.append(f"partition: field {definition.field} is REPEATED")
+
+
+def _validate_clustering(
+    structure: Structure, clustering: list[str], errors: list[str]
+) -> None:
+    if len(clustering) > max_clustering_fields:
+        errors.append(
+            f"clustering: more than {max_clustering_fields} fields {clustering}"
+        )
+    if len(set(clustering)) < len(clustering):
+        errors.append(f"clustering: duplicate fields {clustering}")
+    for name in clustering:
+        field = _get_top_level_field(structure, name)
+        if field is None:
+            errors.append(f"clustering: field {name} is not a top level column")
+            continue
+        type_ = str(field.get("type", "")).upper()
+        if type_ not in clustering_types:
+            errors.append(f"clustering: field {name} has type {type_}")
+        if str(field.get("mode", "NULLABLE")).upper() == "REPEATED":
+            errors.append(f"clustering: field {name} is REPEATED")
+
+
+def validate_structure(structure: Structure) -> list[str]:
+    """
+    Function checks the schema, partitioning and clustering of a structure against
+    the limits of BigQuery, without any request.
+
+    Args:
+        structure (Structure):
+            An object of internal Structure class.
+
+    Returns:
+        List[str]: Every problem found, empty when the structure is valid.
+    """
+    errors: list[str] = []
+    # Views and materialized views take the schema of their query
+    if structure.table_schema:
+        columns = _validate_fields(structure.table_schema, "", 1, errors)
+        if columns > max_columns:
+            errors.append(f"schema: {columns} columns, more than {max_columns}")
+        if structure.partition is not None:
+            _validate_partition(structure, structure.partition, errors)
+        if structure.clustering:
+            _validate_clustering(structure, structure.clustering, errors)
+    return errors
+
+
+def check_structure(structure: Structure, structure_id: str = "structure") -> None:
+    """
+    Function raises an InvalidDefinitionException listing every problem of a
+    structure, see `validate_structure`.
+
+    Args:
+        structure (Structure):
+            An object of internal Structure class.
+        structure_id (str):
+            ID of the structure, used in the message.
+    """
+    errors = validate_structure(structure)
+    if errors:
+        raise InvalidDefinitionException(
+            f"Invalid definition of {structure_id}:\n"
+            + "\n".join(f"- {error}" for error in errors)
+        )
@@ -0,0 +1,328 @@
+import re
+from typing import TYPE_CHECKING
+
+from google.cloud.bigquery import QueryJob
+
+from gbq.dto import StatementResult
+
+if TYPE_CHECKING:  # pragma: no cover
+    from gbq.bigquery import BigQuery
+
+# Statements BigQuery runs inside multi-statement transactions
+transactional_kinds = {"INSERT", "UPDATE", "DELETE", "MERGE", "SELECT", "WITH"}
+
+_separator_pattern = re.compile(
+    r"`[^`]*`"
+    r"|--[^\n]*|#[^\n]*|/\*.*?\*/"
+    r"""|'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*\""""
+    r"|(?P<separator>;)",
+    re.DOTALL,
+)
+_keyword_pattern = re.compile(
+    r"\s*(?:(?:--[^\n]*|#[^\n]*|/\*.*?\*/)\s*)*(\w+)", re.DOTALL
+)
+_error_location_pattern = re.compile(r"at \[(\d+):(\d+)\]")
+
+
+def split_script(script: str) -> list[tuple[int, str]]:
+    """
+    Function splits a script into its statements.
+
+    Args:
+        script (str):
+            Statements separated by semicolons.
+
+    Returns:
+        List[Tuple[int, str]]: Line, starting at 1, and text of every statement.
+    """
+    pieces = []
+    start = 0
+    for match in _separator_pattern.finditer(script):
+        if match.group("separator"):
+            pieces.append((start, match.start()))
+            start = match.end()
+    pieces.append((start, len(script)))
+
+    statements = []
+    for piece_start, piece_end in pieces:
+        piece = script[piece_start:piece_end]
+        statement = piece.strip()
+        if statement:
+            offset = piece_start + len(piece) - len(piece.lstrip())
+            statements.append((script.count("\n", 0, offset) + 1, statement))
+    return statements
+
+
+def get_statement_kind(statement: str) -> str:
+    """
+    Function returns the leading keyword of a statement, such as "INSERT" or "ALTER".
+    """
+    match = _keyword_pattern.match(statement)
+    return match.group(1).upper() if match else ""
+
+
+def is_transactional(statement: str) -> bool:
+    """
+    Function returns whether a statement can run inside a transaction, DDL and DCL
+    statements such as ALTER TABLE or GRANT cannot.
+    """
+    return get_statement_kind(statement) in transactional_kinds
+
+
+def build_script(
+    statements: list[str], transaction: bool = False
+) -> tuple[str, list[tuple[int, int]]]:
+    """
+    Function packs statements into a multi-statement script.
+
+    Args:
+        statements (List[str]):
+            Statements, without trailing semicolons.
+        transaction (bool):
+            Whether the statements run inside a transaction.
+
+    Returns:
+        Tuple[str, List[Tuple[int, int]]]: The script and the first and last line of
+            every statement in it.
+    """
+    parts = []
+    line_ranges = []
+    line = 1
+    if transaction:
+        parts.append("BEGIN TRANSACTION;")
+        line += 1
+    for statement in statements:
+        last_line = line + statement.count("\n")
+        line_ranges.append((line, last_line))
+        parts.append(f"{statement};")
+        line = last_line + 1
+    if transaction:
+        parts.append("COMMIT TRANSACTION;")
+    return "\n".join(parts), line_ranges
+
+
+def _get_statement_index(line: int | None, line_ranges: list[tuple[int, int]]):
+    if line is None:
+        return None
+    for index, (first_line, last_line) in enumerate(line_ranges):
+        if first_line <= line <= last_line:
+            return index
+    return None
+
+
+def _get_child_line(child_job) -> int | None:
+    script_statistics = getattr(child_job, "script_statistics", None)
+    if script_statistics is None or not script_statistics.stack_frames:
+        return None
+    # The outermost frame, the script, is last, inner frames are procedure calls
+    return script_statistics.stack_frames[-1].start_line
+
+
+def get_statement_result(statement: str, query_job: QueryJob) -> StatementResult:
+    """
+    Function returns the result of a statement from the job that ran it.
+
+    Args:
+        statement (str):
+            Statement run by the job.
+        query_job (QueryJob):
+            Finished query job, or child job of a script.
+
+    Returns:
+        StatementResult: An object of StatementResult.
+    """
+    error_result = query_job.error_result
+    return StatementResult(
+        statement=statement,
+        status="failed" if error_result else "done",
+        job_id=query_job.job_id,
+        statement_type=query_job.statement_type,
+        num_dml_affected_rows=query_job.num_dml_affected_rows,
+        total_bytes_processed=query_job.total_bytes_processed,
+        error=error_result.get("message") if error_result else None,
+    )
+
+
+def _merge_results(first: StatementResult, second: StatementResult) -> StatementResult:
+    failed = first if first.status == "failed" else second
+    affected_rows = [
+        result.num_dml_affected_rows
+        for result in (first, second)
+        if result.num_dml_affected_rows is not None
+    ]
+    return StatementResult(
+        statement=first.statement,
+        status=failed.status,
+        job_id=failed.job_id,
+        statement_type=first.statement_type,
+        num_dml_affected_rows=sum(affected_rows) if affected_rows else None,
+        total_bytes_processed=(first.total_bytes_processed or 0)
+        + (second.total_bytes_processed or 0),
+        error=failed.error,
+    )
+
+
+def map_script_results(
+    statements: list[str],
+    line_ranges: list[tuple[int, int]],
+    child_jobs: list[QueryJob],
+    script_error: Exception | None = None,
+    transaction: bool = False,
+) -> list[StatementResult]:
+    """
+    Function maps the child jobs of a script back to its statements.
+
+    Statements are "done" when their child job succeeded, "failed" for the statement
+    that made the script fail, and "skipped" when the script failed before them.
+    Statements done in a failed transaction are "rolled_back".
+
+    Args:
+        statements (List[str]):
+            Statements of the script.
+        line_ranges (List[Tuple[int, int]]):
+            First and last line of every statement in the script.
+        child_jobs (List[QueryJob]):
+            Child jobs of the script.
+        script_error (Optional[Exception]):
+            Error of the script job.
+        transaction (bool):
+            Whether the statements ran inside a transaction.
+
+    Returns:
+        List[StatementResult]: The result of every statement, in order.
+    """
+    status = "done" if script_error is None else "skipped"
+    results = [
+        StatementResult(statement=statement, status=status) for statement in statements
+    ]
+
+    mapped: set[int] = set()
+    for child_job in child_jobs:
+        index = _get_statement_index(_get_child_line(child_job), line_ranges)
+        if index is None:
+            # Transaction control statements are not mapped
+            continue
+        result = get_statement_result(statements[index], child_job)
+        if index in mapped:
+            # Statements of a called procedure run as several child jobs
+            result = _merge_results(results[index], result)
+        results[index] = result
+        mapped.add(index)
+
+    failed = any(result.status == "failed" for result in results)
+    if script_error is not None and not failed:
+        # Errors found before running, such as syntax errors, only have a location
+        match = _error_location_pattern.search(str(script_error))
+        index = _get_statement_index(
+            int(match.group(1)) if match else None, line_ranges
+        )
+        for result in [results[index]] if index is not None else results:
+            result.status = "failed"
+            result.error = str(script_error)
+
+    if script_error is not None and transaction:
+        for result in results:
+            if result.status == "done":
+                result.status = "rolled_back"
+    return results
+
+
+class StatementBatcher:
+    """
+    StatementBatcher packs DDL, DML and DCL statements into multi-statement scripts,
+    so that many small statements pay the overhead of a single job.
+
+    Statements are run in the order they are added. With transaction set, DML
+    statements run inside a transaction while statements that cannot, such as ALTER
+    TABLE or GRANT, are sent in separate scripts without transaction.
+
+    Args:
+        bq (BigQuery):
+            BigQuery object running the scripts.
+        transaction (bool):
+            Whether DML statements run inside a transaction.
+        max_bytes (int):
+            Maximum size of a script, BigQuery rejects queries over 1MB.
+        max_statements (int):
+            Maximum number of statements of a script.
+        timeout (Optional[float]):
+            Number of seconds to wait for a script, job_timeout by default.
+
+    Examples:
+        with StatementBatcher(bq, transaction=True) as batcher:
+            batcher.add("ALTER TABLE dataset.table ADD COLUMN IF NOT EXISTS b STRING")
+            batcher.add("DELETE FROM dataset.table WHERE day = '2024-01-01'")
+            batcher.add("INSERT INTO dataset.table (a) VALUES (1)")
+        failed = batcher.failed
+    """
+
+    def __init__(
+        self,
+        bq: "BigQuery",
+        transaction: bool = False,
+        max_bytes: int = 1_000_000,
+        max_statements: int = 1_000,
+        timeout: float | None = None,
+    ):
+        self.bq = bq
+        self.transaction = transaction
+        self.max_bytes = max_bytes
+        self.max_statements = max_statements
+        self.timeout = timeout
+        self.results: list[StatementResult] = []
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+        self._pending_transaction = False
+
+    def add(self, statement: str) -> None:
+        """
+        Function adds a statement, running the pending statements first when the
+        statement does not fit in their script.
+
+        Args:
+            statement (str):
+                A single statement.
+        """
+        statement = statement.strip().rstrip(";").rstrip()
+        size = len(statement.encode()) + 2
+        transaction = self.transaction and is_transactional(statement)
+        if self._pending and (
+            transaction != self._pending_transaction
+            or self._pending_bytes + size > self.max_bytes
+            or len(self._pending) >= self.max_statements
+        ):
+            self.flush()
+
+        self._pending.append(statement)
+        self._pending_bytes += size
+        self._pending_transaction = transaction
+
+    def flush(self) -> list[StatementResult]:
+        """
+        Function runs the pending statements as one script.
+
+        Returns:
+            List[StatementResult]: The result of every pending statement.
+        """
+        if not self._pending:
+            return []
+        statements, self._pending, self._pending_bytes = self._pending, [], 0
+        results = self.bq.run_script(
+            statements, transaction=self._pending_transaction, timeout=self.timeout
+        )
+        self.results.extend(results)
+        return results
+
+    @property
+    def failed(self) -> list[StatementResult]:
+        """
+        Results of the statements that failed.
+        """
+        return [result for result in self.results if result.status == "failed"]
+
+    def __enter__(self) -> "StatementBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
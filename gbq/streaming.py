@@ -0,0 +1,291 @@
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from google.api_core.exceptions import ServerError, TooManyRequests
+from google.cloud import bigquery
+
+from gbq.dto import StreamingFailure, StreamingStats
+from gbq.exceptions import GbqException
+from gbq.instrumentation import Rpc, call_rpc, propagate_context
+from gbq.row_encoder import dumps_json
+
+# Row level reasons returned by insertAll for rows that can be sent again as-is.
+# "stopped" marks valid rows rejected only because another row in the request failed.
+retryable_reasons = frozenset({"stopped", "timeout", "backendError", "internalError"})
+
+# BigQuery rejects insertAll requests above 10MB, keep headroom for the envelope.
+MAX_REQUEST_BYTES = 9 * 1024 * 1024
+
+
+class _TableBuffer:
+    __slots__ = ("rows", "row_ids", "nbytes", "started_at")
+
+    def __init__(self) -> None:
+        self.rows: list[dict] = []
+        self.row_ids: list[str] = []
+        self.nbytes = 0
+        self.started_at = 0.0
+
+
+class StreamingWriter:
+    """
+    StreamingWriter buffers rows per table and sends them with `insert_rows_json`.
+
+    A table buffer is flushed when it reaches `max_rows` rows, when the next row would
+    push it over `max_bytes`, or when its oldest row is older than `flush_interval`.
+    Flushes run concurrently on a thread pool. When `max_pending_rows` rows are
+    buffered or in flight, `write` blocks until a flush completes.
+
+    Only rows BigQuery reports as failed are sent again, rows rejected for a
+    non-transient reason are kept in `failed_rows` instead of being retried.
+
+    Args:
+        bq_client (bigquery.Client):
+            Client used to send the rows.
+        project (str):
+            Project bound to the operation.
+        dataset (str):
+            ID of dataset containing the tables.
+        max_rows (int):
+            Maximum number of rows sent in one request.
+        max_bytes (int):
+            Maximum size of the JSON rows sent in one request.
+        flush_interval (float):
+            Maximum number of seconds a row stays buffered.
+        max_workers (int):
+            Maximum number of concurrent requests.
+        max_pending_rows (int):
+            Maximum number of rows buffered or in flight before `write` blocks.
+        max_retries (int):
+            Number of times failed rows are sent again.
+        retry_delay (float):
+            Initial delay in seconds between retries, doubled on every attempt.
+        rpc (Rpc):
+            Sends the requests, see `BigQuery._rpc`.
+    """
+
+    def __init__(
+        self,
+        bq_client: bigquery.Client,
+        project: str,
+        dataset: str,
+        max_rows: int = 500,
+        max_bytes: int = MAX_REQUEST_BYTES,
+        flush_interval: float = 1.0,
+        max_workers: int = 4,
+        max_pending_rows: int = 50_000,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        rpc: Rpc = call_rpc,
+    ):
+        if max_pending_rows < max_rows:
+            raise GbqException("max_pending_rows must be at least max_rows")
+
+        self.bq_client = bq_client
+        self.project = project
+        self.dataset = dataset
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_pending_rows = max_pending_rows
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._rpc = rpc
+
+        self.failed_rows: list[StreamingFailure] = []
+        self.stats = StreamingStats()
+
+        self._buffers: dict[str, _TableBuffer] = {}
+        self._pending_rows = 0
+        self._futures: set[Future] = set()
+        self._condition = threading.Condition()
+        self._closed = False
+        # Rows are sent in the context the writer was created in, also when the timer
+        # flushes them, e.g. to count the requests of an `rpc_run`
+        self._send_in_context = propagate_context(self._send)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gbq-streaming"
+        )
+        self._stop = threading.Event()
+        self._timer = threading.Thread(
+            target=self._flush_periodically, name="gbq-streaming-timer", daemon=True
+        )
+        self._timer.start()
+
+    def __enter__(self) -> "StreamingWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, table: str, rows: Iterable[dict]):
+        """
+        Function buffers rows for a table, flushing the buffer whenever it is full.
+
+        Args:
+            table (str):
+                ID of the table.
+            rows (Iterable[Dict]):
+                JSON compatible rows, see `RowEncoder` for converting other values.
+        """
+        for row in rows:
+            nbytes = len(dumps_json(row))
+            if nbytes > self.max_bytes:
+                raise GbqException(
+                    f"Row of {nbytes} bytes does not fit in a request of "
+                    f"{self.max_bytes} bytes"
+                )
+
+            with self._condition:
+                if self._closed:
+                    raise GbqException("StreamingWriter is closed")
+
+                while self._pending_rows >= self.max_pending_rows:
+                    # Buffered rows only leave through a flush, send them before waiting
+                    self._flush_all_locked()
+                    self._condition.wait()
+
+                buffer = self._buffers.get(table)
+                if buffer is None:
+                    buffer = self._buffers[table] = _TableBuffer()
+                elif buffer.nbytes + nbytes > self.max_bytes:
+                    self._flush_locked(table)
+                    buffer = self._buffers[table] = _TableBuffer()
+
+                if not buffer.rows:
+                    buffer.started_at = time.monotonic()
+                buffer.rows.append(row)
+                buffer.row_ids.append(uuid.uuid4().hex)
+                buffer.nbytes += nbytes
+                self._pending_rows += 1
+
+                if len(buffer.rows) >= self.max_rows:
+                    self._flush_locked(table)
+
+    def flush(self, wait: bool = True):
+        """
+        Function sends every buffered row.
+
+        Args:
+            wait (bool):
+                Whether to wait for the requests to complete.
+        """
+        with self._condition:
+            self._flush_all_locked()
+            futures = list(self._futures)
+
+        if wait:
+            for future in futures:
+                future.result()
+
+    def close(self):
+        """
+        Function sends every buffered row, waits for the requests and stops the writer.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+
+        self._stop.set()
+        self._timer.join()
+        self.flush(wait=True)
+        self._executor.shutdown(wait=True)
+
+    def _flush_periodically(self):
+        while not self._stop.wait(self.flush_interval / 2):
+            deadline = time.monotonic() - self.flush_interval
+            with self._condition:
+                for table, buffer in list(self._buffers.items()):
+                    if buffer.rows and buffer.started_at <= deadline:
+                        self._flush_locked(table)
+
+    def _flush_all_locked(self):
+        for table in list(self._buffers):
+            self._flush_locked(table)
+
+    def _flush_locked(self, table: str):
+        buffer = self._buffers.pop(table, None)
+        if buffer is None or not buffer.rows:
+            return
+
+        future = self._executor.submit(
+            self._send_in_context, table, buffer.rows, buffer.row_ids
+        )
+        self._futures.add(future)
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future: Future):
+        with self._condition:
+            self._futures.discard(future)
+
+    def _send(self, table: str, rows: list[dict], row_ids: list[str]):
+        """
+        Function sends rows to a table, sending again only the rows that failed.
+        """
+        table_id = f"{self.project}.{self.dataset}.{table}"
+        total_rows = len(rows)
+        failures: list[StreamingFailure] = []
+        requests = 0
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                if attempt:
+                    time.sleep(self.retry_delay * 2 ** (attempt - 1))
+
+                requests += 1
+                try:
+                    errors = self._rpc(
+                        "insert_rows_json",
+                        self.bq_client.insert_rows_json,
+                        table_id,
+                        rows,
+                        row_ids=row_ids,
+                    )
+                except Exception as e:
+                    # Nothing was inserted, every row failed for the same reason
+                    reason = (
+                        "backendError"
+                        if isinstance(e, ServerError | TooManyRequests)
+                        else "requestError"
+                    )
+                    errors = [
+                        {
+                            "index": index,
+                            "errors": [{"reason": reason, "message": str(e)}],
+                        }
+                        for index in range(len(rows))
+                    ]
+
+                retry_rows, retry_ids = [], []
+                for error in errors:
+                    index = error["index"]
+                    row_errors = error.get("errors", [])
+                    retryable = row_errors and all(
+                        row_error.get("reason") in retryable_reasons
+                        for row_error in row_errors
+                    )
+                    if retryable and attempt < self.max_retries:
+                        retry_rows.append(rows[index])
+                        retry_ids.append(row_ids[index])
+                    else:
+                        failures.append(
+                            StreamingFailure(
+                                table=table, row=rows[index], errors=row_errors
+                            )
+                        )
+
+                if not retry_rows:
+                    break
+                rows, row_ids = retry_rows, retry_ids
+        finally:
+            with self._condition:
+                self.failed_rows.extend(failures)
+                self.stats.requests += requests
+                self.stats.rows_sent += total_rows - len(failures)
+                self.stats.rows_failed += len(failures)
+                self._pending_rows -= total_rows
+                self._condition.notify_all()
@@ -0,0 +1,203 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict, deque
+
+from google.cloud.bigquery import QueryJob
+
+from gbq.dto import QueryAggregate, QueryStageTiming, QueryStats
+
+_token_pattern = re.compile(
+    r"(?P<identifier>`[^`]*`)"
+    r"|(?P<comment>--[^\n]*|#[^\n]*|/\*.*?\*/)"
+    r"""|'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|\b\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b""",
+    re.DOTALL,
+)
+_list_pattern = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_whitespace_pattern = re.compile(r"\s+")
+
+
+def _replace_token(match: re.Match) -> str:
+    if match.group("identifier"):
+        return match.group("identifier")
+    if match.group("comment"):
+        return " "
+    return "?"
+
+
+def normalize_query(query: str) -> str:
+    """
+    Function returns the shape of a query: comments are removed, literals replaced
+    by "?", lists of literals collapsed and whitespace collapsed.
+
+    Args:
+        query (str):
+            BigQuery query string
+
+    Returns:
+        str: The normalized query.
+    """
+    query = _token_pattern.sub(_replace_token, query)
+    query = _list_pattern.sub("(?)", query)
+    return _whitespace_pattern.sub(" ", query).strip().lower()
+
+
+def get_query_fingerprint(query: str) -> str:
+    """
+    Function returns a stable ID shared by the queries differing only by literals.
+
+    Args:
+        query (str):
+            BigQuery query string
+
+    Returns:
+        str: Hexadecimal fingerprint of the normalized query.
+    """
+    normalized = normalize_query(query).encode()
+    return hashlib.sha1(normalized, usedforsecurity=False).hexdigest()[:16]
+
+
+def get_query_stats(query_job: QueryJob, query: str | None = None) -> QueryStats:
+    """
+    Function collects the statistics of a finished query job.
+
+    Args:
+        query_job (QueryJob):
+            Finished query job.
+        query (Optional[str]):
+            Query of the job, read from the job by default.
+
+    Returns:
+        QueryStats: An object of QueryStats.
+    """
+    query = query if query is not None else query_job.query or ""
+    created, started, ended = query_job.created, query_job.started, query_job.ended
+    error_result = query_job.error_result
+
+    stages = []
+    for entry in query_job.query_plan or []:
+        duration_ms = None
+        if entry.start is not None and entry.end is not None:
+            duration_ms = (entry.end - entry.start).total_seconds() * 1000
+        stages.append(
+            QueryStageTiming(
+                name=entry.name,
+                status=entry.status,
+                duration_ms=duration_ms,
+                wait_ms_max=entry.wait_ms_max,
+                read_ms_max=entry.read_ms_max,
+                compute_ms_max=entry.compute_ms_max,
+                write_ms_max=entry.write_ms_max,
+                records_read=entry.records_read,
+                records_written=entry.records_written,
+                slot_ms=entry.slot_ms,
+            )
+        )
+
+    return QueryStats(
+        job_id=query_job.job_id,
+        fingerprint=get_query_fingerprint(query),
+        query=query,
+        statement_type=query_job.statement_type,
+        total_bytes_processed=query_job.total_bytes_processed or 0,
+        total_bytes_billed=query_job.total_bytes_billed or 0,
+        slot_millis=query_job.slot_millis or 0,
+        cache_hit=bool(query_job.cache_hit),
+        queue_seconds=(
+            (started - created).total_seconds() if created and started else None
+        ),
+        run_seconds=(ended - started).total_seconds() if started and ended else None,
+        error=error_result.get("message") if error_result else None,
+        stages=stages,
+    )
+
+
+class QueryStatsSink:
+    """
+    QueryStatsSink receives the statistics of every query job run by `BigQuery.execute`.
+
+    Subclasses override `record`, which is called from the thread running the query
+    and must be thread safe.
+    """
+
+    def record(self, stats: QueryStats) -> None:
+        pass
+
+
+class QueryAggregator(QueryStatsSink):
+    """
+    QueryAggregator keeps a rolling aggregate of query statistics per fingerprint.
+
+    Aggregates cover the last `window` jobs of every fingerprint, at most
+    `max_fingerprints` fingerprints are tracked, the least recently seen are dropped.
+
+    Args:
+        window (int):
+            Number of recent jobs aggregated per fingerprint.
+        max_fingerprints (int):
+            Maximum number of fingerprints tracked.
+    """
+
+    def __init__(self, window: int = 100, max_fingerprints: int = 1000):
+        self.window = window
+        self.max_fingerprints = max_fingerprints
+        self._jobs: OrderedDict[str, deque[QueryStats]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, stats: QueryStats) -> None:
+        with self._lock:
+            jobs = self._jobs.get(stats.fingerprint)
+            if jobs is None:
+                jobs = deque(maxlen=self.window)
+                self._jobs[stats.fingerprint] = jobs
+                if len(self._jobs) > self.max_fingerprints:
+                    self._jobs.popitem(last=False)
+            else:
+                self._jobs.move_to_end(stats.fingerprint)
+            jobs.append(stats)
+
+    def aggregates(self) -> list[QueryAggregate]:
+        """
+        Function returns the aggregate of every tracked fingerprint.
+
+        Returns:
+            List[QueryAggregate]: Aggregates, most recently seen last.
+        """
+        with self._lock:
+            snapshot = [list(jobs) for jobs in self._jobs.values()]
+
+        aggregates = []
+        for jobs in snapshot:
+            aggregate = QueryAggregate(
+                fingerprint=jobs[-1].fingerprint, query=jobs[-1].query
+            )
+            for stats in jobs:
+                aggregate.jobs += 1
+                aggregate.errors += stats.error is not None
+                aggregate.cache_hits += stats.cache_hit
+                aggregate.total_bytes_processed += stats.total_bytes_processed
+                aggregate.total_bytes_billed += stats.total_bytes_billed
+                aggregate.total_slot_millis += stats.slot_millis
+                run_seconds = stats.run_seconds or 0.0
+                aggregate.total_run_seconds += run_seconds
+                aggregate.max_run_seconds = max(aggregate.max_run_seconds, run_seconds)
+            aggregates.append(aggregate)
+        return aggregates
+
+    def top(self, n: int = 10, key: str = "total_bytes_billed") -> list[QueryAggregate]:
+        """
+        Function returns the most expensive recurring queries.
+
+        Args:
+            n (int):
+                Number of aggregates returned.
+            key (str):
+                Attribute of QueryAggregate ranking the queries, such as
+                "total_slot_millis" or "mean_run_seconds".
+
+        Returns:
+            List[QueryAggregate]: Aggregates, most expensive first.
+        """
+        aggregates = self.aggregates()
+        aggregates.sort(key=lambda aggregate: getattr(aggregate, key), reverse=True)
+        return aggregates[:n]
@@ -0,0 +1,901 @@
+"""
+In-memory stand-in for `google.cloud.bigquery.Client`.
+
+`FakeBigQueryClient` keeps datasets, tables, rows, routines and jobs in memory so
+`BigQuery` can be exercised end to end without network access, in tests and in
+benchmarks. Latency, errors and quotas can be simulated per client method.
+
+    from gbq.testing import fake_bigquery
+
+    bq = fake_bigquery(latency=0.05)
+    bq.create_or_update_structure("project", "dataset", "table", json_schema)
+"""
+
+import copy
+import csv
+import datetime
+import gzip
+import io
+import itertools
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+
+from google.api_core.exceptions import (
+    BadRequest,
+    Conflict,
+    Forbidden,
+    NotFound,
+    ServiceUnavailable,
+    TooManyRequests,
+)
+from google.api_core.iam import Policy
+from google.cloud import bigquery
+from google.cloud.bigquery.dataset import DatasetListItem
+from google.cloud.bigquery.job import ScriptStatistics
+from google.cloud.bigquery.table import TableListItem
+
+from gbq.bigquery import BigQuery
+from gbq.row_validator import RowValidator
+from gbq.scripting import get_statement_kind, split_script
+
+ANONYMOUS_DATASET = "_gbq_fake_anonymous"
+
+
+class FakeQueryResult:
+    """
+    FakeQueryResult is returned by query handlers to describe the outcome of a query.
+
+    Args:
+        rows (List[Dict]):
+            Rows returned by the query.
+        statistics:
+            Attributes of the job, such as `total_bytes_processed`, `slot_millis`,
+            `cache_hit` or `num_dml_affected_rows`.
+    """
+
+    def __init__(self, rows: list[dict] | None = None, **statistics):
+        self.rows = rows or []
+        self.statistics = statistics
+
+
+class FakeJob:
+    """
+    FakeJob mimics the parts of BigQuery job objects used by gbq.
+
+    A job is running for `duration` seconds after it is created, then done.
+
+    Args:
+        client (FakeBigQueryClient):
+            Client that created the job.
+        job_type (str):
+            One of "query", "load" or "copy".
+        duration (float):
+            Number of seconds the job runs.
+        error (Optional[Exception]):
+            Exception raised by `result` once the job is done.
+    """
+
+    def __init__(
+        self,
+        client: "FakeBigQueryClient",
+        job_type: str,
+        duration: float = 0.0,
+        error: Exception | None = None,
+        **attributes,
+    ):
+        self._client = client
+        self.job_type = job_type
+        self.job_id = f"fake_{job_type}_{next(client._job_ids)}"
+        self.project = client.project
+        self.location = "US"
+        self.created = datetime.datetime.now(datetime.timezone.utc)
+        self.started = self.created
+        self.ended: datetime.datetime | None = None
+        self.cancelled = False
+        self.parent_job_id: str | None = None
+        self.query: str | None = None
+        self.job_config = None
+        self.destination: bigquery.TableReference | None = None
+        self.statement_type: str | None = None
+        self.total_bytes_processed = 0
+        self.total_bytes_billed = 0
+        self.slot_millis = 0
+        self.cache_hit = False
+        self.num_dml_affected_rows: int | None = None
+        self.output_rows: int | None = None
+        self.query_plan: list = []
+        self._error = error
+        self._error_reason = getattr(error, "reason", None)
+        self._done_at = time.monotonic() + duration
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+    @property
+    def state(self) -> str:
+        return "DONE" if self.done() else "RUNNING"
+
+    @property
+    def error_result(self) -> dict | None:
+        if not self.done() or self._error is None:
+            return None
+        return {
+            "reason": self._error_reason or "invalidQuery",
+            "message": str(self._error),
+        }
+
+    @property
+    def errors(self) -> list[dict] | None:
+        error_result = self.error_result
+        return [error_result] if error_result else None
+
+    def done(self, *args, **kwargs) -> bool:
+        if self.ended is None and time.monotonic() >= self._done_at:
+            self.ended = datetime.datetime.now(datetime.timezone.utc)
+        return self.ended is not None
+
+    def running(self) -> bool:
+        return not self.done()
+
+    def reload(self, *args, **kwargs):
+        self.done()
+
+    def cancel(self, *args, **kwargs) -> bool:
+        self._client.cancel_job(self.job_id)
+        return True
+
+    def _cancel(self):
+        if not self.done():
+            self.cancelled = True
+            self._error = BadRequest("Job execution was cancelled: User requested")
+            self._error_reason = "stopped"
+            self._done_at = time.monotonic()
+
+    def result(self, timeout: float | None = None, *args, **kwargs):
+        remaining = self._done_at - time.monotonic()
+        if remaining > 0:
+            if timeout is not None and timeout < remaining:
+                time.sleep(timeout)
+                raise TimeoutError(f"Job {self.job_id} is still running")
+            time.sleep(remaining)
+        self.done()
+        if self._error is not None:
+            raise self._error
+        if self.job_type == "query" and self.destination is not None:
+            return self._client.list_rows(self.destination)
+        return self
+
+
+class FakeRowIterator:
+    """
+    FakeRowIterator mimics `RowIterator`, rows are returned as `bigquery.Row` objects.
+    """
+
+    def __init__(self, schema: list[bigquery.SchemaField], rows: list[dict], page_size):
+        names = [field.name for field in schema] or list(
+            dict.fromkeys(name for row in rows for name in row)
+        )
+        field_to_index = {name: index for index, name in enumerate(names)}
+        self.schema = schema
+        self.total_rows = len(rows)
+        self._rows = [
+            bigquery.Row(tuple(row.get(name) for name in names), field_to_index)
+            for row in rows
+        ]
+        self._page_size = page_size or len(self._rows) or 1
+
+    @property
+    def pages(self) -> Iterator[list[bigquery.Row]]:
+        for start in range(0, len(self._rows), self._page_size):
+            yield self._rows[start : start + self._page_size]
+
+    def __iter__(self) -> Iterator[bigquery.Row]:
+        return iter(self._rows)
+
+
+class FakeBigQueryClient:
+    """
+    FakeBigQueryClient is an in-memory implementation of `bigquery.Client`.
+
+    Args:
+        project (str):
+            Default project of the client.
+        latency (Union[float, Dict[str, float]]):
+            Seconds every call sleeps, either for every method or per method name.
+        job_duration (float):
+            Seconds a job runs before it is done.
+        errors (Optional[Dict[str, Union[Exception, List[Optional[Exception]]]]]):
+            Exceptions raised by a method, a list is consumed one call at a time and
+            None entries let the call succeed.
+        error_rate (float):
+            Probability that any call raises ServiceUnavailable.
+        quota (Optional[Dict[str, int]]):
+            Maximum number of calls per method name, "*" limits every call. Calls
+            over quota raise Forbidden.
+        rate_limit (Optional[float]):
+            Maximum number of calls per second. Calls over the limit raise
+            TooManyRequests.
+        query_handler (Optional[Callable]):
+            Called with the query and its job config, returns a FakeQueryResult or a
+            list of rows. Exceptions it raises become job errors.
+        auto_create_datasets (bool):
+            Whether creating a table creates its dataset.
+        seed (int):
+            Seed of the random error injection.
+    """
+
+    def __init__(
+        self,
+        project: str = "project",
+        latency: float | dict[str, float] = 0.0,
+        job_duration: float = 0.0,
+        errors: dict[str, Exception | list[Exception | None]] | None = None,
+        error_rate: float = 0.0,
+        quota: dict[str, int] | None = None,
+        rate_limit: float | None = None,
+        query_handler: Callable | None = None,
+        auto_create_datasets: bool = True,
+        seed: int = 0,
+    ):
+        self.project = project
+        self.latency = latency
+        self.job_duration = job_duration
+        self.errors = dict(errors or {})
+        self.error_rate = error_rate
+        self.quota = dict(quota or {})
+        self.rate_limit = rate_limit
+        self.query_handler = query_handler
+        self.auto_create_datasets = auto_create_datasets
+
+        self.datasets: dict[str, dict] = {}
+        self.tables: dict[str, dict] = {}
+        self.rows: dict[str, list[dict]] = {}
+        self.routines: dict[str, dict] = {}
+        self.policies: dict[str, Policy] = {}
+        self.jobs: dict[str, FakeJob] = {}
+        self.calls: Counter = Counter()
+
+        self._random = random.Random(seed)  # noqa: S311
+        self._call_times: deque = deque()
+        self._job_ids = itertools.count(1)
+        self._lock = threading.RLock()
+
+    def _call(self, method: str):
+        """
+        Function applies the simulated latency, quota and errors of a method call.
+        """
+        with self._lock:
+            self.calls[method] += 1
+
+            for name in (method, "*"):
+                limit = self.quota.get(name)
+                used = self.calls[method] if name == method else self.calls.total()
+                if limit is not None and used > limit:
+                    raise Forbidden(f"Quota exceeded: {name} is limited to {limit}")
+
+            if self.rate_limit is not None:
+                now = time.monotonic()
+                while self._call_times and self._call_times[0] <= now - 1:
+                    self._call_times.popleft()
+                if len(self._call_times) >= self.rate_limit:
+                    raise TooManyRequests(f"Exceeded rate limits for {method}")
+                self._call_times.append(now)
+
+            error = self.errors.get(method)
+            if isinstance(error, list):
+                error = error.pop(0) if error else None
+            if (
+                error is None
+                and self.error_rate
+                and self._random.random() < self.error_rate
+            ):
+                error = ServiceUnavailable(f"Injected error in {method}")
+
+        latency = (
+            self.latency.get(method, 0.0)
+            if isinstance(self.latency, dict)
+            else self.latency
+        )
+        if latency:
+            time.sleep(latency)
+        if error is not None:
+            raise error
+
+    def _table_id(self, table) -> str:
+        if isinstance(table, str):
+            parts = table.replace(":", ".").split(".")
+            if len(parts) == 2:
+                parts.insert(0, self.project)
+            return ".".join(parts)
+        return f"{table.project}.{table.dataset_id}.{table.table_id}"
+
+    def _dataset_id(self, dataset) -> str:
+        if isinstance(dataset, str):
+            return dataset if "." in dataset else f"{self.project}.{dataset}"
+        return f"{dataset.project}.{dataset.dataset_id}"
+
+    def _require_table(self, table_id: str) -> dict:
+        resource = self.tables.get(table_id)
+        if resource is None:
+            raise NotFound(f"Not found: Table {table_id}")
+        return resource
+
+    def _get_table(self, table_id: str) -> bigquery.Table:
+        resource = copy.deepcopy(self._require_table(table_id))
+        resource["numRows"] = str(len(self.rows.get(table_id, [])))
+        return bigquery.Table.from_api_repr(resource)
+
+    def _store_table(self, table_id: str, resource: dict):
+        if resource.get("snapshotDefinition"):
+            resource["type"] = "SNAPSHOT"
+        elif resource.get("view"):
+            resource["type"] = "VIEW"
+        elif resource.get("materializedView"):
+            resource["type"] = "MATERIALIZED_VIEW"
+        else:
+            resource["type"] = "TABLE"
+        self.tables[table_id] = resource
+        self.rows.setdefault(table_id, [])
+
+    def _ensure_dataset(self, dataset_id: str):
+        if dataset_id in self.datasets:
+            return
+        if not self.auto_create_datasets:
+            raise NotFound(f"Not found: Dataset {dataset_id}")
+        project, dataset = dataset_id.split(".")
+        self.datasets[dataset_id] = {
+            "datasetReference": {"projectId": project, "datasetId": dataset}
+        }
+
+    # Datasets
+
+    def create_dataset(self, dataset, exists_ok: bool = False, **kwargs):
+        self._call("create_dataset")
+        dataset_id = self._dataset_id(dataset)
+        with self._lock:
+            if dataset_id in self.datasets and not exists_ok:
+                raise Conflict(f"Already Exists: Dataset {dataset_id}")
+            project, name = dataset_id.split(".")
+            self.datasets.setdefault(
+                dataset_id,
+                {"datasetReference": {"projectId": project, "datasetId": name}},
+            )
+        return bigquery.Dataset.from_api_repr(copy.deepcopy(self.datasets[dataset_id]))
+
+    def get_dataset(self, dataset_ref, **kwargs) -> bigquery.Dataset:
+        self._call("get_dataset")
+        dataset_id = self._dataset_id(dataset_ref)
+        with self._lock:
+            if dataset_id not in self.datasets:
+                raise NotFound(f"Not found: Dataset {dataset_id}")
+            return bigquery.Dataset.from_api_repr(
+                copy.deepcopy(self.datasets[dataset_id])
+            )
+
+    def delete_dataset(
+        self,
+        dataset,
+        delete_contents: bool = False,
+        not_found_ok: bool = False,
+        **kwargs,
+    ):
+        self._call("delete_dataset")
+        dataset_id = self._dataset_id(dataset)
+        with self._lock:
+            if dataset_id not in self.datasets:
+                if not_found_ok:
+                    return
+                raise NotFound(f"Not found: Dataset {dataset_id}")
+            contents = [
+                name
+                for name in itertools.chain(self.tables, self.routines)
+                if name.startswith(f"{dataset_id}.")
+            ]
+            if contents and not delete_contents:
+                raise BadRequest(f"Dataset {dataset_id} is still in use")
+            for name in contents:
+                self.tables.pop(name, None)
+                self.rows.pop(name, None)
+                self.routines.pop(name, None)
+            del self.datasets[dataset_id]
+
+    def list_datasets(self, project: str | None = None, **kwargs) -> Iterator:
+        self._call("list_datasets")
+        project = project or self.project
+        with self._lock:
+            resources = [
+                copy.deepcopy(resource)
+                for dataset_id, resource in sorted(self.datasets.items())
+                if dataset_id.split(".")[0] == project
+                and not dataset_id.endswith(ANONYMOUS_DATASET)
+            ]
+        return iter([DatasetListItem(resource) for resource in resources])
+
+    # Tables
+
+    def get_table(self, table, **kwargs) -> bigquery.Table:
+        self._call("get_table")
+        with self._lock:
+            return self._get_table(self._table_id(table))
+
+    def create_table(self, table, exists_ok: bool = False, **kwargs) -> bigquery.Table:
+        self._call("create_table")
+        if isinstance(table, str):
+            table = bigquery.Table(self._table_id(table))
+        table_id = self._table_id(table)
+        with self._lock:
+            self._ensure_dataset(table_id.rsplit(".", 1)[0])
+            if table_id in self.tables:
+                if exists_ok:
+                    return self._get_table(table_id)
+                raise Conflict(f"Already Exists: Table {table_id}")
+            # BigQuery does not return unset properties
+            resource = {
+                name: copy.deepcopy(value)
+                for name, value in table.to_api_repr().items()
+                if value is not None
+            }
+            resource["creationTime"] = str(int(time.time() * 1000))
+            self._store_table(table_id, resource)
+            return self._get_table(table_id)
+
+    def update_table(self, table, fields, **kwargs) -> bigquery.Table:
+        self._call("update_table")
+        table_id = self._table_id(table)
+        with self._lock:
+            resource = self._require_table(table_id)
+            for name, value in table._build_resource(fields).items():
+                if value is None:
+                    resource.pop(name, None)
+                else:
+                    resource[name] = copy.deepcopy(value)
+            self._store_table(table_id, resource)
+            return self._get_table(table_id)
+
+    def delete_table(self, table, not_found_ok: bool = False, **kwargs):
+        self._call("delete_table")
+        table_id = self._table_id(table)
+        if "$" in table_id:
+            # Partition decorators delete the rows of a single partition
+            table_id, partition_id = table_id.split("$", 1)
+            with self._lock:
+                resource = self._require_table(table_id)
+                self.rows[table_id] = [
+                    row
+                    for row in self.rows[table_id]
+                    if self._partition_id(resource, row) != partition_id
+                ]
+            return
+        with self._lock:
+            if table_id not in self.tables:
+                if not_found_ok:
+                    return
+                raise NotFound(f"Not found: Table {table_id}")
+            del self.tables[table_id]
+            self.rows.pop(table_id, None)
+            self.policies.pop(table_id, None)
+
+    def get_iam_policy(self, table, **kwargs) -> Policy:
+        self._call("get_iam_policy")
+        table_id = self._table_id(table)
+        with self._lock:
+            self._require_table(table_id)
+            policy = Policy()
+            policy.bindings = copy.deepcopy(
+                getattr(self.policies.get(table_id), "bindings", [])
+            )
+            return policy
+
+    def set_iam_policy(self, table, policy: Policy, **kwargs) -> Policy:
+        self._call("set_iam_policy")
+        table_id = self._table_id(table)
+        with self._lock:
+            self._require_table(table_id)
+            self.policies[table_id] = copy.deepcopy(policy)
+        return policy
+
+    @staticmethod
+    def _partitioning(resource: dict) -> tuple:
+        time_partitioning = resource.get("timePartitioning") or {}
+        return (
+            time_partitioning.get("type"),
+            time_partitioning.get("field"),
+            resource.get("rangePartitioning"),
+        )
+
+    @staticmethod
+    def _partition_id(resource: dict, row: dict) -> str:
+        time_partitioning = resource.get("timePartitioning")
+        range_partitioning = resource.get("rangePartitioning")
+        if time_partitioning:
+            value = row.get(time_partitioning.get("field", "_PARTITIONTIME"))
+            if value is None:
+                return "__NULL__"
+            if isinstance(value, str):
+                value = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+            formats = {"HOUR": "%Y%m%d%H", "MONTH": "%Y%m", "YEAR": "%Y"}
+            return value.strftime(formats.get(time_partitioning["type"], "%Y%m%d"))
+        if range_partitioning:
+            value = row.get(range_partitioning["field"])
+            if value is None:
+                return "__NULL__"
+            bounds = range_partitioning["range"]
+            start, end = int(bounds["start"]), int(bounds["end"])
+            interval = int(bounds["interval"])
+            if not start <= int(value) < end:
+                return "__UNPARTITIONED__"
+            return str(start + (int(value) - start) // interval * interval)
+        raise BadRequest("Partition decorators require a partitioned table")
+
+    def list_tables(self, dataset, **kwargs) -> Iterator:
+        self._call("list_tables")
+        dataset_id = self._dataset_id(dataset)
+        with self._lock:
+            if dataset_id not in self.datasets:
+                raise NotFound(f"Not found: Dataset {dataset_id}")
+            resources = [
+                copy.deepcopy(resource)
+                for table_id, resource in sorted(self.tables.items())
+                if table_id.rsplit(".", 1)[0] == dataset_id
+            ]
+        return iter([TableListItem(resource) for resource in resources])
+
+    # Rows
+
+    def insert_rows_json(self, table, json_rows, row_ids=None, **kwargs) -> list:
+        self._call("insert_rows_json")
+        table_id = self._table_id(table)
+        with self._lock:
+            resource = self._require_table(table_id)
+            schema = resource.get("schema", {}).get("fields", [])
+            validator = RowValidator(schema, allow_unknown_fields=not schema)
+            errors = []
+            for index, row in enumerate(json_rows):
+                row_errors = validator.validate(dict(row))
+                if row_errors:
+                    errors.append(
+                        {
+                            "index": index,
+                            "errors": [
+                                {"reason": "invalid", "message": message}
+                                for message in row_errors
+                            ],
+                        }
+                    )
+            if errors:
+                failed = {error["index"] for error in errors}
+                errors += [
+                    {"index": index, "errors": [{"reason": "stopped"}]}
+                    for index in range(len(json_rows))
+                    if index not in failed
+                ]
+                return sorted(errors, key=lambda error: error["index"])
+
+            self.rows[table_id].extend(dict(row) for row in json_rows)
+        return []
+
+    def list_rows(
+        self,
+        table,
+        selected_fields=None,
+        max_results: int | None = None,
+        start_index: int | None = None,
+        page_size: int | None = None,
+        **kwargs,
+    ) -> FakeRowIterator:
+        self._call("list_rows")
+        table_id = self._table_id(table)
+        with self._lock:
+            resource = self._require_table(table_id)
+            start = start_index or 0
+            end = None if max_results is None else start + max_results
+            rows = copy.deepcopy(self.rows[table_id][start:end])
+        schema = selected_fields or [
+            bigquery.SchemaField.from_api_repr(field)
+            for field in resource.get("schema", {}).get("fields", [])
+        ]
+        return FakeRowIterator(schema, rows, page_size)
+
+    def _append_rows(
+        self, table_id: str, rows: list[dict], job_config, schema=None
+    ) -> None:
+        if table_id not in self.tables:
+            self._ensure_dataset(table_id.rsplit(".", 1)[0])
+            table = bigquery.Table(table_id, schema=schema or None)
+            for name in (
+                "time_partitioning",
+                "range_partitioning",
+                "clustering_fields",
+            ):
+                value = getattr(job_config, name, None)
+                if value:
+                    setattr(table, name, value)
+            self._store_table(table_id, table.to_api_repr())
+        disposition = getattr(job_config, "write_disposition", None)
+        if disposition == bigquery.WriteDisposition.WRITE_TRUNCATE:
+            self.rows[table_id] = []
+        self.rows[table_id].extend(rows)
+
+    # Jobs
+
+    def _add_job(self, job: FakeJob) -> FakeJob:
+        with self._lock:
+            self.jobs[job.job_id] = job
+        return job
+
+    def query(
+        self, query: str, job_config=None, project: str | None = None, **kwargs
+    ) -> FakeJob:
+        self._call("query")
+        project = project or self.project
+        statements = split_script(query)
+        if len(statements) <= 1:
+            return self._add_job(self._run_query(query, job_config, project=project))
+
+        # Scripts run every statement as a child job until one of them fails
+        error = None
+        child_jobs = []
+        for line, statement in statements:
+            # Transaction control statements are not passed to the handler
+            child_job = self._run_query(
+                statement,
+                job_config,
+                handle=get_statement_kind(statement)
+                not in ("BEGIN", "COMMIT", "ROLLBACK"),
+                project=project,
+                script_statistics=ScriptStatistics(
+                    {
+                        "evaluationKind": "STATEMENT",
+                        "stackFrames": [{"startLine": line, "text": statement}],
+                    }
+                ),
+            )
+            child_jobs.append(child_job)
+            error = child_job._error
+            if error is not None:
+                break
+
+        job = FakeJob(
+            self,
+            "query",
+            duration=self.job_duration,
+            error=error,
+            query=query,
+            job_config=job_config,
+            statement_type="SCRIPT",
+            project=project,
+        )
+        self._add_job(job)
+        for child_job in child_jobs:
+            child_job.parent_job_id = job.job_id
+            self._add_job(child_job)
+        return job
+
+    def _run_query(
+        self, query: str, job_config=None, handle: bool = True, **attributes
+    ) -> FakeJob:
+        error = None
+        result = FakeQueryResult()
+        if handle and self.query_handler is not None:
+            try:
+                handled = self.query_handler(query, job_config)
+            except Exception as e:
+                error = e
+            else:
+                if isinstance(handled, FakeQueryResult):
+                    result = handled
+                elif handled is not None:
+                    result = FakeQueryResult(list(handled))
+
+        job = FakeJob(
+            self,
+            "query",
+            duration=self.job_duration,
+            error=error,
+            query=query,
+            job_config=job_config,
+            **{**result.statistics, **attributes},
+        )
+        if error is None:
+            destination = f"{job.project}.{ANONYMOUS_DATASET}.{job.job_id}"
+            with self._lock:
+                self._append_rows(destination, copy.deepcopy(result.rows), None)
+            job.destination = bigquery.TableReference.from_string(destination)
+        return job
+
+    def load_table_from_file(
+        self, file_obj, destination, job_config=None, **kwargs
+    ) -> FakeJob:
+        self._call("load_table_from_file")
+        data = file_obj.read()
+        if data[:2] == b"\x1f\x8b":
+            data = gzip.decompress(data)
+        source_format = getattr(job_config, "source_format", None)
+        if source_format == bigquery.SourceFormat.CSV:
+            lines = io.StringIO(data.decode())
+            reader: Iterator = csv.reader(lines)
+            for _ in range(job_config.skip_leading_rows or 0):
+                next(reader, None)
+            names = [field.name for field in job_config.schema or []]
+            rows = [dict(zip(names, values, strict=False)) for values in reader]
+        else:
+            rows = [json.loads(line) for line in data.splitlines() if line.strip()]
+
+        table_id = self._table_id(destination)
+        with self._lock:
+            self._append_rows(
+                table_id, rows, job_config, getattr(job_config, "schema", None)
+            )
+        job = FakeJob(
+            self,
+            "load",
+            duration=self.job_duration,
+            output_rows=len(rows),
+            destination=bigquery.TableReference.from_string(table_id),
+        )
+        return self._add_job(job)
+
+    def copy_table(
+        self,
+        sources,
+        destination,
+        job_config=None,
+        project: str | None = None,
+        **kwargs,
+    ) -> FakeJob:
+        self._call("copy_table")
+        if isinstance(sources, str) or not isinstance(sources, list | tuple):
+            sources = [sources]
+        destination_id = self._table_id(destination)
+        with self._lock:
+            resources = [self._require_table(self._table_id(s)) for s in sources]
+            rows = [
+                row for source in sources for row in self.rows[self._table_id(source)]
+            ]
+            operation = getattr(job_config, "operation_type", None)
+            if operation in ("SNAPSHOT", "CLONE") and destination_id in self.tables:
+                # Snapshots and clones always create their destination
+                raise Conflict(f"Already Exists: Table {destination_id}")
+            if destination_id in self.tables and self._partitioning(
+                self.tables[destination_id]
+            ) != self._partitioning(resources[0]):
+                # Like CREATE OR REPLACE TABLE, a copy keeps the partitioning of an
+                # existing destination
+                raise BadRequest(
+                    "Incompatible table partitioning specification, "
+                    f"{destination_id} is partitioned differently than its source"
+                )
+            if destination_id not in self.tables:
+                self._ensure_dataset(destination_id.rsplit(".", 1)[0])
+                resource = copy.deepcopy(resources[0])
+                project, dataset, table = destination_id.split(".")
+                resource["tableReference"] = {
+                    "projectId": project,
+                    "datasetId": dataset,
+                    "tableId": table,
+                }
+                if operation in ("SNAPSHOT", "CLONE"):
+                    definition = f"{operation.lower()}Definition"
+                    resource[definition] = {
+                        "baseTableReference": resources[0]["tableReference"]
+                    }
+                else:
+                    # A copy keeps the schema, partitioning and clustering only
+                    for key in (
+                        "labels",
+                        "description",
+                        "expirationTime",
+                        "requirePartitionFilter",
+                    ):
+                        resource.pop(key, None)
+                self._store_table(destination_id, resource)
+            self._append_rows(destination_id, copy.deepcopy(rows), job_config)
+        job = FakeJob(
+            self,
+            "copy",
+            duration=self.job_duration,
+            destination=bigquery.TableReference.from_string(destination_id),
+            project=project or self.project,
+        )
+        return self._add_job(job)
+
+    def get_job(self, job_id, **kwargs) -> FakeJob:
+        self._call("get_job")
+        job_id = getattr(job_id, "job_id", job_id)
+        with self._lock:
+            if job_id not in self.jobs:
+                raise NotFound(f"Not found: Job {job_id}")
+            return self.jobs[job_id]
+
+    def cancel_job(self, job_id, **kwargs) -> FakeJob:
+        self._call("cancel_job")
+        job_id = getattr(job_id, "job_id", job_id)
+        with self._lock:
+            if job_id not in self.jobs:
+                raise NotFound(f"Not found: Job {job_id}")
+            job = self.jobs[job_id]
+            job._cancel()
+        return job
+
+    def list_jobs(self, parent_job=None, **kwargs) -> Iterator[FakeJob]:
+        self._call("list_jobs")
+        parent_job_id = getattr(parent_job, "job_id", parent_job)
+        with self._lock:
+            jobs = [
+                job
+                for job in self.jobs.values()
+                if parent_job_id is None or job.parent_job_id == parent_job_id
+            ]
+        # BigQuery lists the most recent jobs first
+        return iter(reversed(jobs))
+
+    # Routines
+
+    def get_routine(self, routine_ref, **kwargs) -> bigquery.Routine:
+        self._call("get_routine")
+        routine_id = self._table_id(routine_ref)
+        with self._lock:
+            if routine_id not in self.routines:
+                raise NotFound(f"Not found: Routine {routine_id}")
+            return bigquery.Routine.from_api_repr(
+                copy.deepcopy(self.routines[routine_id])
+            )
+
+    def create_routine(
+        self, routine, exists_ok: bool = False, **kwargs
+    ) -> bigquery.Routine:
+        self._call("create_routine")
+        routine_id = str(routine.reference)
+        with self._lock:
+            self._ensure_dataset(routine_id.rsplit(".", 1)[0])
+            if routine_id in self.routines and not exists_ok:
+                raise Conflict(f"Already Exists: Routine {routine_id}")
+            self.routines[routine_id] = copy.deepcopy(routine.to_api_repr())
+            return bigquery.Routine.from_api_repr(
+                copy.deepcopy(self.routines[routine_id])
+            )
+
+    def update_routine(self, routine, fields, **kwargs) -> bigquery.Routine:
+        self._call("update_routine")
+        routine_id = str(routine.reference)
+        with self._lock:
+            if routine_id not in self.routines:
+                raise NotFound(f"Not found: Routine {routine_id}")
+            self.routines[routine_id].update(
+                copy.deepcopy(routine._build_resource(fields))
+            )
+            return bigquery.Routine.from_api_repr(
+                copy.deepcopy(self.routines[routine_id])
+            )
+
+    def delete_routine(self, routine, not_found_ok: bool = False, **kwargs):
+        self._call("delete_routine")
+        routine_id = self._table_id(
+            routine if isinstance(routine, str) else str(routine.reference)
+        )
+        with self._lock:
+            if routine_id not in self.routines:
+                if not_found_ok:
+                    return
+                raise NotFound(f"Not found: Routine {routine_id}")
+            del self.routines[routine_id]
+
+
+def fake_bigquery(project: str = "project", **kwargs) -> BigQuery:
+    """
+    Function returns a BigQuery object backed by a FakeBigQueryClient.
+
+    Args:
+        project (str):
+            Default project of the client.
+        kwargs:
+            Options of FakeBigQueryClient.
+
+    Returns:
+        BigQuery: An object of BigQuery.
+    """
+    client = FakeBigQueryClient(project=project, **kwargs)
+    return BigQuery(bq_client=client)  # type: ignore[arg-type]
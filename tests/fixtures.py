@@ -1,5 +1,6 @@
 import pytest
 
+from gbq.bigquery import BigQuery
 from gbq.dto import Structure
 
 
@@ -64,6 +65,17 @@ class Routine:
         self.body = body
 
 
+@pytest.fixture()
+def bq(mocker) -> BigQuery:
+    mocker.patch(
+        "gbq.helpers.service_account.Credentials.from_service_account_info"
+    ).return_value = '{"secret": "secret"}'
+    mock_client = mocker.patch("gbq.bigquery.bigquery.Client")
+    # Ensure the mock client has a project attribute for QueryJob compatibility
+    mock_client.return_value.project = "project"
+    return BigQuery('{"secret": "secret"}', "project")
+
+
 @pytest.fixture()
 def nested_json_schema():
     return [
@@ -0,0 +1,167 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gbq.accounting import RpcAccounting
+from gbq.exceptions import BudgetExceededException
+from gbq.instrumentation import HistogramInstrumentation
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+
+def test_rpc_run_counts_calls(nested_json_schema):
+    bq = fake_bigquery()
+    summaries = []
+    with bq.rpc_run("deploy", summary=summaries.append) as run:
+        bq.create_or_update_structure("project", "dataset", "a", nested_json_schema)
+        bq.create_or_update_structure("project", "dataset", "a", nested_json_schema)
+        bq.get_dataset_in_project("other")
+
+    assert bq.instrumentation is None
+    report = run.report()
+    assert report.name == "deploy"
+    assert report.calls == 5
+    assert [
+        (count.project, count.method, count.outcome, count.calls)
+        for count in report.counts
+    ] == [
+        ("other", "list_datasets", "ok", 1),
+        ("project", "create_table", "ok", 1),
+        ("project", "get_table", "NotFound", 1),
+        ("project", "get_table", "ok", 1),
+        ("project", "update_table", "ok", 1),
+    ]
+    assert summaries[0].startswith("RPC report for deploy: 5 calls, 0 bytes billed")
+    assert len(summaries[0].splitlines()) == 6
+
+
+def test_rpc_run_keeps_instrumentation(nested_json_schema):
+    bq = fake_bigquery()
+    histograms = HistogramInstrumentation()
+    bq.instrumentation = histograms
+
+    with bq.rpc_run() as run:
+        bq.create_or_update_structure("project", "dataset", "a", nested_json_schema)
+
+    assert bq.instrumentation is histograms
+    assert run.report().calls == 2
+    assert histograms.histograms()["rpc.create_table"].count == 1
+
+
+def test_rpc_run_call_budget(nested_json_schema):
+    bq = fake_bigquery()
+
+    with (
+        pytest.raises(BudgetExceededException, match="budget of 3 calls"),
+        bq.rpc_run(max_calls=3) as run,
+    ):
+        for index in range(10):
+            bq.create_or_update_structure(
+                "project", "dataset", f"t{index}", nested_json_schema
+            )
+
+    report = run.report()
+    assert report.calls == 3
+    assert sum(count.calls for count in report.counts) == 3
+    assert bq.bq_client.calls["create_table"] == 1
+
+
+def test_rpc_run_bytes_budget():
+    bq = fake_bigquery(
+        query_handler=lambda query, job_config: FakeQueryResult(
+            [], total_bytes_billed=600
+        )
+    )
+
+    with (
+        pytest.raises(BudgetExceededException, match="billed 1200 bytes"),
+        bq.rpc_run(max_bytes_billed=1000) as run,
+    ):
+        for _ in range(5):
+            bq.execute("SELECT 1")
+
+    assert run.report().bytes_billed == 1200
+    assert bq.bq_client.calls["query"] == 2
+
+
+def test_accounting_as_instrumentation():
+    accounting = RpcAccounting()
+    bq = fake_bigquery()
+    bq.instrumentation = accounting
+    bq.get_table_in_project("project")
+
+    assert accounting.report().calls == 1
+    assert accounting.report().counts[0].seconds >= 0
+
+
+def test_rpc_run_counts_job_polling_exports_and_streaming(tmp_path):
+    bq = fake_bigquery()
+    bq.create_or_update_structure(
+        "project", "dataset", "events", [{"name": "id", "type": "INTEGER"}]
+    )
+    bq.bq_client.insert_rows_json(
+        "project.dataset.events", [{"id": index} for index in range(5)]
+    )
+
+    with bq.rpc_run() as run:
+        bq.execute("SELECT 1")
+        bq.export_table(
+            "project", "dataset", "events", str(tmp_path), num_streams=1, page_size=2
+        )
+        with bq.streaming_writer("project", "dataset", flush_interval=60) as writer:
+            writer.write("events", [{"id": 5}])
+
+    calls = {count.method: count.calls for count in run.report().counts}
+    assert calls["job.done"] >= 1
+    assert calls["job.result"] == 1
+    # A request per page of up to 2 rows
+    assert calls["list_rows"] == 3
+    assert calls["insert_rows_json"] == 1
+
+
+def test_rpc_run_budget_stops_job_polling():
+    bq = fake_bigquery(job_duration=10)
+
+    with (
+        pytest.raises(BudgetExceededException, match="budget of 4 calls"),
+        bq.rpc_run(max_calls=4),
+    ):
+        bq.execute("SELECT 1")
+
+    job = next(iter(bq.bq_client.jobs.values()))
+    assert job.cancelled
+
+
+def test_concurrent_rpc_runs_are_separate():
+    bq = fake_bigquery()
+    barrier = threading.Barrier(2)
+
+    def run(calls: int) -> int:
+        with bq.rpc_run() as accounting:
+            barrier.wait()
+            for _ in range(calls):
+                bq.get_dataset_in_project("project")
+            barrier.wait()
+        return accounting.report().calls
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(run, [3, 5])) == [3, 5]
+    assert bq.instrumentation is None
+
+
+def test_rpc_run_counts_calls_per_target_project():
+    bq = fake_bigquery()
+    definitions = {"events": [{"name": "id", "type": "INTEGER"}]}
+
+    with bq.rpc_run() as run:
+        bq.deploy_structures(["p1.d1", "p2.d2"], definitions)
+        bq.execute("SELECT 1")
+
+    counts = {
+        (count.project, count.method): count.calls for count in run.report().counts
+    }
+    assert {project for project, _ in counts} == {"p1", "p2", "project"}
+    for project in ("p1", "p2"):
+        assert counts[(project, "get_table")] == 1
+        assert counts[(project, "create_table")] == 1
+    assert counts[("project", "query")] == 1
@@ -0,0 +1,134 @@
+import json
+
+from gbq.analyzer import JobHistoryAnalyzer, load_job_history, parse_query
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+events_schema = [
+    {"name": "event_ts", "type": "TIMESTAMP"},
+    {"name": "customer_id", "type": "STRING"},
+    {"name": "country", "type": "STRING"},
+    {"name": "payload", "type": "JSON"},
+]
+
+jobs = [
+    {
+        "project_id": "project",
+        "query": "SELECT * FROM `project.logs.events` "
+        "WHERE DATE(event_ts) >= '2024-01-01' AND customer_id = 'a'",
+        "total_bytes_processed": 1000,
+        "referenced_tables": [
+            {"project_id": "project", "dataset_id": "logs", "table_id": "events"}
+        ],
+    },
+    {
+        "project_id": "project",
+        "query": "SELECT e.country, c.name FROM logs.events AS e "
+        "JOIN logs.customers c ON e.customer_id = c.id "
+        "WHERE e.country IN ('FR', 'DE') AND c.tier = 1 AND payload IS NOT NULL",
+        "total_bytes_processed": 400,
+    },
+    {
+        "project_id": "project",
+        "query": "SELECT COUNT(*) FROM logs.events WHERE event_ts BETWEEN ? AND ?",
+        "total_bytes_processed": 600,
+    },
+]
+
+
+def test_parse_query():
+    tables, predicates = parse_query(
+        "SELECT * FROM d.t AS x JOIN `p.d.u` y USING (id) "
+        "WHERE x.a = 1 AND TIMESTAMP_TRUNC(y.ts, DAY) > '2024' "
+        "AND c LIKE 'x%' GROUP BY e HAVING f = 1",
+        default_project="p",
+    )
+
+    assert tables == {"t": "p.d.t", "x": "p.d.t", "u": "p.d.u", "y": "p.d.u"}
+    assert predicates == [
+        ("x", "a", "point"),
+        ("y", "ts", "range"),
+        (None, "c", "point"),
+    ]
+
+
+def test_usage():
+    analyzer = JobHistoryAnalyzer(default_project="project")
+    analyzer.add_jobs(jobs)
+    analyzer.add_jobs([{"query": None}, {"query": "SELECT 1"}])
+
+    usage = analyzer.usage()
+
+    assert sorted(usage) == ["project.logs.customers", "project.logs.events"]
+    columns = {column.column: column for column in usage["project.logs.events"]}
+    assert [column.column for column in usage["project.logs.events"]] == [
+        "event_ts",
+        "customer_id",
+        "country",
+    ]
+    assert (columns["event_ts"].jobs, columns["event_ts"].bytes) == (2, 1600)
+    assert (columns["event_ts"].range_jobs, columns["event_ts"].point_jobs) == (2, 0)
+    # The bytes of the join are split between its tables
+    assert columns["country"].bytes == 200
+    assert [column.column for column in usage["project.logs.customers"]] == ["tier"]
+
+
+def test_recommend_with_schema():
+    analyzer = JobHistoryAnalyzer(default_project="project")
+    analyzer.add_jobs(jobs)
+
+    recommendations = analyzer.recommend({"project.logs.events": events_schema})
+
+    events = recommendations[0]
+    assert events.table_id == "project.logs.events"
+    assert events.structure == {
+        "partition": {
+            "type": "time",
+            "definition": {"type": "DAY", "field": "event_ts"},
+        },
+        "clustering": ["customer_id", "country"],
+    }
+    assert (events.jobs, events.total_bytes) == (3, 1800)
+    # 1000 bytes scanned at 5%, 600 at 10% and 200 at 50%
+    assert events.estimated_savings_bytes == 950 + 540 + 100
+
+
+def test_recommend_without_schema():
+    analyzer = JobHistoryAnalyzer()
+    analyzer.add("SELECT * FROM p.d.t WHERE a = 1 AND b = 2 AND c = 3", 100)
+    analyzer.add("SELECT * FROM p.d.u", 100)
+
+    recommendations = analyzer.recommend(max_clustering_columns=2)
+
+    assert len(recommendations) == 1
+    assert recommendations[0].structure == {"clustering": ["a", "b"]}
+    assert recommendations[0].estimated_savings_bytes == 50
+
+
+def test_load_job_history(tmp_path):
+    path = tmp_path / "jobs.ndjson"
+    path.write_text("\n".join(json.dumps(job) for job in jobs) + "\n\n")
+
+    assert load_job_history(str(path)) == jobs
+
+
+def test_analyze_job_history():
+    def handler(query, job_config):
+        if "INFORMATION_SCHEMA.JOBS_BY_PROJECT" in query:
+            assert "`region-eu`" in query
+            assert job_config.query_parameters[0].value == 7
+            return FakeQueryResult(jobs)
+
+    bq = fake_bigquery(query_handler=handler)
+    bq.create_or_update_structure("project", "logs", "events", events_schema)
+
+    recommendations = bq.analyze_job_history("project", region="eu", days=7)
+
+    assert [recommendation.table_id for recommendation in recommendations] == [
+        "project.logs.events",
+        "project.logs.customers",
+    ]
+    assert recommendations[0].structure["partition"]["definition"]["field"] == (
+        "event_ts"
+    )
+    # The schema of the missing table is unknown
+    assert recommendations[1].structure == {"clustering": ["tier"]}
@@ -1,3 +1,6 @@
+import datetime
+
+import pydantic
 import pytest
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
@@ -15,7 +18,8 @@ from gbq.dto import (
     StructureType,
     TimeDefinition,
 )
-from gbq.exceptions import GbqException
+from gbq.exceptions import GbqException, InvalidDefinitionException
+from gbq.testing import fake_bigquery
 from tests.fixtures import (
     Routine,
     Table,
@@ -26,17 +30,6 @@ from tests.fixtures import (
 )
 
 
-@pytest.fixture()
-def bq(mocker) -> BigQuery:
-    mocker.patch(
-        "gbq.helpers.service_account.Credentials.from_service_account_info"
-    ).return_value = '{"secret": "secret"}'
-    mock_client = mocker.patch("gbq.bigquery.bigquery.Client")
-    # Ensure the mock client has a project attribute for QueryJob compatibility
-    mock_client.return_value.project = "project"
-    return BigQuery('{"secret": "secret"}', "project")
-
-
 @pytest.fixture()
 def table(mocker) -> Table:
     table = Table(
@@ -136,7 +129,7 @@ def test_create_or_update_structure_with_incorrect_partition(
     bq, nested_json_schema_with_incorrect_partition, table
 ):
     bq.bq_client.get_table.side_effect = NotFound("")
-    with pytest.raises(KeyError):
+    with pytest.raises(pydantic.ValidationError):
         bq.create_or_update_structure(
             "project",
             "dataset",
@@ -510,3 +503,54 @@ def test_structure_str_or_list_body():
     input_json = {"body": ["test", "test1", "test2"]}
     expected = Structure(**input_json)
     assert expected.body == "test\ntest1\ntest2"
+
+
+def test_structure_validate_type_materialized_view():
+    expected = Structure(**{"mview_query": "SELECT 1", "view_query": "SELECT 2"})
+    assert expected.type == StructureType.materialized_view
+
+
+def test_create_or_update_materialized_view():
+    bq = fake_bigquery()
+    mview = {
+        "mview_query": "SELECT day, COUNT(*) AS n FROM dataset.events GROUP BY day",
+        "enable_refresh": True,
+        "refresh_interval_ms": 1_800_000,
+        "max_staleness": "0-0 0 4:0:0",
+        "partition": {"type": "time", "definition": {"type": "DAY", "field": "day"}},
+        "clustering": ["day"],
+    }
+
+    created = bq.create_or_update_structure("project", "dataset", "daily", mview)
+    assert created.mview_query == mview["mview_query"]
+    assert created.mview_refresh_interval == datetime.timedelta(minutes=30)
+    assert created.time_partitioning.field == "day"
+    assert created.clustering_fields == ["day"]
+
+    bq.create_or_update_structure("project", "dataset", "daily", mview)
+    assert not bq.bq_client.calls["update_table"]
+
+    updated = bq.create_or_update_structure(
+        "project",
+        "dataset",
+        "daily",
+        {**mview, "enable_refresh": False, "max_staleness": "0-0 0 1:0:0"},
+    )
+    assert bq.bq_client.calls["update_table"] == 1
+    assert updated.mview_enable_refresh is False
+    table = bq.get_structure("project", "dataset", "daily")
+    assert table.table_type == "MATERIALIZED_VIEW"
+    assert table.max_staleness == "0-0 0 1:0:0"
+    assert table.mview_refresh_interval == datetime.timedelta(minutes=30)
+
+
+def test_materialized_view_query_cannot_be_updated():
+    bq = fake_bigquery()
+    bq.create_or_update_structure(
+        "project", "dataset", "daily", {"mview_query": "SELECT 1 AS x"}
+    )
+
+    with pytest.raises(InvalidDefinitionException, match="has to be recreated"):
+        bq.create_or_update_structure(
+            "project", "dataset", "daily", {"mview_query": "SELECT 2 AS x"}
+        )
@@ -0,0 +1,173 @@
+import datetime
+
+import pytest
+from google.cloud.bigquery import PolicyTagList, SchemaField
+
+from gbq.copying import get_structure_definition
+from gbq.exceptions import GbqException
+from gbq.journal import Journal
+from gbq.testing import fake_bigquery
+
+events = {
+    "schema": [
+        {"name": "day", "type": "DATE"},
+        {"name": "id", "type": "INTEGER", "mode": "REQUIRED"},
+        {
+            "name": "payload",
+            "type": "RECORD",
+            "fields": [{"name": "key", "type": "STRING"}],
+        },
+    ],
+    "partition": {
+        "type": "time",
+        "definition": {"type": "DAY", "field": "day", "expirationMs": "86400000"},
+    },
+    "clustering": ["id"],
+    "labels": {"team": "data"},
+    "description": "Events",
+}
+schema = [{"name": "id", "type": "INTEGER"}]
+
+
+def copying_bigquery():
+    bq = fake_bigquery()
+    client = bq.bq_client
+    bq.create_or_update_structure("project", "prod", "events", events)
+    bq.create_or_update_structure(
+        "project",
+        "prod",
+        "ranges",
+        {
+            "schema": schema,
+            "partition": {
+                "type": "range",
+                "definition": {
+                    "field": "id",
+                    "range": {"start": 0, "end": 100, "interval": 10},
+                },
+            },
+        },
+    )
+    bq.create_or_update_structure("project", "prod", "tmp_import", schema)
+    bq.create_or_update_structure(
+        "project", "prod", "recent", {"view_query": "SELECT 1 AS id"}
+    )
+    client.insert_rows_json("project.prod.events", [{"day": "2024-01-01", "id": 1}])
+    client.insert_rows_json("project.prod.ranges", [{"id": 1}, {"id": 2}])
+    return bq
+
+
+def test_get_structure_definition():
+    bq = copying_bigquery()
+
+    definition = get_structure_definition(bq.get_structure("project", "prod", "events"))
+
+    copy = bq.create_or_update_structure("project", "copy", "events", definition)
+    assert copy.schema == bq.get_structure("project", "prod", "events").schema
+    assert copy.time_partitioning.expiration_ms == 86_400_000
+    assert (copy.clustering_fields, copy.labels) == (["id"], {"team": "data"})
+
+
+def test_copy_tables():
+    bq = copying_bigquery()
+    client = bq.bq_client
+
+    reports = bq.copy_tables(
+        "project.prod", "staging.prod", exclude=["tmp_*"], max_workers=2
+    )
+
+    assert [(report.destination_id, report.status) for report in reports] == [
+        ("staging.prod.events", "done"),
+        ("staging.prod.ranges", "done"),
+    ]
+    assert client.rows["staging.prod.ranges"] == [{"id": 1}, {"id": 2}]
+    copy = client.get_table("staging.prod.ranges")
+    assert copy.range_partitioning.range_.interval == 10
+    assert "staging.prod.recent" not in client.tables
+
+    # Copies overwrite existing tables
+    bq.copy_tables("project.prod", "staging.prod", include=["ranges"])
+    assert client.rows["staging.prod.ranges"] == [{"id": 1}, {"id": 2}]
+
+
+def test_copy_tables_keeps_source_fields():
+    bq = copying_bigquery()
+    client = bq.bq_client
+    source = client.get_table("project.prod.tmp_import")
+    source.schema = [
+        *source.schema,
+        SchemaField(
+            "amount",
+            "NUMERIC",
+            precision=10,
+            scale=2,
+            default_value_expression="0",
+            policy_tags=PolicyTagList(
+                ["projects/p/locations/us/taxonomies/1/policyTags/2"]
+            ),
+        ),
+    ]
+    client.update_table(source, ["schema"])
+    client.project = "other"
+
+    reports = bq.copy_tables("project.prod", "staging.prod", include=["tmp_*"])
+
+    assert reports[0].status == "done"
+    assert client.get_table("staging.prod.tmp_import").schema == source.schema
+    assert {job.project for job in client.jobs.values()} == {"staging"}
+    assert client.project == "other"
+
+
+def test_copy_tables_resumes_from_journal(tmp_path):
+    bq = copying_bigquery()
+    path = str(tmp_path / "journal.db")
+    with Journal(path, run_id="refresh") as journal:
+        journal.record("copy project.prod staging.prod", "events", Journal.done)
+
+    with Journal(path, run_id="refresh") as journal:
+        reports = bq.copy_tables("project.prod", "staging.prod", journal=journal)
+
+        assert [report.status for report in reports] == ["resumed", "done", "done"]
+        assert "staging.prod.events" not in bq.bq_client.tables
+        assert set(journal.statuses("copy project.prod staging.prod").values()) == {
+            Journal.done
+        }
+
+
+def test_snapshot_tables():
+    bq = copying_bigquery()
+    expiration = datetime.datetime(2030, 1, 1, tzinfo=datetime.timezone.utc)
+
+    reports = bq.snapshot_tables(
+        "project.prod", "project.backup", include=["events"], expiration=expiration
+    )
+
+    assert reports[0].operation == "SNAPSHOT"
+    snapshot = bq.bq_client.get_table("project.backup.events")
+    assert snapshot.table_type == "SNAPSHOT"
+    assert bq.bq_client.rows["project.backup.events"] == [
+        {"day": "2024-01-01", "id": 1}
+    ]
+
+    # A snapshot of the source is not created again
+    reports = bq.snapshot_tables("project.prod", "project.backup", include=["events"])
+    assert reports[0].status == "resumed"
+    assert bq.bq_client.calls["copy_table"] == 1
+
+
+def test_clone_tables_failure():
+    bq = copying_bigquery()
+    bq.create_or_update_structure("project", "dev", "ranges", schema)
+
+    reports = bq.clone_tables("project.prod", "project.dev", include=["*s"])
+
+    statuses = {report.destination_id: report.status for report in reports}
+    assert statuses == {"project.dev.events": "done", "project.dev.ranges": "failed"}
+    assert "Already Exists" in reports[1].error
+
+
+def test_copy_tables_invalid_operation():
+    bq = copying_bigquery()
+
+    with pytest.raises(GbqException, match="Invalid operation MOVE"):
+        bq.copy_tables("project.prod", "project.dev", operation="move")
@@ -0,0 +1,115 @@
+import time
+from unittest import mock
+
+import pytest
+from google.api_core.exceptions import Forbidden
+
+from gbq.deploying import ProjectRateLimits, RateLimiter
+from gbq.exceptions import GbqException, InvalidDefinitionException
+from gbq.helpers import get_bq_schema_from_json_schema
+from gbq.testing import fake_bigquery
+
+definitions = {
+    "events": {
+        "schema": [{"name": "day", "type": "DATE"}, {"name": "id", "type": "INTEGER"}],
+        "partition": {"type": "time", "definition": {"type": "DAY", "field": "day"}},
+    },
+    "recent_events": {"view_query": "SELECT * FROM events WHERE day > '2024-01-01'"},
+}
+targets = ["eu-project.tenant_a", "eu-project.tenant_b", "us-project.tenant_c"]
+
+
+def test_rate_limiter_spaces_operations():
+    limiter = RateLimiter(rate=50)
+
+    started_at = time.monotonic()
+    waits = [limiter.acquire() for _ in range(4)]
+
+    assert waits[0] == 0
+    assert time.monotonic() - started_at >= 3 * 0.02 - 0.005
+    with pytest.raises(GbqException, match="Invalid rate 0"):
+        RateLimiter(rate=0)
+
+
+def test_project_rate_limits():
+    limits = ProjectRateLimits({"*": 1000, "slow": 50})
+
+    assert limits.acquire("other") == 0
+    assert limits.acquire("slow") == 0
+    assert limits.acquire("slow") > 0
+    assert ProjectRateLimits({}).acquire("project") == 0
+
+
+def test_deploy_structures():
+    bq = fake_bigquery()
+
+    with mock.patch(
+        "gbq.bigquery.get_bq_schema_from_json_schema",
+        wraps=get_bq_schema_from_json_schema,
+    ) as conversion:
+        outcomes = bq.deploy_structures(
+            targets, definitions, max_workers=3, rate_limits={"eu-project": 100}
+        )
+
+    assert conversion.call_count == 1
+    assert list(outcomes) == targets
+    assert {
+        (target, structure_id, outcome.status)
+        for target, results in outcomes.items()
+        for structure_id, outcome in results.items()
+    } == {
+        (target, structure_id, "done")
+        for target in targets
+        for structure_id in definitions
+    }
+    table = bq.bq_client.get_table("us-project.tenant_c.events")
+    assert table.time_partitioning.field == "day"
+    assert bq.bq_client.get_table("eu-project.tenant_b.recent_events").view_query
+
+    # Deploying again updates the structures
+    outcomes = bq.deploy_structures(targets[:1], definitions)
+    assert outcomes[targets[0]]["events"].status == "done"
+
+
+def test_deploy_structures_failures():
+    bq = fake_bigquery(errors={"create_table": [None, Forbidden("Access Denied")]})
+
+    outcomes = bq.deploy_structures(targets[:1], definitions)
+
+    outcome = outcomes[targets[0]]["recent_events"]
+    assert (outcome.status, outcome.error) == ("failed", "403 Access Denied")
+    assert outcomes[targets[0]]["events"].error is None
+
+
+def test_deploy_structures_validates_definitions_first():
+    bq = fake_bigquery()
+
+    with pytest.raises(InvalidDefinitionException, match="- broken: labels: "):
+        bq.deploy_structures(targets, {**definitions, "broken": {"labels": "team"}})
+
+    assert not bq.bq_client.calls["create_table"]
+
+
+def test_deploy_structures_bills_target_projects():
+    bq = fake_bigquery()
+    bq.deploy_structures(targets, {"events": definitions["events"]})
+
+    bq.deploy_structures(
+        targets,
+        {
+            "events": {
+                **definitions["events"],
+                "clustering": ["id"],
+                "search_indexes": [{"name": "events_index", "columns": ["id"]}],
+            }
+        },
+        allow_rebuild=True,
+    )
+
+    jobs = [job for job in bq.bq_client.jobs.values() if job.parent_job_id is None]
+    assert jobs
+    assert {job.project for job in jobs} == {"eu-project", "us-project"}
+    for job in jobs:
+        assert job.project in (job.query or job.destination.project)
+    # Workers never set the project of the shared client
+    assert bq.bq_client.project == "project"
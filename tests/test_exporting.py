@@ -0,0 +1,188 @@
+import datetime
+import json
+
+import pytest
+from google.cloud import bigquery
+from google.cloud.bigquery import SchemaField
+
+from gbq.exceptions import GbqException
+from gbq.exporting import export_stream, get_arrow_schema, plan_row_ranges
+
+SCHEMA = [SchemaField("id", "INTEGER"), SchemaField("day", "DATE")]
+
+
+def make_row(index: int) -> bigquery.Row:
+    return bigquery.Row(
+        (index, datetime.date(2020, 1, 1 + index % 28)), {"id": 0, "day": 1}
+    )
+
+
+def list_rows(table, selected_fields, start_index, max_results, page_size):
+    rows = [make_row(index) for index in range(start_index, start_index + max_results)]
+
+    class RowIterator:
+        pages = [rows[i : i + page_size] for i in range(0, len(rows), page_size)]
+
+    return RowIterator()
+
+
+@pytest.fixture()
+def exported_table(bq):
+    table = bigquery.Table("project.dataset.structure", schema=SCHEMA)
+    table._properties["numRows"] = "10"
+    bq.bq_client.get_table.return_value = table
+    bq.bq_client.list_rows.side_effect = list_rows
+    return table
+
+
+def read_ndjson(path) -> list[dict]:
+    with open(path) as source:
+        return [json.loads(line) for line in source]
+
+
+@pytest.mark.parametrize(
+    "num_rows, num_streams, min_rows, expected",
+    [
+        (10, 3, 1, [(0, 4), (4, 3), (7, 3)]),
+        (10, 3, 5, [(0, 5), (5, 5)]),
+        (0, 4, 1, [(0, 0)]),
+    ],
+)
+def test_plan_row_ranges(num_rows, num_streams, min_rows, expected):
+    assert plan_row_ranges(num_rows, num_streams, min_rows) == expected
+
+
+def test_export_stream_writes_pages(mocker, tmp_path):
+    client = mocker.Mock()
+    client.list_rows.side_effect = list_rows
+    table = bigquery.Table("project.dataset.structure", schema=SCHEMA)
+    path = tmp_path / "out.ndjson"
+
+    assert export_stream(client, table, (2, 5), str(path), "ndjson", 2) == 5
+    assert [row["id"] for row in read_ndjson(path)] == [2, 3, 4, 5, 6]
+    assert read_ndjson(path)[0]["day"] == "2020-01-03"
+
+
+def test_export_stream_empty_range(mocker, tmp_path):
+    client = mocker.Mock()
+    table = bigquery.Table("project.dataset.structure", schema=SCHEMA)
+    path = tmp_path / "out.ndjson"
+
+    assert export_stream(client, table, (0, 0), str(path), "ndjson", 2) == 0
+    client.list_rows.assert_not_called()
+
+
+def test_export_table_one_file_per_stream(bq, exported_table, tmp_path):
+    report = bq.export_table(
+        "project",
+        "dataset",
+        "structure",
+        str(tmp_path),
+        num_streams=3,
+        page_size=2,
+        min_rows_per_stream=1,
+    )
+
+    assert report.num_rows == 10
+    assert len(report.paths) == 3
+    assert report.paths[0].endswith("structure-00000.ndjson")
+    assert report.num_bytes == sum(
+        (tmp_path / path).stat().st_size for path in report.paths
+    )
+    assert bq.bq_client.list_rows.call_count == 3
+
+
+def test_export_table_single_file_keeps_order(bq, exported_table, tmp_path):
+    destination = str(tmp_path / "out" / "table.ndjson")
+    report = bq.export_table(
+        "project",
+        "dataset",
+        "structure",
+        destination,
+        num_streams=4,
+        single_file=True,
+        page_size=3,
+        min_rows_per_stream=1,
+        selected_fields=["id"],
+    )
+
+    assert report.paths == [destination]
+    assert [row["id"] for row in read_ndjson(destination)] == list(range(10))
+    assert list((tmp_path / "out").iterdir()) == [tmp_path / "out" / "table.ndjson"]
+    fields = bq.bq_client.list_rows.call_args.kwargs["selected_fields"]
+    assert [field.name for field in fields] == ["id"]
+
+
+def test_export_table_unsupported_format(bq, tmp_path):
+    with pytest.raises(GbqException):
+        bq.export_table("project", "dataset", "structure", str(tmp_path), "avro")
+
+
+def test_export_table_unknown_fields(bq, exported_table, tmp_path):
+    with pytest.raises(GbqException, match="Unknown fields"):
+        bq.export_table(
+            "project", "dataset", "structure", str(tmp_path), selected_fields=["x"]
+        )
+    bq.bq_client.list_rows.assert_not_called()
+
+
+def test_export_table_refuses_streaming_buffer(bq, exported_table, tmp_path):
+    exported_table._properties["streamingBuffer"] = {"estimatedRows": "3"}
+
+    with pytest.raises(GbqException, match="streaming buffer"):
+        bq.export_table("project", "dataset", "structure", str(tmp_path))
+    bq.bq_client.list_rows.assert_not_called()
+
+
+def test_export_query(bq, exported_table, mocker, tmp_path):
+    query_job = mocker.Mock()
+    query_job.destination = bigquery.TableReference.from_string("project.anon.tmp")
+    bq.bq_client.query.return_value = query_job
+
+    report = bq.export_query("SELECT 1", str(tmp_path))
+
+    assert report.num_rows == 10
+    bq.bq_client.get_table.assert_called_with("project.anon.tmp")
+
+
+def test_export_table_parquet(bq, exported_table, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    destination = str(tmp_path / "table.parquet")
+
+    report = bq.export_table(
+        "project",
+        "dataset",
+        "structure",
+        destination,
+        file_format="parquet",
+        single_file=True,
+        page_size=4,
+        min_rows_per_stream=1,
+    )
+
+    table = parquet.read_table(destination)
+    assert report.num_rows == table.num_rows == 10
+    assert table.column("id").to_pylist() == list(range(10))
+
+
+def test_get_arrow_schema():
+    pyarrow = pytest.importorskip("pyarrow")
+    schema = get_arrow_schema(
+        [
+            SchemaField("a", "NUMERIC"),
+            SchemaField("b", "BIGNUMERIC"),
+            SchemaField("c", "TIME"),
+            SchemaField("d", "DATETIME"),
+            SchemaField("e", "TIMESTAMP", mode="REQUIRED"),
+            SchemaField("f", "STRING", mode="REPEATED"),
+            SchemaField("g", "RECORD", fields=(SchemaField("h", "BOOLEAN"),)),
+        ]
+    )
+
+    assert schema.field("e").type == pyarrow.timestamp("us", tz="UTC")
+    assert not schema.field("e").nullable
+    assert schema.field("f").type == pyarrow.list_(pyarrow.string())
+    assert schema.field("g").type == pyarrow.struct([("h", pyarrow.bool_())])
+
+    with pytest.raises(GbqException):
+        get_arrow_schema([SchemaField("x", "INTERVAL")])
@@ -0,0 +1,265 @@
+import re
+
+import pytest
+
+from gbq.dto import IndexStatus, SearchIndex, VectorIndex
+from gbq.exceptions import GbqException
+from gbq.indexes import get_search_index_ddl, get_vector_index_ddl, plan_index_changes
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+index_pattern = re.compile(r"(CREATE|DROP) (SEARCH|VECTOR) INDEX `(\w+)`")
+columns_pattern = re.compile(r"ON `[^`]+`\(([^)]*)\)")
+option_pattern = re.compile(r"(\w+) = ('[^']*'|\[[^\]]*\])")
+
+structure = {
+    "schema": [
+        {"name": "message", "type": "STRING"},
+        {"name": "embedding", "type": "FLOAT64", "mode": "REPEATED"},
+    ],
+    "search_indexes": [{"name": "logs_search", "analyzer": "LOG_ANALYZER"}],
+    "vector_indexes": [
+        {
+            "name": "logs_vector",
+            "column": "embedding",
+            "distance_type": "COSINE",
+            "options": {"num_lists": 100},
+        }
+    ],
+}
+
+
+def index_catalog(coverage=100.0):
+    indexes = {}
+
+    def handler(query, job_config):
+        if "INFORMATION_SCHEMA" in query:
+            return FakeQueryResult(list(indexes.values()))
+        match = index_pattern.match(query)
+        if match:
+            action, kind, name = match.groups()
+            if action == "DROP":
+                del indexes[name]
+            else:
+                indexes[name] = {
+                    "kind": kind.lower(),
+                    "index_name": name,
+                    "index_status": "ACTIVE",
+                    "coverage_percentage": coverage,
+                    "ddl": query,
+                    **index_information(query),
+                }
+        return None
+
+    return indexes, handler
+
+
+def index_information(ddl):
+    """
+    Function returns the columns and options INFORMATION_SCHEMA lists for an index.
+    """
+    columns = columns_pattern.search(ddl).group(1).replace("`", "").split(", ")
+    if columns == ["ALL COLUMNS"]:
+        columns = ["message"]
+    options = []
+    for name, value in option_pattern.findall(ddl):
+        array = value.startswith("[")
+        options.append(
+            {
+                "option_name": name,
+                "option_type": "ARRAY<STRING>" if array else "STRING",
+                "option_value": value.replace("'", '"') if array else value[1:-1],
+            }
+        )
+    return {"columns": columns, "options": options}
+
+
+def test_search_index_ddl():
+    index = SearchIndex(name="i", columns=["a", "b"], data_types=["STRING", "INT64"])
+
+    assert get_search_index_ddl("p.d.t", index) == (
+        "CREATE SEARCH INDEX `i` ON `p.d.t`(`a`, `b`) "
+        "OPTIONS (data_types = ['STRING', 'INT64'])"
+    )
+    assert get_search_index_ddl("p.d.t", SearchIndex(name="i")) == (
+        "CREATE SEARCH INDEX `i` ON `p.d.t`(ALL COLUMNS)"
+    )
+
+
+def test_vector_index_ddl():
+    index = VectorIndex(
+        name="v",
+        column="embedding",
+        index_type="tree_ah",
+        options={"normalization_type": "L2"},
+        stored_columns=["id"],
+    )
+
+    assert get_vector_index_ddl("p.d.t", index) == (
+        "CREATE VECTOR INDEX `v` ON `p.d.t`(`embedding`) STORING(`id`) "
+        "OPTIONS (index_type = 'TREE_AH', "
+        'tree_ah_options = \'{"normalization_type": "L2"}\')'
+    )
+
+
+def test_plan_index_changes():
+    existing = [
+        IndexStatus(
+            name="a",
+            kind="search",
+            ddl="CREATE SEARCH INDEX `a`\n ON `p.d.t`(all\n columns);",
+            columns=["message"],
+            options={"analyzer": "LOG_ANALYZER", "data_types": ["STRING"]},
+        ),
+        IndexStatus(name="b", kind="search", columns=["message"], options={}),
+        IndexStatus(
+            name="v",
+            kind="vector",
+            columns=["embedding"],
+            options={"index_type": "IVF", "ivf_options": '{"num_lists": 10}'},
+        ),
+    ]
+
+    assert plan_index_changes(
+        "p.d.t",
+        existing,
+        search_indexes=[SearchIndex(name="a"), SearchIndex(name="c")],
+    ) == [
+        "DROP SEARCH INDEX `b` ON `p.d.t`",
+        "CREATE SEARCH INDEX `c` ON `p.d.t`(ALL COLUMNS)",
+    ]
+    assert plan_index_changes("p.d.t", existing, vector_indexes=[]) == [
+        "DROP VECTOR INDEX `v` ON `p.d.t`"
+    ]
+    assert plan_index_changes(
+        "p.d.t",
+        existing,
+        search_indexes=[
+            SearchIndex(name="a", columns=["message"]),
+            SearchIndex(name="b", columns=["message"]),
+        ],
+        vector_indexes=[
+            VectorIndex(name="v", column="embedding", options={"num_lists": 20})
+        ],
+    ) == [
+        "DROP SEARCH INDEX `a` ON `p.d.t`",
+        "DROP VECTOR INDEX `v` ON `p.d.t`",
+        "CREATE SEARCH INDEX `a` ON `p.d.t`(`message`)",
+        "CREATE VECTOR INDEX `v` ON `p.d.t`(`embedding`) "
+        "OPTIONS (index_type = 'IVF', ivf_options = '{\"num_lists\": 20}')",
+    ]
+
+
+def test_plan_index_changes_ignores_ddl_formatting():
+    existing = [
+        IndexStatus(
+            name="s",
+            kind="search",
+            ddl=(
+                "create search index s on p.d.t (message, id)\n"
+                "options(analyzer='NO_OP_ANALYZER', data_types=['STRING', 'INT64']);"
+            ),
+            columns=["id", "message"],
+            options={"analyzer": "NO_OP_ANALYZER", "data_types": ["STRING", "INT64"]},
+        ),
+        IndexStatus(
+            name="v",
+            kind="vector",
+            ddl=(
+                "CREATE VECTOR INDEX v ON `p`.`d`.`t` (embedding)\n"
+                "STORING (id)\nOPTIONS (distance_type='COSINE', index_type='IVF',\n"
+                "ivf_options='{\"num_lists\":100}')"
+            ),
+            columns=["embedding"],
+            options={
+                "index_type": "IVF",
+                "distance_type": "COSINE",
+                "ivf_options": '{"num_lists":100}',
+            },
+        ),
+    ]
+
+    assert (
+        plan_index_changes(
+            "p.d.t",
+            existing,
+            search_indexes=[
+                SearchIndex(
+                    name="s",
+                    columns=["message", "id"],
+                    analyzer="NO_OP_ANALYZER",
+                    data_types=["STRING", "INT64"],
+                )
+            ],
+            vector_indexes=[
+                VectorIndex(
+                    name="v",
+                    column="embedding",
+                    distance_type="COSINE",
+                    options={"num_lists": 100},
+                    stored_columns=["id"],
+                )
+            ],
+        )
+        == []
+    )
+
+
+def test_create_or_update_structure_indexes():
+    indexes, handler = index_catalog()
+    bq = fake_bigquery(query_handler=handler)
+
+    bq.create_or_update_structure("project", "dataset", "logs", structure)
+    assert sorted(indexes) == ["logs_search", "logs_vector"]
+
+    scripts = bq.bq_client.calls["query"]
+    bq.create_or_update_structure("project", "dataset", "logs", structure)
+    # Unchanged indexes are only listed
+    assert bq.bq_client.calls["query"] == scripts + 1
+
+    bq.create_or_update_structure(
+        "project",
+        "dataset",
+        "logs",
+        {
+            **structure,
+            "search_indexes": [{"name": "logs_search", "analyzer": "NO_OP_ANALYZER"}],
+            "vector_indexes": [],
+        },
+    )
+    assert list(indexes) == ["logs_search"]
+    assert "NO_OP_ANALYZER" in indexes["logs_search"]["ddl"]
+
+
+def test_indexes_left_unmanaged():
+    indexes, handler = index_catalog()
+    bq = fake_bigquery(query_handler=handler)
+    bq.create_or_update_structure("project", "dataset", "logs", structure)
+
+    bq.create_or_update_structure(
+        "project", "dataset", "logs", {"schema": structure["schema"]}
+    )
+
+    assert len(indexes) == 2
+
+
+def test_failed_index_change_raises():
+    def handler(query, job_config):
+        if query.startswith("CREATE"):
+            raise ValueError("Search index is not supported")
+
+    bq = fake_bigquery(query_handler=handler)
+
+    with pytest.raises(GbqException, match="is not supported"):
+        bq.create_or_update_structure("project", "dataset", "logs", structure)
+
+
+def test_wait_for_indexes():
+    indexes, handler = index_catalog(coverage=50.0)
+    bq = fake_bigquery(query_handler=handler)
+    bq.create_or_update_structure("project", "dataset", "logs", structure)
+
+    with pytest.raises(GbqException, match="did not reach 100.0% coverage"):
+        bq.wait_for_indexes("project", "dataset", "logs", timeout=0.02, interval=0.01)
+
+    statuses = bq.wait_for_indexes("project", "dataset", "logs", min_coverage=50)
+    assert {status.coverage_percentage for status in statuses} == {50.0}
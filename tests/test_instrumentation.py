@@ -0,0 +1,246 @@
+import logging
+
+import pytest
+from google.api_core.exceptions import NotFound
+
+from gbq.accounting import RpcAccounting
+from gbq.bigquery import BigQuery
+from gbq.exceptions import BudgetExceededException
+from gbq.instrumentation import (
+    CompositeInstrumentation,
+    HistogramInstrumentation,
+    Instrumentation,
+    LoggingInstrumentation,
+    OpenTelemetryInstrumentation,
+    Span,
+    current_span,
+)
+from gbq.testing import FakeBigQueryClient
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span.path)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+
+@pytest.fixture()
+def recorder():
+    return RecordingInstrumentation()
+
+
+@pytest.fixture()
+def instrumented_bq(recorder):
+    return BigQuery(bq_client=FakeBigQueryClient(), instrumentation=recorder)  # type: ignore[arg-type]
+
+
+def test_create_table_spans(instrumented_bq, recorder, nested_json_schema):
+    instrumented_bq.create_or_update_structure(
+        "project", "dataset", "table", nested_json_schema
+    )
+
+    assert [span.path for span in recorder.ended] == [
+        "create_or_update_structure/parse",
+        "create_or_update_structure/get_table",
+        "create_or_update_structure/schema_conversion",
+        "create_or_update_structure/create_table",
+        "create_or_update_structure",
+    ]
+    assert recorder.started[0] == "create_or_update_structure"
+    get_table = recorder.ended[1]
+    assert get_table.kind == "rpc"
+    assert get_table.outcome == "NotFound"
+    assert isinstance(get_table.error, NotFound)
+    assert {
+        (span.project, span.dataset, span.structure) for span in recorder.ended
+    } == {("project", "dataset", "table")}
+    assert recorder.ended[-1].outcome == "ok"
+    assert all(span.duration >= 0 for span in recorder.ended)
+    assert current_span.get() is None
+
+
+def test_query_span_bytes(recorder):
+    client = FakeBigQueryClient()
+    bq = BigQuery(bq_client=client, instrumentation=recorder)  # type: ignore[arg-type]
+    bq.execute("SELECT 1")
+
+    assert [span.path for span in recorder.ended] == [
+        "execute/query",
+        "execute/job_wait/job.done",
+        "execute/job_wait/job.result",
+        "execute/job_wait",
+        "execute",
+    ]
+    job_wait = recorder.ended[3]
+    assert job_wait.bytes == 0
+
+
+def test_spans_propagate_to_workers(recorder, tmp_path):
+    bq = BigQuery(bq_client=FakeBigQueryClient(), instrumentation=recorder)  # type: ignore[arg-type]
+    path = tmp_path / "rows.json"
+    path.write_text('{"id": 1}\n')
+    bq.load_files(
+        "project",
+        "dataset",
+        "table",
+        [str(path)],
+        json_schema=[{"name": "id", "type": "INTEGER"}],
+    )
+    bq.export_table("project", "dataset", "table", str(tmp_path / "export"))
+
+    paths = [span.path for span in recorder.ended]
+    assert "load_files/upload/load_table_from_file" in paths
+    assert "load_files/job_wait" in paths
+    assert "export_table/export_stream" in paths
+    upload = recorder.ended[paths.index("load_files/upload")]
+    assert upload.bytes > 0
+    assert upload.structure == "table"
+
+
+def test_disabled_instrumentation(bq):
+    assert bq.instrumentation is None
+    with bq._span("phase", "parse") as span:
+        assert span is None
+
+
+def test_histogram_instrumentation(nested_json_schema):
+    histograms = HistogramInstrumentation(bucket_bounds=(0.5, 1.0))
+    bq = BigQuery(bq_client=FakeBigQueryClient(), instrumentation=histograms)  # type: ignore[arg-type]
+    for _ in range(3):
+        bq.create_or_update_structure("project", "dataset", "table", nested_json_schema)
+
+    result = histograms.histograms()
+    assert result["rpc.get_table"].count == 3
+    assert result["rpc.get_table"].errors == 1
+    assert result["rpc.create_table"].count == 1
+    assert result["rpc.update_table"].count == 2
+    operation = result["operation.create_or_update_structure"]
+    assert operation.bucket_counts == [3, 0, 0]
+    assert operation.quantile(0.99) == 0.5
+    assert operation.mean_seconds == operation.total_seconds / 3
+
+    histograms.reset()
+    assert histograms.histograms() == {}
+
+
+def test_histogram_quantiles():
+    histograms = HistogramInstrumentation(bucket_bounds=(1.0,))
+    span = Span("rpc", "get_table")
+    histograms.on_end(span)
+    span.duration = 3.0
+    histograms.on_end(span)
+
+    histogram = histograms.histograms()["rpc.get_table"]
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(1.0) == 3.0
+    assert histogram.min_seconds == 0.0
+    histograms.reset()
+    histograms.on_end(span)
+    assert histograms.histograms()["rpc.get_table"].quantile(0.5) == 3.0
+
+
+def test_logging_instrumentation(caplog, recorder):
+    logger = logging.getLogger("gbq.test")
+    instrumentation = CompositeInstrumentation(
+        LoggingInstrumentation(logger, logging.INFO, kinds=("rpc",)), recorder
+    )
+    bq = BigQuery(bq_client=FakeBigQueryClient(), instrumentation=instrumentation)  # type: ignore[arg-type]
+
+    with caplog.at_level(logging.INFO, logger="gbq.test"):
+        bq.get_dataset_in_project("project")
+    assert len(caplog.records) == 1
+    assert (
+        caplog.records[0]
+        .getMessage()
+        .startswith(
+            "rpc get_dataset_in_project/list_datasets project=project dataset=None"
+        )
+    )
+    assert recorder.started == [
+        "get_dataset_in_project",
+        "get_dataset_in_project/list_datasets",
+    ]
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger="gbq.test"):
+        bq.get_dataset_in_project("project")
+    assert not caplog.records
+
+
+class FakeOtelSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exited_with = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+
+class FakeOtelScope:
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.span = FakeOtelSpan(name, attributes)
+
+    def __enter__(self):
+        self.tracer.spans.append(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span.exited_with = exc_type
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_as_current_span(self, name, attributes):
+        return FakeOtelScope(self, name, attributes)
+
+
+def test_open_telemetry_instrumentation():
+    tracer = FakeTracer()
+    bq = BigQuery(
+        bq_client=FakeBigQueryClient(),  # type: ignore[arg-type]
+        instrumentation=OpenTelemetryInstrumentation(tracer),
+    )
+    assert not bq.delete_table_or_view("project", "dataset", "table")
+
+    operation, get_structure, get_table = tracer.spans
+    assert operation.name == "gbq.delete_table_or_view"
+    assert operation.attributes == {
+        "gbq.kind": "operation",
+        "gbq.project": "project",
+        "gbq.dataset": "dataset",
+        "gbq.structure": "table",
+        "gbq.outcome": "ok",
+    }
+    assert operation.exited_with is None
+    assert get_table.exited_with is NotFound
+    assert get_structure.attributes["gbq.outcome"] == "NotFound"
+
+    bq.execute("SELECT 1")
+    job_wait = [span for span in tracer.spans if span.name == "gbq.job_wait"]
+    assert job_wait[-1].attributes["gbq.bytes"] == 0
+
+
+def test_failed_span_start_ends_span():
+    tracer = FakeTracer()
+    bq = BigQuery(
+        bq_client=FakeBigQueryClient(),  # type: ignore[arg-type]
+        instrumentation=CompositeInstrumentation(
+            RpcAccounting(max_calls=0), OpenTelemetryInstrumentation(tracer)
+        ),
+    )
+    with pytest.raises(BudgetExceededException):
+        bq.get_dataset_in_project("project")
+
+    (operation,) = tracer.spans
+    assert operation.exited_with is BudgetExceededException
+    assert current_span.get() is None
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from gbq.bigquery import BigQuery
+from gbq.exceptions import JobCancelledException, JobTimeoutException
+from gbq.jobs import wait_for_job
+from gbq.testing import FakeBigQueryClient, FakeQueryResult
+
+
+class CountingClient(FakeBigQueryClient):
+    def query(self, *args, **kwargs):
+        job = super().query(*args, **kwargs)
+        done = job.done
+
+        def counting_done(*args, **kwargs):
+            self.calls["done"] += 1
+            return done(*args, **kwargs)
+
+        job.done = counting_done
+        return job
+
+
+def test_wait_for_job_backs_off():
+    client = CountingClient(job_duration=0.3)
+    job = client.query("SELECT 1")
+
+    wait_for_job(job, initial_interval=0.01, multiplier=2)
+
+    assert job.done()
+    # 0.01 + 0.02 + 0.04 + 0.08 + 0.16 >= 0.3
+    assert client.calls["done"] <= 8
+    assert not client.calls["cancel_job"]
+
+
+def test_wait_for_job_max_interval():
+    client = CountingClient(job_duration=0.2)
+    job = client.query("SELECT 1")
+
+    wait_for_job(job, initial_interval=0.01, max_interval=0.01)
+
+    assert client.calls["done"] >= 10
+
+
+def test_wait_for_job_timeout_cancels_job():
+    client = FakeBigQueryClient(job_duration=10)
+    job = client.query("SELECT 1")
+
+    started_at = time.monotonic()
+    with pytest.raises(JobTimeoutException, match="within 0.1s"):
+        wait_for_job(job, timeout=0.1)
+
+    assert time.monotonic() - started_at < 1
+    assert job.cancelled
+    assert client.calls["cancel_job"] == 1
+
+
+def test_wait_for_job_cancel_event():
+    client = FakeBigQueryClient(job_duration=10)
+    job = client.query("SELECT 1")
+    cancel_event = threading.Event()
+    threading.Timer(0.05, cancel_event.set).start()
+
+    with pytest.raises(JobCancelledException):
+        wait_for_job(job, cancel_event=cancel_event, initial_interval=5)
+
+    assert job.cancelled
+
+
+def test_wait_for_job_interrupted():
+    client = FakeBigQueryClient(job_duration=10)
+    job = client.query("SELECT 1")
+
+    class InterruptedEvent(threading.Event):
+        def wait(self, timeout=None):
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        wait_for_job(job, cancel_event=InterruptedEvent())
+
+    assert job.cancelled
+
+
+def test_execute_timeout():
+    bq = BigQuery(bq_client=FakeBigQueryClient(job_duration=10), job_timeout=60)  # type: ignore[arg-type]
+
+    with pytest.raises(JobTimeoutException):
+        bq.execute("SELECT 1", timeout=0.05)
+
+    bq.job_timeout = 0.05
+    with pytest.raises(JobTimeoutException):
+        bq.execute("SELECT 1")
+    assert bq.bq_client.calls["cancel_job"] == 2
+
+    # Options are keyword-only, a positional timeout is not taken for parameters
+    with pytest.raises(TypeError):
+        bq.execute("SELECT 1", 30)  # type: ignore[misc]
+
+
+def test_execute_async():
+    client = FakeBigQueryClient(
+        query_handler=lambda query, job_config: FakeQueryResult([{"x": 1}])
+    )
+    bq = BigQuery(bq_client=client)  # type: ignore[arg-type]
+
+    query_job = asyncio.run(bq.execute_async("SELECT 1 AS x"))
+
+    assert [dict(row.items()) for row in query_job.result()] == [{"x": 1}]
+
+
+def test_execute_async_cancelled():
+    client = FakeBigQueryClient(job_duration=10)
+    bq = BigQuery(bq_client=client)  # type: ignore[arg-type]
+
+    async def cancel():
+        task = asyncio.create_task(bq.execute_async("SELECT 1"))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+
+    deadline = time.monotonic() + 2
+    while not client.calls["cancel_job"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.calls["cancel_job"] == 1
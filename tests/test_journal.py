@@ -0,0 +1,72 @@
+import threading
+
+from google.api_core.exceptions import Forbidden
+
+from gbq.journal import Journal
+from gbq.testing import fake_bigquery
+
+definitions = {
+    "events": [{"name": "id", "type": "INTEGER"}],
+    "recent_events": {"view_query": "SELECT * FROM events"},
+}
+
+
+def test_journal_start_and_record(tmp_path):
+    path = str(tmp_path / "journal.db")
+
+    with Journal(path, run_id="run") as journal:
+        assert journal.start("copy", ["a", "b", "c"]) == ["a", "b", "c"]
+        journal.record("copy", "a", Journal.done)
+        journal.record("copy", "b", Journal.failed, "403 Access Denied")
+
+    with Journal(path, run_id="run") as journal:
+        assert journal.statuses("copy") == {
+            "a": Journal.done,
+            "b": Journal.failed,
+            "c": Journal.pending,
+        }
+        assert journal.start("copy", ["a", "b", "c", "d"]) == ["b", "c", "d"]
+        assert journal.statuses("copy")["d"] == Journal.pending
+        assert journal.statuses("delete") == {}
+
+    # Other runs and operations start from scratch
+    with Journal(path, run_id="other") as journal:
+        assert journal.start("copy", ["a"]) == ["a"]
+
+
+def test_journal_records_from_threads(tmp_path):
+    with Journal(str(tmp_path / "journal.db"), run_id="run") as journal:
+        items = [str(index) for index in range(50)]
+        threads = [
+            threading.Thread(target=journal.record, args=("copy", item, Journal.done))
+            for item in items
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert journal.start("copy", items) == []
+
+
+def test_deploy_structures_resumes_from_journal(tmp_path):
+    bq = fake_bigquery(errors={"create_table": [None, Forbidden("Access Denied")]})
+    targets = ["project.tenant_a"]
+    path = str(tmp_path / "journal.db")
+
+    with Journal(path, run_id="deploy-1") as journal:
+        outcomes = bq.deploy_structures(targets, definitions, journal=journal)
+    assert outcomes["project.tenant_a"]["recent_events"].status == "failed"
+
+    with Journal(path, run_id="deploy-1") as journal:
+        outcomes = bq.deploy_structures(targets, definitions, journal=journal)
+
+        assert {
+            structure_id: outcome.status
+            for structure_id, outcome in outcomes["project.tenant_a"].items()
+        } == {"events": "resumed", "recent_events": "done"}
+        assert journal.statuses("deploy") == {
+            "project.tenant_a.events": Journal.done,
+            "project.tenant_a.recent_events": Journal.done,
+        }
+    assert bq.bq_client.calls["create_table"] == 3
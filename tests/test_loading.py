@@ -0,0 +1,178 @@
+import gzip
+
+import pytest
+from google.cloud import bigquery
+
+from gbq.exceptions import GbqException
+from gbq.loading import LoadChunk, get_source_format, plan_load_chunks
+
+
+def write_lines(path, count: int, prefix: str = "") -> str:
+    path.write_text(prefix + "".join(f'{{"id": {index}}}\n' for index in range(count)))
+    return str(path)
+
+
+def read_chunk(chunk: LoadChunk, compress: bool = False) -> bytes:
+    with chunk.open(compress=compress) as file_obj:
+        data = file_obj.read()
+    return gzip.decompress(data) if compress else data
+
+
+@pytest.mark.parametrize(
+    "paths, expected",
+    [
+        (["a.json", "b.NDJSON"], bigquery.SourceFormat.NEWLINE_DELIMITED_JSON),
+        (["a.csv"], bigquery.SourceFormat.CSV),
+        (["a.parquet"], bigquery.SourceFormat.PARQUET),
+    ],
+)
+def test_get_source_format(paths, expected):
+    assert get_source_format(paths) == expected
+
+
+@pytest.mark.parametrize("paths", [["a.csv", "b.json"], ["a.txt"]])
+def test_get_source_format_invalid(paths):
+    with pytest.raises(GbqException):
+        get_source_format(paths)
+
+
+def test_plan_groups_small_files(tmp_path):
+    paths = [write_lines(tmp_path / f"{index}.json", 2) for index in range(3)]
+    chunks = plan_load_chunks(paths, bigquery.SourceFormat.NEWLINE_DELIMITED_JSON, 1000)
+
+    assert len(chunks) == 1
+    assert chunks[0].paths == paths
+    assert read_chunk(chunks[0]).count(b"\n") == 6
+
+
+def test_plan_splits_large_files_on_lines(tmp_path):
+    path = write_lines(tmp_path / "big.json", 100)
+    chunks = plan_load_chunks([path], bigquery.SourceFormat.NEWLINE_DELIMITED_JSON, 100)
+
+    assert len(chunks) > 1
+    assert all(chunk.size >= 100 for chunk in chunks[:-1])
+    content = b"".join(read_chunk(chunk) for chunk in chunks)
+    with open(path, "rb") as source:
+        assert content == source.read()
+
+
+def test_plan_does_not_split_when_disabled(tmp_path):
+    path = write_lines(tmp_path / "big.csv", 100)
+    chunks = plan_load_chunks([path], bigquery.SourceFormat.CSV, 100, split_files=False)
+    assert len(chunks) == 1
+
+
+def test_plan_csv_header_written_once_per_chunk(tmp_path):
+    paths = [
+        write_lines(tmp_path / f"{index}.csv", 2, prefix="header\n")
+        for index in range(2)
+    ]
+    chunks = plan_load_chunks(
+        paths, bigquery.SourceFormat.CSV, 1000, skip_leading_rows=1
+    )
+
+    content = read_chunk(chunks[0])
+    assert content.startswith(b"header\n")
+    assert content.count(b"header") == 1
+    assert content.count(b"\n") == 5
+
+
+def test_plan_parquet_one_chunk_per_file(tmp_path):
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"{index}.parquet"
+        path.write_bytes(b"PAR1")
+        paths.append(str(path))
+
+    chunks = plan_load_chunks(paths, bigquery.SourceFormat.PARQUET, 1)
+    assert [chunk.paths for chunk in chunks] == [[paths[0]], [paths[1]]]
+
+
+def test_chunk_adds_missing_trailing_newline(tmp_path):
+    first = tmp_path / "a.json"
+    first.write_text('{"id": 1}')
+    second = write_lines(tmp_path / "b.json", 1)
+    chunks = plan_load_chunks(
+        [str(first), second], bigquery.SourceFormat.NEWLINE_DELIMITED_JSON, 1000
+    )
+    assert read_chunk(chunks[0], compress=True) == b'{"id": 1}\n{"id": 0}\n'
+
+
+def test_load_files(bq, tmp_path, nested_json_schema_with_partition_and_clustering):
+    paths = [write_lines(tmp_path / f"{index}.json", 50) for index in range(3)]
+    load_job = bq.bq_client.load_table_from_file.return_value
+    load_job.job_id = "job"
+    load_job.output_rows = 50
+
+    reports = bq.load_files(
+        "project",
+        "dataset",
+        "structure",
+        paths,
+        json_schema=nested_json_schema_with_partition_and_clustering,
+        target_bytes=400,
+    )
+
+    assert len(reports) == bq.bq_client.load_table_from_file.call_count
+    assert sum(report.input_bytes for report in reports) == sum(
+        (tmp_path / f"{index}.json").stat().st_size for index in range(3)
+    )
+    assert all(report.bytes_per_second > 0 for report in reports)
+
+    args, kwargs = bq.bq_client.load_table_from_file.call_args
+    assert args[1] == "project.dataset.structure"
+    job_config = kwargs["job_config"]
+    assert job_config.write_disposition == bigquery.WriteDisposition.WRITE_APPEND
+    assert job_config.time_partitioning == bigquery.TimePartitioning(type_="DAY")
+    assert job_config.clustering_fields == ["id"]
+    assert [field.name for field in job_config.schema] == ["id", "username", "address"]
+
+
+def test_load_files_range_partitioned(bq, tmp_path):
+    path = write_lines(tmp_path / "a.json", 2)
+    bq.bq_client.load_table_from_file.return_value.job_id = "job"
+
+    bq.load_files(
+        "project",
+        "dataset",
+        "structure",
+        [path],
+        json_schema={
+            "schema": [{"name": "id", "type": "INTEGER"}],
+            "partition": {
+                "type": "range",
+                "definition": {
+                    "field": "id",
+                    "range": {"start": 0, "end": 100, "interval": 10},
+                },
+            },
+        },
+    )
+
+    job_config = bq.bq_client.load_table_from_file.call_args.kwargs["job_config"]
+    assert job_config.time_partitioning is None
+    assert job_config.range_partitioning.field == "id"
+    assert job_config.range_partitioning.range_.interval == 10
+
+
+def test_load_files_csv_without_definition(bq, tmp_path):
+    path = write_lines(tmp_path / "a.csv", 2, prefix="header\n")
+    bq.bq_client.load_table_from_file.return_value.output_rows = None
+    bq.bq_client.load_table_from_file.return_value.job_id = "job"
+
+    reports = bq.load_files(
+        "project", "dataset", "structure", [path], skip_leading_rows=1
+    )
+
+    job_config = bq.bq_client.load_table_from_file.call_args.kwargs["job_config"]
+    assert job_config.skip_leading_rows == 1
+    assert job_config.schema is None
+    assert reports[0].output_rows == 0
+
+
+def test_load_files_job_error(bq, tmp_path):
+    path = write_lines(tmp_path / "a.json", 2)
+    bq.bq_client.load_table_from_file.return_value.result.side_effect = ValueError
+
+    with pytest.raises(GbqException):
+        bq.load_files("project", "dataset", "structure", [path])
@@ -0,0 +1,168 @@
+import datetime
+
+import pytest
+
+from gbq.exceptions import GbqException
+from gbq.merging import build_merge
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+target = {
+    "schema": [
+        {"name": "day", "type": "DATE"},
+        {"name": "id", "type": "INTEGER"},
+        {"name": "value", "type": "STRING"},
+        {"name": "updated_at", "type": "TIMESTAMP"},
+    ],
+    "partition": {"type": "time", "definition": {"type": "DAY", "field": "day"}},
+}
+staging = [
+    {"name": "day", "type": "DATE"},
+    {"name": "id", "type": "INTEGER"},
+    {"name": "value", "type": "STRING"},
+]
+
+
+def merging_bigquery(partitions):
+    """
+    Returns a fake BigQuery returning the partitions of the staging data, and the
+    statements it ran with their parameters.
+    """
+    statements = []
+
+    def handler(query, job_config):
+        if "GROUP BY partition_key" in query:
+            return FakeQueryResult(partitions, total_bytes_processed=10)
+        parameters = {
+            parameter.name: parameter.value
+            for parameter in (job_config.query_parameters if job_config else [])
+        }
+        statements.append((query, parameters))
+        return FakeQueryResult(num_dml_affected_rows=2, total_bytes_processed=100)
+
+    bq = fake_bigquery(query_handler=handler)
+    bq.create_or_update_structure("project", "dataset", "target", target)
+    bq.create_or_update_structure("project", "dataset", "staging", staging)
+    return bq, statements
+
+
+def partition(day, row_count=1):
+    value = datetime.date(2024, 1, day) if day else None
+    return {
+        "partition_key": value,
+        "min_value": value,
+        "max_value": value,
+        "row_count": row_count,
+    }
+
+
+def test_build_merge():
+    statement = build_merge(
+        "p.d.target", "p.d.staging", ["id", "day", "value"], ["id"], ["value"]
+    )
+
+    assert statement == (
+        "MERGE `p.d.target` AS T USING `p.d.staging` AS S ON T.`id` = S.`id`\n"
+        "WHEN MATCHED THEN UPDATE SET `value` = S.`value`\n"
+        "WHEN NOT MATCHED THEN INSERT (`id`, `day`, `value`) "
+        "VALUES (S.`id`, S.`day`, S.`value`)"
+    )
+
+
+def test_build_merge_of_a_partition():
+    statement = build_merge(
+        "p.d.target",
+        "p.d.staging",
+        ["id", "day"],
+        ["id", "day"],
+        partition_column="day",
+        bounded=True,
+        nulls=True,
+        filter_staging=True,
+    )
+
+    assert statement.splitlines() == [
+        "MERGE `p.d.target` AS T USING (SELECT * FROM `p.d.staging` AS P WHERE "
+        "(P.`day` BETWEEN @min_value AND @max_value OR P.`day` IS NULL)) AS S "
+        "ON T.`id` = S.`id` AND T.`day` = S.`day` "
+        "AND (T.`day` BETWEEN @min_value AND @max_value OR T.`day` IS NULL)",
+        "WHEN NOT MATCHED THEN INSERT (`id`, `day`) VALUES (S.`id`, S.`day`)",
+    ]
+
+
+def test_upsert_prunes_target_partitions():
+    bq, statements = merging_bigquery([partition(3), partition(1), partition(2)])
+
+    report = bq.upsert("project", "dataset", "staging", "target", ["id"])
+
+    [(statement, parameters)] = statements
+    assert "AND T.`day` BETWEEN @min_value AND @max_value\n" in statement
+    assert "`updated_at`" not in statement
+    assert parameters == {
+        "min_value": datetime.date(2024, 1, 1),
+        "max_value": datetime.date(2024, 1, 3),
+    }
+    assert (report.table_id, report.jobs, report.partitions) == (
+        "project.dataset.target",
+        2,
+        3,
+    )
+    assert (report.rows, report.bytes_processed) == (2, 110)
+
+
+def test_upsert_with_null_partition():
+    bq, statements = merging_bigquery([partition(None), partition(1)])
+
+    bq.upsert("project", "dataset", "dataset.staging", "target", ["id"])
+
+    [(statement, _)] = statements
+    assert "(T.`day` BETWEEN @min_value AND @max_value OR T.`day` IS NULL)" in (
+        statement
+    )
+
+
+def test_upsert_split_per_partition():
+    bq, statements = merging_bigquery(
+        [partition(None), partition(1, 10), partition(2, 10)]
+    )
+
+    report = bq.upsert("project", "dataset", "staging", "target", ["id"], split_rows=10)
+
+    assert report.jobs == 4
+    assert report.rows == 6
+    statements.sort(key=lambda statement: (bool(statement[1]), str(statement[1])))
+    assert "WHERE P.`day` IS NULL" in statements[0][0]
+    assert statements[0][1] == {}
+    assert [parameters for _, parameters in statements[1:]] == [
+        {
+            "min_value": datetime.date(2024, 1, day),
+            "max_value": datetime.date(2024, 1, day),
+        }
+        for day in (1, 2)
+    ]
+
+
+def test_upsert_of_empty_staging():
+    bq, statements = merging_bigquery([])
+
+    report = bq.upsert("project", "dataset", "staging", "target", ["id"])
+
+    assert not statements
+    assert (report.jobs, report.rows) == (1, 0)
+
+
+def test_upsert_unpartitioned_target():
+    bq, statements = merging_bigquery([])
+    bq.create_or_update_structure("project", "dataset", "plain", staging)
+
+    bq.upsert("project", "dataset", "staging", "plain", ["id", "day"])
+
+    [(statement, parameters)] = statements
+    assert "ON T.`id` = S.`id` AND T.`day` = S.`day`\n" in statement
+    assert parameters == {}
+
+
+def test_upsert_missing_keys():
+    bq, _ = merging_bigquery([])
+
+    with pytest.raises(GbqException, match=r"Keys missing .*\['updated_at'\]"):
+        bq.upsert("project", "dataset", "staging", "target", ["updated_at"])
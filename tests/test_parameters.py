@@ -0,0 +1,150 @@
+import datetime
+import decimal
+
+import pytest
+from google.cloud import bigquery
+
+from gbq.exceptions import GbqException
+from gbq.parameters import QueryTemplate, QueryTemplateCache, get_scalar_type
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (True, "BOOL"),
+        (1, "INT64"),
+        (1.5, "FLOAT64"),
+        (decimal.Decimal("1.5"), "NUMERIC"),
+        ("a", "STRING"),
+        (b"a", "BYTES"),
+        (datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc), "TIMESTAMP"),
+        (datetime.datetime(2024, 1, 1), "DATETIME"),
+        (datetime.date(2024, 1, 1), "DATE"),
+        (datetime.time(1, 2), "TIME"),
+        (object(), None),
+    ],
+)
+def test_get_scalar_type(value, expected):
+    assert get_scalar_type(value) == expected
+
+
+def test_named_parameters():
+    query = (
+        "SELECT * FROM t WHERE id = @id AND tags IN UNNEST(@tags) AND s = @@project_id"
+    )
+    template = QueryTemplate(
+        query, {"id": 1, "tags": ["a"], "address": {"city": "Boston", "zip": [2110]}}
+    )
+    parameters = template.bind(
+        {"id": 2, "tags": ["b", "c"], "address": {"city": "NYC", "zip": [10001]}}
+    )
+
+    assert [parameter.to_api_repr() for parameter in parameters] == [
+        bigquery.ScalarQueryParameter("id", "INT64", 2).to_api_repr(),
+        bigquery.ArrayQueryParameter("tags", "STRING", ["b", "c"]).to_api_repr(),
+        bigquery.StructQueryParameter(
+            "address",
+            bigquery.ScalarQueryParameter("city", "STRING", "NYC"),
+            bigquery.ArrayQueryParameter("zip", "INT64", [10001]),
+        ).to_api_repr(),
+    ]
+
+
+def test_positional_parameters():
+    template = QueryTemplate(
+        "SELECT '?', `a?` FROM t WHERE id = ? -- ?\n AND day = ?",
+        [1, datetime.date(2024, 1, 1)],
+    )
+    first, second = template.bind([None, datetime.date(2024, 1, 2)])
+
+    assert first.name is None
+    assert first.type_ == "INT64"
+    assert first.value is None
+    assert second.type_ == "DATE"
+
+
+def test_array_of_structs():
+    template = QueryTemplate("SELECT @rows", {"rows": [{"a": 1}, {"a": 2}]})
+    (parameter,) = template.bind({"rows": [{"a": 3}]})
+
+    assert parameter.to_api_repr()["parameterType"] == {
+        "type": "ARRAY",
+        "arrayType": {
+            "type": "STRUCT",
+            "structTypes": [{"name": "a", "type": {"type": "INT64"}}],
+        },
+    }
+    assert parameter.to_api_repr()["parameterValue"] == {
+        "arrayValues": [{"structValues": {"a": {"value": "3"}}}]
+    }
+
+
+def test_mismatched_values_are_inferred_again():
+    template = QueryTemplate("SELECT @x, @y, @z", {"x": 1, "y": [1], "z": {"a": 1}})
+    x, y, z = template.bind({"x": 1.5, "y": ["a"], "z": {"b": "c"}})
+
+    assert x.type_ == "FLOAT64"
+    assert y.array_type == "STRING"
+    assert z.struct_types == {"b": "STRING"}
+    assert template.bind({"x": 2, "y": [2], "z": {"a": 2}})[0].type_ == "INT64"
+
+
+def test_query_parameter_objects():
+    parameter = bigquery.ScalarQueryParameter("x", "STRING", None)
+    template = QueryTemplate("SELECT @x", {"x": parameter})
+
+    assert template.bind({"x": parameter}) == [parameter]
+    assert template.bind({"x": 1})[0].type_ == "INT64"
+
+
+@pytest.mark.parametrize(
+    "query, parameters, message",
+    [
+        ("SELECT @x, @y", {"x": 1}, "Missing query parameters y"),
+        ("SELECT ?", [1, 2], "1 positional parameters, 2 given"),
+        ("SELECT @x", {"x": None}, "from None"),
+        ("SELECT @x", {"x": []}, "empty ARRAY parameter x"),
+        ("SELECT @x", {"x": {}}, "empty STRUCT parameter x"),
+        ("SELECT @x", {"x": [[1]]}, "cannot contain arrays"),
+        (
+            "SELECT @x",
+            {"x": {"a": object()}},
+            "Unsupported type object of parameter x.a",
+        ),
+    ],
+)
+def test_invalid_parameters(query, parameters, message):
+    with pytest.raises(GbqException, match=message):
+        QueryTemplate(query, parameters)
+
+
+def test_template_cache():
+    cache = QueryTemplateCache(maxsize=2)
+    first = cache.get("SELECT @x", {"x": 1})
+
+    assert cache.get("SELECT @x", {"x": 2}) is first
+    assert cache.get("SELECT ?", [1]) is not first
+    cache.get("SELECT ?, ?", [1, 2])
+    assert cache.get("SELECT @x", {"x": 3}) is not first
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_execute_with_parameters():
+    job_configs = []
+
+    def handler(query, job_config):
+        job_configs.append(job_config)
+        return FakeQueryResult([{"x": 1}])
+
+    bq = fake_bigquery(query_handler=handler)
+    bq.execute("SELECT @x AS x", parameters={"x": 1})
+    bq.execute("SELECT @x AS x", parameters={"x": 2})
+    bq.execute("SELECT 1 AS x")
+
+    assert [
+        [parameter.value for parameter in job_config.query_parameters]
+        for job_config in job_configs[:2]
+    ] == [[1], [2]]
+    assert job_configs[2] is None
+    assert bq.query_templates.hits == 1
@@ -0,0 +1,73 @@
+import copy
+
+import pytest
+
+from gbq.dto import PartitionType, StructureType, TimeType
+from gbq.exceptions import GbqException, InvalidDefinitionException
+from gbq.parsing import parse_structures
+
+definitions = [
+    [{"name": "id", "type": "INTEGER"}],
+    {
+        "schema": [{"name": "day", "type": "DATE"}],
+        "partition": {"type": "TIME", "definition": {"type": "day", "field": "day"}},
+    },
+    {"view_query": "SELECT 1"},
+    {
+        "body": ["SELECT 1;", "SELECT 2;"],
+        "arguments": [{"name": "a", "data_type": "int64"}],
+    },
+]
+
+
+def test_parse_structures():
+    original = copy.deepcopy(definitions)
+
+    structures = parse_structures(definitions)
+
+    assert definitions == original
+    assert structures[0].table_schema == [{"name": "id", "type": "INTEGER"}]
+    assert structures[0].type == StructureType.table
+    assert structures[1].partition.type == PartitionType.time
+    assert structures[1].partition.definition.type == TimeType.DAY
+    assert structures[2].type == StructureType.view
+    assert structures[3].type == StructureType.stored_procedure
+    assert structures[3].body == "SELECT 1;\nSELECT 2;"
+    assert parse_structures([]) == []
+
+
+def test_parse_structures_reports_every_definition():
+    with pytest.raises(InvalidDefinitionException) as error:
+        parse_structures(
+            [
+                *definitions,
+                {"labels": "team"},
+                {"partition": {"type": "time", "definition": {"type": "WEEK"}}},
+            ],
+            ids=["a", "b", "c", "d", "e", "f"],
+        )
+
+    lines = str(error.value).splitlines()
+    assert lines[0] == "Invalid definitions:"
+    assert lines[1].startswith("- e: labels: Input should be a valid dictionary")
+    assert {line.split(":")[0] for line in lines[1:]} == {"- e", "- f"}
+    assert "partition.definition.TimeDefinition.type" in lines[2]
+
+
+def test_parse_structures_in_processes():
+    corpus = [[{"name": f"c{index}", "type": "STRING"}] for index in range(50)]
+    corpus[42] = {"labels": "team"}
+
+    with pytest.raises(InvalidDefinitionException, match="- 42: labels: "):
+        parse_structures(corpus, processes=2, chunk_size=10)
+
+    corpus[42] = definitions[0]
+    structures = parse_structures(corpus, processes=2, chunk_size=10)
+    assert structures == parse_structures(corpus)
+
+
+def test_parse_structures_invalid_arguments():
+    with pytest.raises(GbqException, match="Got 1 IDs for 4 definitions"):
+        parse_structures(definitions, ids=["a"])
+    with pytest.raises(GbqException, match="Invalid chunk size 0"):
+        parse_structures(definitions, chunk_size=0)
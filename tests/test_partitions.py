@@ -0,0 +1,137 @@
+import pytest
+
+from gbq.dto import PartitionInfo
+from gbq.exceptions import GbqException, InvalidDefinitionException
+from gbq.partitions import select_partitions
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+events = {
+    "schema": [
+        {"name": "day", "type": "DATE"},
+        {"name": "id", "type": "INTEGER"},
+    ],
+    "partition": {"type": "time", "definition": {"type": "DAY", "field": "day"}},
+    "require_partition_filter": True,
+}
+
+
+def partitions_bigquery():
+    partitions = [
+        {
+            "partition_id": partition_id,
+            "total_rows": 1,
+            "total_logical_bytes": 16,
+            "total_billable_bytes": 16,
+            "last_modified_time": None,
+            "storage_tier": "ACTIVE",
+        }
+        for partition_id in ["20240101", "20240102", "20240103", "__NULL__"]
+    ]
+
+    def handler(query, job_config):
+        if "INFORMATION_SCHEMA.PARTITIONS" in query:
+            return FakeQueryResult(partitions)
+
+    bq = fake_bigquery(query_handler=handler)
+    bq.create_or_update_structure("project", "dataset", "events", events)
+    bq.bq_client.insert_rows_json(
+        "project.dataset.events",
+        [
+            {"day": "2024-01-01", "id": 1},
+            {"day": "2024-01-02", "id": 2},
+            {"day": "2024-01-03", "id": 3},
+            {"day": None, "id": 4},
+        ],
+    )
+    return bq
+
+
+def remaining_ids(bq):
+    return [row["id"] for row in bq.bq_client.rows["project.dataset.events"]]
+
+
+def test_select_partitions():
+    partitions = [
+        PartitionInfo(partition_id=partition_id)
+        for partition_id in ["30", "__UNPARTITIONED__", "10", "20", "0"]
+    ]
+
+    assert select_partitions(partitions, start="10") == ["10", "20", "30"]
+    assert select_partitions(partitions, end="10") == ["0", "10"]
+    assert select_partitions(partitions) == ["0", "10", "20", "30"]
+
+
+def test_list_partitions():
+    bq = partitions_bigquery()
+
+    bq.bq_client.project = "other"
+
+    partitions = bq.list_partitions("project", "dataset", "events")
+
+    assert [partition.partition_id for partition in partitions][:2] == [
+        "20240101",
+        "20240102",
+    ]
+    assert partitions[0].total_rows == 1
+    # The query runs in the project of the table, whatever the client last used
+    query_jobs = [job for job in bq.bq_client.jobs.values() if job.query]
+    assert [job.project for job in query_jobs] == ["project"]
+    assert bq.bq_client.project == "other"
+
+
+def test_delete_partitions_range():
+    bq = partitions_bigquery()
+
+    deleted = bq.delete_partitions(
+        "project", "dataset", "events", start="20240102", max_workers=2
+    )
+
+    assert deleted == ["20240102", "20240103"]
+    assert remaining_ids(bq) == [1, 4]
+    assert bq.bq_client.calls["delete_table"] == 2
+
+
+def test_delete_partitions_by_id():
+    bq = partitions_bigquery()
+
+    bq.delete_partitions("project", "dataset", "events", ["20240101", "__NULL__"])
+
+    assert remaining_ids(bq) == [2, 3]
+    assert bq.get_structure("project", "dataset", "events")
+
+
+def test_delete_partitions_requires_selection():
+    bq = partitions_bigquery()
+
+    with pytest.raises(GbqException, match="Either partition_ids"):
+        bq.delete_partitions("project", "dataset", "events")
+
+
+def test_set_partition_expiration():
+    bq = partitions_bigquery()
+
+    table = bq.set_partition_expiration("project", "dataset", "events", 86_400_000)
+
+    assert table.time_partitioning.expiration_ms == 86_400_000
+    bq.create_or_update_structure("project", "dataset", "unpartitioned", [])
+    with pytest.raises(InvalidDefinitionException, match="not partitioned by time"):
+        bq.set_partition_expiration("project", "dataset", "unpartitioned", None)
+
+
+def test_require_partition_filter_and_expiration_are_updated():
+    bq = partitions_bigquery()
+    assert bq.get_structure("project", "dataset", "events").require_partition_filter
+
+    definition = {
+        **events,
+        "partition": {
+            "type": "time",
+            "definition": {"type": "DAY", "field": "day", "expirationMs": "3600000"},
+        },
+        "require_partition_filter": False,
+    }
+    bq.create_or_update_structure("project", "dataset", "events", definition)
+
+    table = bq.get_structure("project", "dataset", "events")
+    assert table.require_partition_filter is False
+    assert table.time_partitioning.expiration_ms == 3_600_000
@@ -0,0 +1,202 @@
+import datetime
+
+import pytest
+from google.api_core.exceptions import BadRequest
+from google.cloud import bigquery
+from google.cloud.bigquery.job import ScriptStatistics
+
+from gbq.dto import Argument
+from gbq.exceptions import GbqException
+from gbq.procedures import bind_arguments, get_procedure_arguments
+from gbq.scripting import build_script, map_script_results
+from gbq.testing import FakeBigQueryClient, FakeJob, FakeQueryResult, fake_bigquery
+
+procedure = {
+    "body": "INSERT INTO dataset.events (day, tags) VALUES (day, tags);",
+    "arguments": [
+        {"name": "day", "data_type": "DATE"},
+        {"name": "tags", "data_type": "ARRAY"},
+    ],
+}
+
+
+def recording_bigquery(failing=None):
+    calls = []
+
+    def handler(query, job_config):
+        calls.append((query, job_config))
+        if failing and failing in query:
+            raise BadRequest(f"Query error: {failing} failed")
+        return FakeQueryResult(statement_type="CALL")
+
+    bq = fake_bigquery(query_handler=handler)
+    bq.create_or_update_structure("project", "dataset", "add_event", procedure)
+    return bq, calls
+
+
+def test_bind_arguments():
+    arguments = [
+        Argument(name="day", data_type="DATE"),
+        Argument(name="tags", data_type="ARRAY"),
+    ]
+
+    day, tags = bind_arguments(arguments, {"day": None, "tags": ["a"]}, prefix="c0_")
+
+    assert (day.name, day.type_, day.value) == ("c0_day", "DATE", None)
+    assert (tags.name, tags.array_type, tags.values) == ("c0_tags", "STRING", ["a"])
+    assert bind_arguments(arguments, [None, ["a"]]) == bind_arguments(
+        arguments, {"day": None, "tags": ["a"]}
+    )
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ({"day": None}, "Missing procedure arguments tags"),
+        ({"day": None, "tags": [1], "x": 1}, "Unknown procedure arguments x"),
+        ([None], "Procedure has 2 arguments, 1 given"),
+    ],
+)
+def test_bind_invalid_arguments(args, message):
+    arguments = [
+        Argument(name="day", data_type="DATE"),
+        Argument(name="tags", data_type="ARRAY"),
+    ]
+
+    with pytest.raises(GbqException, match=message):
+        bind_arguments(arguments, args)
+
+
+def test_bind_query_parameter_is_renamed():
+    parameter = bigquery.ScalarQueryParameter("x", "DATE", None)
+
+    (bound,) = bind_arguments(
+        [Argument(name="day", data_type="DATE")], [parameter], prefix="c1_"
+    )
+
+    assert bound.name == "c1_day"
+    assert parameter.name == "x"
+
+
+def test_call_procedure():
+    bq, calls = recording_bigquery()
+
+    bq.call_procedure(
+        "project",
+        "dataset",
+        "add_event",
+        {"day": datetime.date(2024, 1, 1), "tags": ["a", "b"]},
+    )
+    bq.call_procedure("project", "dataset", "add_event", [None, ["c"]])
+
+    assert calls[0][0] == "CALL `project.dataset.add_event`(@day, @tags)"
+    assert [
+        parameter.to_api_repr()["parameterType"]
+        for parameter in calls[1][1].query_parameters
+    ] == [
+        {"type": "DATE"},
+        {"type": "ARRAY", "arrayType": {"type": "STRING"}},
+    ]
+    # Arguments are read from the routine once
+    assert bq.bq_client.calls["get_routine"] == 2
+
+
+def test_call_procedure_arguments_refreshed_on_update():
+    bq, calls = recording_bigquery()
+    bq.call_procedure("project", "dataset", "add_event", [None, ["a"]])
+
+    bq.create_or_update_structure(
+        "project",
+        "dataset",
+        "add_event",
+        {**procedure, "arguments": [{"name": "day", "data_type": "DATE"}]},
+    )
+    bq.call_procedure("project", "dataset", "add_event", {"day": None})
+
+    assert calls[-1][0] == "CALL `project.dataset.add_event`(@day)"
+
+
+def test_call_procedures():
+    bq, calls = recording_bigquery(failing="@c1_day")
+    days = [datetime.date(2024, 1, day) for day in range(1, 6)]
+
+    results = bq.call_procedures(
+        "project",
+        "dataset",
+        "add_event",
+        [{"day": day, "tags": ["a"]} for day in days],
+        batch_size=3,
+        max_workers=2,
+    )
+
+    assert [result.status for result in results] == [
+        "done",
+        "failed",
+        "skipped",
+        "done",
+        "failed",
+    ]
+    scripts = [
+        job for job in bq.bq_client.jobs.values() if job.statement_type == "SCRIPT"
+    ]
+    assert len(scripts) == 2
+    assert sorted(
+        [
+            parameter.value
+            for parameter in script.job_config.query_parameters
+            if parameter.name.endswith("day")
+        ]
+        for script in scripts
+    ) == [days[:3], days[3:]]
+
+
+def test_procedure_child_jobs_are_merged():
+    client = FakeBigQueryClient()
+    statements = ["CALL `p.d.a`()", "CALL `p.d.b`()"]
+    _, line_ranges = build_script(statements)
+
+    def child(line, affected_rows, error=None):
+        frames = [{"startLine": 1, "procedureId": "p.d.a"}, {"startLine": line}]
+        return FakeJob(
+            client,
+            "query",
+            error=error,
+            num_dml_affected_rows=affected_rows,
+            script_statistics=ScriptStatistics({"stackFrames": frames}),
+        )
+
+    results = map_script_results(
+        statements,
+        line_ranges,
+        [child(1, 2), child(1, 3), child(2, 1), child(2, None, BadRequest("x"))],
+        BadRequest("x"),
+    )
+
+    assert [result.status for result in results] == ["done", "failed"]
+    assert results[0].num_dml_affected_rows == 5
+    assert results[1].error == "400 x"
+
+
+def test_get_procedure_arguments_with_unsupported_types():
+    routine = bigquery.Routine(
+        "project.dataset.log",
+        arguments=[
+            bigquery.RoutineArgument(
+                name=name,
+                data_type=bigquery.StandardSqlDataType(
+                    type_kind=bigquery.StandardSqlTypeNames[type_kind]
+                ),
+            )
+            for name, type_kind in (("day", "DATE"), ("payload", "JSON"))
+        ]
+        + [bigquery.RoutineArgument(name="any")],
+    )
+
+    assert [
+        (argument.name, argument.data_type.value)
+        for argument in get_procedure_arguments(routine)
+    ] == [
+        ("day", "DATE"),
+        ("payload", "TYPE_KIND_UNSPECIFIED"),
+        ("any", "TYPE_KIND_UNSPECIFIED"),
+    ]
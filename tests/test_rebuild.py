@@ -0,0 +1,248 @@
+import re
+
+import pytest
+from google.api_core.exceptions import BadRequest
+from google.api_core.iam import Policy
+from google.cloud import bigquery
+
+from gbq.exceptions import GbqException, InvalidDefinitionException
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+insert_pattern = re.compile(r"INSERT INTO `(.+?)` \((.+?)\) SELECT .+ FROM `(.+?)`")
+
+schema = [
+    {"name": "day", "type": "DATE"},
+    {"name": "id", "type": "INTEGER"},
+    {"name": "dropped", "type": "STRING"},
+]
+definition = {
+    "schema": [
+        {"name": "day", "type": "DATE"},
+        {"name": "id", "type": "INTEGER"},
+        {"name": "added", "type": "STRING"},
+    ],
+    "partition": {"type": "time", "definition": {"type": "DAY", "field": "day"}},
+    "clustering": ["id"],
+    "labels": {"team": "data"},
+}
+
+
+def rebuilding_bigquery(indexes=(), **kwargs):
+    """
+    Returns a fake BigQuery running the statements of a rebuild on the fake client.
+    """
+    bq = fake_bigquery(**kwargs)
+    client = bq.bq_client
+
+    def handler(query, job_config):
+        match = insert_pattern.match(query)
+        if match:
+            destination, columns, source = match.groups()
+            if (
+                client.tables[source].get("requirePartitionFilter")
+                and " WHERE " not in query
+            ):
+                raise BadRequest(
+                    f"Cannot query over table '{source}' without a filter over "
+                    "column(s) that can be used for partition elimination"
+                )
+            names = [column.strip("` ") for column in columns.split(",")]
+            rows = [
+                {name: row.get(name) for name in names} for row in client.rows[source]
+            ]
+            client.rows[destination].extend(rows)
+            return FakeQueryResult(
+                num_dml_affected_rows=len(rows), total_bytes_processed=100 * len(rows)
+            )
+        if "INFORMATION_SCHEMA" in query:
+            return FakeQueryResult(indexes)
+        if query.startswith("CREATE VECTOR INDEX"):
+            raise BadRequest("Column embedding not found")
+        return None
+
+    client.query_handler = handler
+    bq.create_or_update_structure("project", "dataset", "events", schema)
+    client.insert_rows_json(
+        "project.dataset.events",
+        [
+            {"day": "2024-01-01", "id": 1, "dropped": "a"},
+            {"day": "2024-01-02", "id": 2},
+        ],
+    )
+    return bq
+
+
+def test_partitioning_change_without_rebuild_is_ignored():
+    bq = rebuilding_bigquery()
+
+    table = bq.create_or_update_structure("project", "dataset", "events", definition)
+
+    assert table.time_partitioning is None
+    assert not bq.bq_client.calls["query"]
+
+
+def test_partitioning_change_with_rebuild():
+    bq = rebuilding_bigquery()
+
+    table = bq.create_or_update_structure(
+        "project", "dataset", "events", definition, allow_rebuild=True
+    )
+
+    assert table.time_partitioning.field == "day"
+    assert table.clustering_fields == ["id"]
+    assert table.labels == {"team": "data"}
+    assert [field.name for field in table.schema] == ["day", "id", "added"]
+    assert bq.bq_client.rows["project.dataset.events"] == [
+        {"day": "2024-01-01", "id": 1},
+        {"day": "2024-01-02", "id": 2},
+    ]
+    assert "project.dataset.events__rebuild" not in bq.bq_client.tables
+
+    # The rebuilt table matches its definition
+    bq.create_or_update_structure(
+        "project", "dataset", "events", definition, allow_rebuild=True
+    )
+    assert bq.bq_client.calls["query"] == 2
+
+
+def test_rebuild_table_report():
+    bq = rebuilding_bigquery()
+
+    report = bq.rebuild_table("project", "dataset", "events", definition)
+
+    assert report.table_id == "project.dataset.events"
+    assert report.reasons == [
+        "time partitioning None -> ('DAY', 'day')",
+        "clustering None -> ['id']",
+    ]
+    assert (report.rows, report.bytes_processed) == (2, 200)
+    assert (report.indexes, report.warnings) == ([], [])
+
+
+def test_table_cannot_be_replaced_with_other_partitioning():
+    bq = rebuilding_bigquery()
+    bq.create_or_update_structure("project", "dataset", "shadow", definition)
+
+    with pytest.raises(BadRequest, match="Incompatible table partitioning"):
+        bq.bq_client.copy_table(
+            "project.dataset.shadow",
+            "project.dataset.events",
+            job_config=bigquery.CopyJobConfig(write_disposition="WRITE_TRUNCATE"),
+        )
+
+
+def test_rebuild_with_new_required_column_fails_first():
+    bq = rebuilding_bigquery()
+    required = {
+        **definition,
+        "schema": [
+            *definition["schema"],
+            {"name": "x", "type": "INT64", "mode": "REQUIRED"},
+        ],
+    }
+
+    with pytest.raises(InvalidDefinitionException, match=r"REQUIRED columns \['x'\]"):
+        bq.rebuild_table("project", "dataset", "events", required)
+
+    assert not bq.bq_client.calls["query"]
+    assert bq.bq_client.get_table("project.dataset.events").time_partitioning is None
+
+
+def test_rebuild_keeps_policy_and_indexes():
+    indexes = [
+        {
+            "kind": kind,
+            "index_name": f"events_{kind}",
+            "index_status": "ACTIVE",
+            "coverage_percentage": 100.0,
+            "ddl": ddl,
+            "columns": [],
+            "options": [],
+        }
+        for kind, ddl in (
+            (
+                "search",
+                "CREATE SEARCH INDEX events_search ON `project.dataset.events`(ALL COLUMNS)",
+            ),
+            (
+                "vector",
+                "CREATE VECTOR INDEX events_vector ON `project.dataset.events`(embedding)",
+            ),
+        )
+    ]
+    bq = rebuilding_bigquery(indexes)
+    policy = Policy()
+    policy.bindings = [
+        {"role": "roles/bigquery.dataViewer", "members": {"group:a@b.c"}}
+    ]
+    bq.bq_client.set_iam_policy("project.dataset.events", policy)
+
+    report = bq.rebuild_table("project", "dataset", "events", definition)
+
+    assert report.indexes == ["events_search"]
+    assert report.warnings == [
+        "vector index events_vector was dropped: 400 Column embedding not found"
+    ]
+    restored = bq.bq_client.get_iam_policy("project.dataset.events")
+    assert restored.bindings == policy.bindings
+
+
+def test_rebuild_keeps_rows_in_shadow_table_when_copy_fails():
+    bq = rebuilding_bigquery(errors={"copy_table": [BadRequest("Quota exceeded")]})
+
+    with pytest.raises(GbqException, match="kept in project.dataset.events__rebuild"):
+        bq.rebuild_table("project", "dataset", "events", definition)
+
+    assert "project.dataset.events" not in bq.bq_client.tables
+    assert len(bq.bq_client.rows["project.dataset.events__rebuild"]) == 2
+
+
+def test_materialized_view_recreated_with_rebuild():
+    bq = fake_bigquery()
+    bq.create_or_update_structure(
+        "project", "dataset", "daily", {"mview_query": "SELECT 1 AS x"}
+    )
+
+    view = bq.create_or_update_structure(
+        "project",
+        "dataset",
+        "daily",
+        {"mview_query": "SELECT 2 AS x"},
+        allow_rebuild=True,
+    )
+
+    assert view.mview_query == "SELECT 2 AS x"
+    assert bq.bq_client.calls["delete_table"] == 1
+
+
+def test_rebuild_table_requiring_partition_filter():
+    bq = rebuilding_bigquery()
+    partitioned = {
+        **definition,
+        "clustering": None,
+        "require_partition_filter": True,
+        "description": "Events",
+    }
+    bq.rebuild_table("project", "dataset", "events", partitioned)
+    bq.bq_client.tables["project.dataset.events"]["expirationTime"] = "4102444800000"
+
+    table = bq.create_or_update_structure(
+        "project",
+        "dataset",
+        "events",
+        {**partitioned, "clustering": ["id"]},
+        allow_rebuild=True,
+    )
+
+    query = [
+        job.query
+        for job in bq.bq_client.jobs.values()
+        if (job.query or "").startswith("INSERT")
+    ][-1]
+    assert query.endswith("WHERE `day` IS NULL OR `day` IS NOT NULL")
+    assert len(bq.bq_client.rows["project.dataset.events"]) == 2
+    assert table.clustering_fields == ["id"]
+    # Options the copy does not carry over are applied again
+    assert table.require_partition_filter is True
+    assert (table.labels, table.description) == ({"team": "data"}, "Events")
+    assert table.expires is not None
@@ -0,0 +1,149 @@
+import datetime
+import decimal
+import json
+
+import pytest
+from google.cloud.bigquery import SchemaField
+
+from gbq.row_encoder import RowEncoder
+
+
+@pytest.fixture()
+def schema() -> list[SchemaField]:
+    return [
+        SchemaField("id", "INTEGER"),
+        SchemaField("created_at", "TIMESTAMP"),
+        SchemaField("updated_at", "DATETIME"),
+        SchemaField("day", "DATE"),
+        SchemaField("at", "TIME"),
+        SchemaField("price", "NUMERIC"),
+        SchemaField("payload", "BYTES"),
+        SchemaField("tags", "DATE", mode="REPEATED"),
+        SchemaField(
+            "address",
+            "RECORD",
+            mode="REPEATED",
+            fields=(SchemaField("street", "STRING"), SchemaField("since", "DATE")),
+        ),
+        SchemaField("meta", "RECORD", fields=(SchemaField("name", "STRING"),)),
+    ]
+
+
+@pytest.fixture()
+def row() -> dict:
+    return {
+        "id": 1,
+        "created_at": datetime.datetime(
+            2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+        ),
+        "updated_at": datetime.datetime(
+            2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc
+        ),
+        "day": datetime.date(2020, 1, 2),
+        "at": datetime.time(3, 4, 5),
+        "price": decimal.Decimal("1.50"),
+        "payload": b"abc",
+        "tags": [datetime.date(2020, 1, 2), None],
+        "address": [{"street": "main", "since": datetime.date(2019, 1, 1)}],
+        "meta": {"name": "x"},
+        "extra": None,
+    }
+
+
+@pytest.fixture()
+def encoded_row() -> dict:
+    return {
+        "id": 1,
+        "created_at": "2020-01-02T03:04:05+00:00",
+        "updated_at": "2020-01-02T03:04:05",
+        "day": "2020-01-02",
+        "at": "03:04:05",
+        "price": "1.50",
+        "payload": "YWJj",
+        "tags": ["2020-01-02", None],
+        "address": [{"street": "main", "since": "2019-01-01"}],
+        "meta": {"name": "x"},
+        "extra": None,
+    }
+
+
+def test_encode(schema, row, encoded_row):
+    encoder = RowEncoder(schema)
+    assert encoder.encode(row) == encoded_row
+    assert isinstance(row["day"], datetime.date)
+
+
+def test_encode_passes_through_json_values(schema):
+    row = {"day": "2020-01-02", "price": 1, "payload": "YWJj"}
+    assert RowEncoder(schema).encode(row) == row
+
+
+def test_encode_without_converters():
+    row = {"id": 1}
+    encoded = RowEncoder([SchemaField("id", "INTEGER")]).encode(row)
+    assert encoded == row
+    assert encoded is not row
+
+
+def test_encode_many(schema, row, encoded_row):
+    assert RowEncoder(schema).encode_many([row, row]) == [encoded_row, encoded_row]
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_dumps(schema, row, encoded_row, fast_json):
+    encoder = RowEncoder(schema, fast_json=fast_json)
+    assert json.loads(encoder.dumps(row)) == encoded_row
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_write_ndjson_reuses_buffer(schema, row, encoded_row, fast_json):
+    encoder = RowEncoder(schema, fast_json=fast_json)
+    buffer = bytearray(b"stale")
+    buffer.clear()
+
+    assert encoder.write_ndjson([row, row], buffer) == 2
+    lines = bytes(buffer).splitlines()
+    assert [json.loads(line) for line in lines] == [encoded_row, encoded_row]
+
+
+def test_to_ndjson(schema, row):
+    encoder = RowEncoder(schema, fast_json=False)
+    assert encoder.to_ndjson([row]) == encoder.dumps(row) + b"\n"
+    assert encoder.to_ndjson([]) == b""
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_encode_non_finite_floats(fast_json):
+    encoder = RowEncoder(
+        [
+            SchemaField("score", "FLOAT"),
+            SchemaField("scores", "FLOAT64", mode="REPEATED"),
+        ],
+        fast_json=fast_json,
+    )
+    row = {"score": float("nan"), "scores": [1.5, float("inf"), float("-inf"), None]}
+
+    assert json.loads(encoder.dumps(row)) == {
+        "score": "NaN",
+        "scores": [1.5, "Infinity", "-Infinity", None],
+    }
+
+
+def test_encode_json_columns():
+    encoder = RowEncoder([SchemaField("doc", "JSON"), SchemaField("raw", "JSON")])
+
+    encoded = encoder.encode({"doc": {"a": [1, "é"]}, "raw": '{"b": 2}'})
+
+    assert json.loads(encoded["doc"]) == {"a": [1, "é"]}
+    assert encoded["raw"] == '{"b": 2}'
+
+
+def test_encode_aware_datetime_as_utc():
+    encoder = RowEncoder([SchemaField("updated_at", "DATETIME")])
+    paris = datetime.timezone(datetime.timedelta(hours=2))
+
+    encoded = encoder.encode(
+        {"updated_at": datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=paris)}
+    )
+
+    assert encoded == {"updated_at": "2020-01-02T01:04:05"}
@@ -0,0 +1,183 @@
+import datetime
+import decimal
+
+import pytest
+
+from gbq.exceptions import InvalidDefinitionException
+from gbq.row_validator import RowValidator
+
+
+@pytest.fixture()
+def validator(nested_json_schema) -> RowValidator:
+    return RowValidator(nested_json_schema)
+
+
+def test_validate_valid_row(validator):
+    row = {"id": 1, "username": "abc", "address": [{"id": 2, "street": "main"}]}
+    assert validator.validate(row) == []
+    assert validator.is_valid(row)
+
+
+def test_validate_nullable_fields_can_be_missing(validator):
+    assert validator.validate({}) == []
+
+
+@pytest.mark.parametrize(
+    "row, expected",
+    [
+        ({"id": "abc"}, ["id: expected INTEGER"]),
+        ({"id": True}, ["id: expected INTEGER"]),
+        ({"username": 1}, ["username: expected STRING"]),
+        ({"address": {"id": 1}}, ["address: expected REPEATED"]),
+        ({"address": [None]}, ["address: null in REPEATED"]),
+        ({"address": [1]}, ["address: expected RECORD"]),
+        ({"address": [{"id": "x"}]}, ["address.id: expected INTEGER"]),
+        ({"address": [{"zip": 1}]}, ["address.zip: no such field"]),
+        ({"other": 1}, ["other: no such field"]),
+    ],
+)
+def test_validate_invalid_row(validator, row, expected):
+    assert validator.validate(row) == expected
+    assert not validator.is_valid(row)
+
+
+def test_validate_row_not_a_dict(validator):
+    assert validator.validate([]) == ["<row>: expected RECORD"]  # type: ignore[arg-type]
+
+
+def test_validate_allow_unknown_fields(nested_json_schema):
+    validator = RowValidator(nested_json_schema, allow_unknown_fields=True)
+    assert validator.validate({"other": 1, "address": [{"zip": 1}]}) == []
+
+
+def test_validate_required_field():
+    validator = RowValidator([{"name": "id", "type": "INTEGER", "mode": "REQUIRED"}])
+    assert validator.validate({}) == ["id: missing REQUIRED"]
+    assert validator.validate({"id": "12"}) == []
+    assert validator.validate({"id": "-"}) == ["id: expected INTEGER"]
+
+
+@pytest.mark.parametrize(
+    "field_type, valid, invalid",
+    [
+        ("FLOAT", 1.5, "1.5x"),
+        ("NUMERIC", decimal.Decimal("1.5"), b"1"),
+        ("BOOLEAN", False, 0),
+        ("BYTES", b"abc", 1),
+        ("TIMESTAMP", datetime.datetime(2020, 1, 1), datetime.date(2020, 1, 1)),
+        ("DATETIME", "2020-01-01T00:00:00", 1),
+        ("DATE", datetime.date(2020, 1, 1), datetime.datetime(2020, 1, 1)),
+        ("TIME", datetime.time(1, 2), 1),
+        ("GEOGRAPHY", "POINT(1 2)", 1),
+    ],
+)
+def test_validate_types(field_type, valid, invalid):
+    validator = RowValidator([{"name": "f", "type": field_type}])
+    assert validator.is_valid({"f": valid})
+    assert validator.validate({"f": invalid}) == [f"f: expected {field_type}"]
+
+
+@pytest.mark.parametrize(
+    "field_type, value, expected",
+    [
+        ("FLOAT", "1.5", True),
+        ("FLOAT", "-2e10", True),
+        ("FLOAT", "NaN", True),
+        ("FLOAT", "Infinity", True),
+        ("FLOAT64", "-Infinity", True),
+        ("FLOAT", float("nan"), True),
+        ("FLOAT", "abc", False),
+        ("FLOAT", "1_000", False),
+        ("FLOAT", True, False),
+        ("NUMERIC", "1.5", True),
+        ("NUMERIC", "-12", True),
+        ("BIGNUMERIC", "1e-30", True),
+        ("NUMERIC", 3, True),
+        ("NUMERIC", "abc", False),
+        ("NUMERIC", "NaN", False),
+        ("NUMERIC", float("inf"), False),
+        ("BIGNUMERIC", decimal.Decimal("Infinity"), False),
+        ("NUMERIC", " 1", False),
+    ],
+)
+def test_validate_number_strings(field_type, value, expected):
+    validator = RowValidator([{"name": "f", "type": field_type}])
+    assert validator.is_valid({"f": value}) is expected
+
+
+@pytest.mark.parametrize(
+    "field_type, value, expected",
+    [
+        ("BYTES", "YWJj", True),
+        ("BYTES", "", True),
+        ("BYTES", "abc", False),
+        ("BYTES", "not base64!", False),
+        ("DATE", "2020-01-05", True),
+        ("DATE", "2020-1-5", True),
+        ("DATE", "not a date", False),
+        ("DATE", "2020-02-30", False),
+        ("DATE", "2020-01-05 00:00:00", False),
+        ("TIME", "12:30:00", True),
+        ("TIME", "1:2:3.456789", True),
+        ("TIME", "25:00:00", False),
+        ("TIME", "noon", False),
+        ("DATETIME", "2020-01-05", True),
+        ("DATETIME", "2020-01-05 12:30:00.5", True),
+        ("DATETIME", "2020-01-05T12:30:00", True),
+        ("DATETIME", "2020-01-05T12:30:00+01:00", False),
+        ("DATETIME", "2020-13-05T12:30:00", False),
+        ("TIMESTAMP", "2020-01-05 12:30:00", True),
+        ("TIMESTAMP", "2020-01-05T12:30:00Z", True),
+        ("TIMESTAMP", "2020-01-05 12:30:00+05:30", True),
+        ("TIMESTAMP", "2020-01-05 12:30:00 UTC", True),
+        ("TIMESTAMP", "2020-01-05 12:30:00 Europe/Paris", True),
+        ("TIMESTAMP", "2020-01-05 12:30:00 Mars/Olympus", False),
+        ("TIMESTAMP", "yesterday", False),
+    ],
+)
+def test_validate_temporal_and_bytes_strings(field_type, value, expected):
+    validator = RowValidator([{"name": "f", "type": field_type}])
+    assert validator.is_valid({"f": value}) is expected
+
+
+def test_validate_json_accepts_anything():
+    validator = RowValidator([{"name": "f", "type": "JSON"}])
+    assert validator.is_valid({"f": {"a": [1, 2]}})
+
+
+@pytest.mark.parametrize(
+    "json_schema",
+    [
+        [{"name": "f", "type": "UNKNOWN"}],
+        [{"name": "f", "type": "STRING", "mode": "OPTIONAL"}],
+    ],
+)
+def test_invalid_schema(json_schema):
+    with pytest.raises(InvalidDefinitionException):
+        RowValidator(json_schema)
+
+
+def test_validate_batch(validator):
+    rows = [{"id": 1}, {"id": "a"}, {"id": "b", "other": 1}, {"username": 2}]
+    report = validator.validate_batch(rows, sample_size=2)
+
+    assert not report.is_valid
+    assert report.total_rows == 4
+    assert report.invalid_rows == 3
+    assert report.error_counts == {
+        "id: expected INTEGER": 2,
+        "other: no such field": 1,
+        "username: expected STRING": 1,
+    }
+    assert [sample.index for sample in report.samples] == [1, 2]
+    assert report.samples[1].errors == [
+        "id: expected INTEGER",
+        "other: no such field",
+    ]
+
+
+def test_validate_batch_valid(validator):
+    report = validator.validate_batch(iter([{"id": 1}, {"id": 2}]))
+    assert report.is_valid
+    assert report.total_rows == 2
+    assert report.samples == []
@@ -0,0 +1,209 @@
+import pytest
+
+from gbq.dto import Structure
+from gbq.exceptions import InvalidDefinitionException
+from gbq.helpers import get_bq_schema_from_json_schema
+from gbq.schema_validator import check_structure, validate_structure
+from gbq.testing import fake_bigquery
+
+
+def nested(depth):
+    field = {"name": "leaf", "type": "STRING"}
+    for level in range(depth - 1):
+        field = {"name": f"level{level}", "type": "RECORD", "fields": [field]}
+    return [field]
+
+
+def test_valid_structure():
+    structure = Structure(
+        **{
+            "schema": [
+                {"name": "day", "type": "date", "mode": "required"},
+                {"name": "id", "type": "INT64"},
+                {"name": "Customer Name", "type": "STRING"},
+                {
+                    "name": "items",
+                    "type": "STRUCT",
+                    "mode": "REPEATED",
+                    "fields": [
+                        {"name": "sku", "type": "STRING"},
+                    ],
+                },
+                *nested(15),
+            ],
+            "partition": {
+                "type": "time",
+                "definition": {"type": "DAY", "field": "day"},
+            },
+            "clustering": ["id", "Customer Name"],
+        }
+    )
+
+    assert validate_structure(structure) == []
+    check_structure(structure)
+
+
+def test_invalid_fields():
+    structure = Structure(
+        schema=[
+            {"name": "id", "type": "INT"},
+            {"name": "ID", "type": "STRING", "mode": "OPTIONAL"},
+            {"name": "a.b", "type": "STRING"},
+            {"name": "_PARTITIONTIME", "type": "TIMESTAMP"},
+            {"name": "x" * 301, "type": "STRING"},
+            {"type": "STRING"},
+            {"name": "record", "type": "RECORD"},
+            {"name": "text", "type": "STRING", "fields": [{"name": "a"}]},
+            *nested(16),
+        ]
+    )
+
+    assert validate_structure(structure) == [
+        "id: unknown type 'INT'",
+        "ID: duplicate field name",
+        "ID: unknown mode 'OPTIONAL'",
+        "a.b: invalid characters in name 'a.b'",
+        "_PARTITIONTIME: name '_PARTITIONTIME' uses a reserved prefix",
+        f"{'x' * 301}: name longer than 300 characters",
+        "[5]: missing name",
+        "record: RECORD without fields",
+        "text: fields are only allowed in RECORD fields",
+        "level14.level13.level12.level11.level10.level9.level8.level7.level6.level5"
+        ".level4.level3.level2.level1.level0: nested deeper than 15 levels",
+    ]
+
+
+def test_too_many_columns():
+    structure = Structure(
+        schema=[{"name": f"c{index}", "type": "STRING"} for index in range(10_001)]
+    )
+
+    assert validate_structure(structure) == ["schema: 10001 columns, more than 10000"]
+
+
+@pytest.mark.parametrize(
+    "partition, error",
+    [
+        (
+            {"type": "time", "definition": {"type": "DAY", "field": "missing"}},
+            "partition: field missing is not a top level column",
+        ),
+        (
+            {"type": "time", "definition": {"type": "DAY", "field": "id"}},
+            "partition: field id has type INTEGER, "
+            "expected one of ['DATE', 'DATETIME', 'TIMESTAMP']",
+        ),
+        (
+            {"type": "time", "definition": {"type": "HOUR", "field": "day"}},
+            "partition: DATE field day cannot use HOUR",
+        ),
+        (
+            {"type": "time", "definition": {"type": "DAY", "field": "days"}},
+            "partition: field days is REPEATED",
+        ),
+        (
+            {
+                "type": "range",
+                "definition": {
+                    "field": "id",
+                    "range": {"start": 10, "end": 0, "interval": 1},
+                },
+            },
+            "partition: range needs start < end and a positive interval",
+        ),
+        (
+            {
+                "type": "range",
+                "definition": {
+                    "field": "id",
+                    "range": {"start": 0, "end": 100_000, "interval": 1},
+                },
+            },
+            "partition: range creates more than 10000 partitions",
+        ),
+    ],
+)
+def test_invalid_partition(partition, error):
+    structure = Structure(
+        schema=[
+            {"name": "day", "type": "DATE"},
+            {"name": "days", "type": "DATE", "mode": "REPEATED"},
+            {"name": "id", "type": "INTEGER"},
+        ],
+        partition=partition,
+    )
+
+    assert validate_structure(structure) == [error]
+
+
+def test_ingestion_time_partition():
+    structure = Structure(
+        schema=[{"name": "id", "type": "INTEGER"}],
+        partition={"type": "time", "definition": {"type": "HOUR"}},
+    )
+
+    assert validate_structure(structure) == []
+
+
+def test_invalid_clustering():
+    structure = Structure(
+        schema=[
+            {"name": "a", "type": "STRING"},
+            {"name": "b", "type": "FLOAT"},
+            {"name": "c", "type": "STRING", "mode": "REPEATED"},
+        ],
+        clustering=["a", "a", "b", "c", "d"],
+    )
+
+    assert validate_structure(structure) == [
+        "clustering: more than 4 fields ['a', 'a', 'b', 'c', 'd']",
+        "clustering: duplicate fields ['a', 'a', 'b', 'c', 'd']",
+        "clustering: field b has type FLOAT",
+        "clustering: field c is REPEATED",
+        "clustering: field d is not a top level column",
+    ]
+
+
+def test_struct_fields_are_converted():
+    schema = get_bq_schema_from_json_schema(
+        [{"name": "s", "type": "STRUCT", "fields": [{"name": "a", "type": "STRING"}]}]
+    )
+
+    assert [field.name for field in schema[0].fields] == ["a"]
+
+
+def test_create_or_update_structure_fails_before_any_request():
+    bq = fake_bigquery()
+
+    with pytest.raises(InvalidDefinitionException) as error:
+        bq.create_or_update_structure(
+            "project",
+            "dataset",
+            "events",
+            {"schema": [{"name": "id", "type": "INT"}], "clustering": ["missing"]},
+        )
+
+    assert str(error.value) == (
+        "Invalid definition of events:\n"
+        "- id: unknown type 'INT'\n"
+        "- clustering: field missing is not a top level column"
+    )
+    assert not bq.bq_client.calls
+
+
+def test_deploy_structures_reports_every_definition():
+    bq = fake_bigquery()
+
+    with pytest.raises(
+        InvalidDefinitionException, match="a: id: unknown type"
+    ) as error:
+        bq.deploy_structures(
+            ["project.dataset"],
+            {
+                "a": [{"name": "id", "type": "INT"}],
+                "b": [{"name": "id", "type": "STRING", "mode": "OPTIONAL"}],
+            },
+        )
+
+    assert "- b: id: unknown mode 'OPTIONAL'" in str(error.value)
+    assert not bq.bq_client.calls
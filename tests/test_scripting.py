@@ -0,0 +1,172 @@
+import pytest
+from google.api_core.exceptions import BadRequest
+
+from gbq.scripting import (
+    StatementBatcher,
+    build_script,
+    is_transactional,
+    map_script_results,
+    split_script,
+)
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+
+def test_split_script():
+    script = (
+        "INSERT INTO t VALUES ('a;b');\n"
+        "-- comment;\n"
+        'UPDATE `d.t;` SET x = 1 WHERE y = "c;";\n'
+        "\n"
+        "  DELETE FROM t WHERE TRUE;  "
+    )
+
+    assert split_script(script) == [
+        (1, "INSERT INTO t VALUES ('a;b')"),
+        (2, '-- comment;\nUPDATE `d.t;` SET x = 1 WHERE y = "c;"'),
+        (5, "DELETE FROM t WHERE TRUE"),
+    ]
+
+
+def test_build_script():
+    script, line_ranges = build_script(
+        ["INSERT INTO t\nVALUES (1)", "DELETE FROM t WHERE TRUE"], transaction=True
+    )
+
+    assert script == (
+        "BEGIN TRANSACTION;\n"
+        "INSERT INTO t\nVALUES (1);\n"
+        "DELETE FROM t WHERE TRUE;\n"
+        "COMMIT TRANSACTION;"
+    )
+    assert line_ranges == [(2, 3), (4, 4)]
+    assert [line for line, _ in split_script(script)] == [1, 2, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        ("INSERT INTO t VALUES (1)", True),
+        ("  -- comment\n merge t USING s ON TRUE", True),
+        ("ALTER TABLE t ADD COLUMN x STRING", False),
+        ("GRANT `roles/bigquery.dataViewer` ON TABLE t TO 'user:a@b.c'", False),
+    ],
+)
+def test_is_transactional(statement, expected):
+    assert is_transactional(statement) is expected
+
+
+def failing_handler(failing):
+    def handler(query, job_config):
+        if failing in query:
+            raise BadRequest(f"Query error: {failing} failed")
+        return FakeQueryResult(num_dml_affected_rows=1, statement_type="INSERT")
+
+    return handler
+
+
+def test_run_script():
+    bq = fake_bigquery(query_handler=failing_handler("never"))
+    statements = ["INSERT INTO t VALUES (1)", "INSERT INTO t\nVALUES (2)"]
+
+    results = bq.run_script(statements)
+
+    assert [result.status for result in results] == ["done", "done"]
+    assert [result.num_dml_affected_rows for result in results] == [1, 1]
+    assert results[0].job_id != results[1].job_id
+    assert bq.bq_client.calls["query"] == 1
+
+
+def test_run_script_failed_statement():
+    bq = fake_bigquery(query_handler=failing_handler("VALUES (2)"))
+    statements = [
+        "INSERT INTO t VALUES (1)",
+        "INSERT INTO t VALUES (2)",
+        "INSERT INTO t VALUES (3)",
+    ]
+
+    results = bq.run_script(statements)
+    assert [result.status for result in results] == ["done", "failed", "skipped"]
+    assert "VALUES (2) failed" in results[1].error
+
+    results = bq.run_script(statements, transaction=True)
+    assert [result.status for result in results] == [
+        "rolled_back",
+        "failed",
+        "skipped",
+    ]
+
+
+def test_map_script_error_location():
+    statements = ["INSERT INTO t VALUES (1)", "INSERT INTO t VALUS (2)"]
+    _, line_ranges = build_script(statements)
+
+    results = map_script_results(
+        statements,
+        line_ranges,
+        [],
+        BadRequest("Syntax error: Expected keyword VALUES at [2:15]"),
+    )
+    assert [result.status for result in results] == ["skipped", "failed"]
+
+    results = map_script_results(statements, line_ranges, [], BadRequest("Error"))
+    assert [result.status for result in results] == ["failed", "failed"]
+
+
+def test_run_script_single_statement():
+    bq = fake_bigquery(query_handler=failing_handler("VALUES (1)"))
+
+    (result,) = bq.run_script(["INSERT INTO t VALUES (1)"])
+
+    assert result.status == "failed"
+    assert result.job_id is not None
+
+
+def test_batcher_groups_statements():
+    bq = fake_bigquery()
+    batcher = StatementBatcher(bq, transaction=True, max_statements=2)
+    with batcher:
+        batcher.add("ALTER TABLE t ADD COLUMN x STRING;")
+        batcher.add("INSERT INTO t VALUES (1)")
+        batcher.add("INSERT INTO t VALUES (2)")
+        batcher.add("INSERT INTO t VALUES (3)")
+        batcher.add("GRANT `roles/bigquery.dataViewer` ON TABLE t TO 'user:a@b.c'")
+
+    scripts = [job.query for job in bq.bq_client.jobs.values() if not job.parent_job_id]
+    assert scripts == [
+        "ALTER TABLE t ADD COLUMN x STRING;",
+        "BEGIN TRANSACTION;\n"
+        "INSERT INTO t VALUES (1);\n"
+        "INSERT INTO t VALUES (2);\n"
+        "COMMIT TRANSACTION;",
+        "BEGIN TRANSACTION;\nINSERT INTO t VALUES (3);\nCOMMIT TRANSACTION;",
+        "GRANT `roles/bigquery.dataViewer` ON TABLE t TO 'user:a@b.c';",
+    ]
+    assert len(batcher.results) == 5
+    assert batcher.failed == []
+
+
+def test_batcher_max_bytes():
+    bq = fake_bigquery()
+    batcher = StatementBatcher(bq, max_bytes=60)
+    for statement in [
+        "INSERT INTO t VALUES (0)",
+        "INSERT INTO t VALUES (1)",
+        "INSERT INTO t VALUES (2)",
+        "INSERT INTO t VALUES (3)",
+    ]:
+        batcher.add(statement)
+
+    assert bq.bq_client.calls["query"] == 1
+    assert batcher.flush()[0].statement == "INSERT INTO t VALUES (2)"
+    assert batcher.flush() == []
+    assert bq.bq_client.calls["query"] == 2
+
+
+def test_batcher_not_flushed_on_error():
+    bq = fake_bigquery()
+
+    with pytest.raises(ValueError), StatementBatcher(bq) as batcher:
+        batcher.add("INSERT INTO t VALUES (1)")
+        raise ValueError
+
+    assert not bq.bq_client.calls["query"]
@@ -0,0 +1,149 @@
+import threading
+import time
+
+import pytest
+from google.api_core.exceptions import BadRequest, ServiceUnavailable
+
+from gbq.exceptions import GbqException
+from gbq.streaming import StreamingWriter
+
+
+@pytest.fixture()
+def client(mocker):
+    client = mocker.Mock()
+    client.insert_rows_json.return_value = []
+    return client
+
+
+def make_writer(client, **kwargs) -> StreamingWriter:
+    kwargs.setdefault("flush_interval", 60)
+    kwargs.setdefault("retry_delay", 0)
+    return StreamingWriter(client, "project", "dataset", **kwargs)
+
+
+def sent_rows(client) -> list[list[dict]]:
+    return [call.args[1] for call in client.insert_rows_json.call_args_list]
+
+
+def test_streaming_writer_from_bigquery(bq):
+    with bq.streaming_writer("project", "dataset", flush_interval=60) as writer:
+        writer.write("table", [{"id": 1}])
+
+    bq.bq_client.insert_rows_json.assert_called_once()
+    assert bq.bq_client.insert_rows_json.call_args.args[0] == "project.dataset.table"
+    assert writer.stats.rows_sent == 1
+
+
+def test_flush_by_row_count(client):
+    with make_writer(client, max_rows=2) as writer:
+        writer.write("table", [{"id": index} for index in range(5)])
+
+    assert sorted(len(rows) for rows in sent_rows(client)) == [1, 2, 2]
+    assert writer.stats.requests == 3
+    assert writer.stats.rows_sent == 5
+
+
+def test_flush_by_byte_size(client):
+    with make_writer(client, max_bytes=20) as writer:
+        writer.write("table", [{"id": "abcd"}, {"id": "efgh"}, {"id": "ijkl"}])
+
+    assert [len(rows) for rows in sent_rows(client)] == [1, 1, 1]
+
+
+def test_row_larger_than_request(client):
+    with make_writer(client, max_bytes=5) as writer, pytest.raises(GbqException):
+        writer.write("table", [{"id": "abcdef"}])
+
+
+def test_flush_by_time(client):
+    writer = make_writer(client, flush_interval=0.05)
+    writer.write("table", [{"id": 1}])
+
+    deadline = time.monotonic() + 5
+    while not client.insert_rows_json.called and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.close()
+
+    assert sent_rows(client) == [[{"id": 1}]]
+
+
+def test_rows_are_buffered_per_table(client):
+    with make_writer(client) as writer:
+        writer.write("a", [{"id": 1}])
+        writer.write("b", [{"id": 2}, {"id": 3}])
+
+    tables = {
+        call.args[0]: len(call.args[1])
+        for call in client.insert_rows_json.call_args_list
+    }
+    assert tables == {"project.dataset.a": 1, "project.dataset.b": 2}
+
+
+def test_only_failed_rows_are_sent_again(client):
+    client.insert_rows_json.side_effect = [
+        [
+            {"index": 1, "errors": [{"reason": "invalid"}]},
+            {"index": 2, "errors": [{"reason": "stopped"}]},
+        ],
+        [],
+    ]
+    with make_writer(client) as writer:
+        writer.write("table", [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    first, second = client.insert_rows_json.call_args_list
+    assert second.args[1] == [{"id": 2}]
+    assert second.kwargs["row_ids"] == [first.kwargs["row_ids"][2]]
+    assert [failure.row for failure in writer.failed_rows] == [{"id": 1}]
+    assert writer.stats.rows_sent == 2
+    assert writer.stats.rows_failed == 1
+
+
+def test_failed_rows_after_retries(client):
+    client.insert_rows_json.return_value = [
+        {"index": 0, "errors": [{"reason": "backendError"}]}
+    ]
+    with make_writer(client, max_retries=2) as writer:
+        writer.write("table", [{"id": 0}])
+
+    assert client.insert_rows_json.call_count == 3
+    assert writer.failed_rows[0].errors == [{"reason": "backendError"}]
+
+
+def test_request_errors(client):
+    client.insert_rows_json.side_effect = [ServiceUnavailable("down"), BadRequest("no")]
+    with make_writer(client) as writer:
+        writer.write("table", [{"id": 0}])
+
+    assert client.insert_rows_json.call_count == 2
+    assert writer.failed_rows[0].errors[0]["reason"] == "requestError"
+
+
+def test_backpressure_blocks_writes(client):
+    release = threading.Event()
+    client.insert_rows_json.side_effect = lambda *args, **kwargs: release.wait() and []
+    writer = make_writer(client, max_rows=1, max_pending_rows=1)
+    writer.write("table", [{"id": 0}])
+
+    blocked = threading.Thread(target=writer.write, args=("table", [{"id": 1}]))
+    blocked.start()
+    blocked.join(0.1)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(5)
+    writer.close()
+    assert not blocked.is_alive()
+    assert writer.stats.rows_sent == 2
+
+
+def test_write_after_close(client):
+    writer = make_writer(client)
+    writer.close()
+    writer.close()
+    with pytest.raises(GbqException):
+        writer.write("table", [{"id": 0}])
+
+
+def test_invalid_pending_rows(client):
+    with pytest.raises(GbqException):
+        make_writer(client, max_rows=10, max_pending_rows=1)
@@ -0,0 +1,144 @@
+import pytest
+from google.api_core.exceptions import BadRequest
+from google.cloud.bigquery.job import QueryPlanEntry
+
+from gbq.exceptions import GbqException
+from gbq.telemetry import (
+    QueryAggregator,
+    QueryStatsSink,
+    get_query_fingerprint,
+    normalize_query,
+)
+from gbq.testing import FakeQueryResult, fake_bigquery
+
+
+def test_normalize_query():
+    query = """
+        SELECT a, 'x#y' AS b -- comment
+        FROM `project-1.dataset.table_2` /* block */
+        WHERE id IN (1, 2,3) AND s = "q" AND f = 1.5e3 # tail
+    """
+
+    assert normalize_query(query) == (
+        "select a, ? as b from `project-1.dataset.table_2` "
+        "where id in (?) and s = ? and f = ?"
+    )
+
+
+def test_fingerprint_ignores_literals():
+    assert get_query_fingerprint(
+        "SELECT * FROM t WHERE id IN (1, 2)"
+    ) == get_query_fingerprint("select *\nFROM t WHERE id IN (3)")
+    assert get_query_fingerprint("SELECT a FROM t") != get_query_fingerprint(
+        "SELECT b FROM t"
+    )
+
+
+def handler(query, job_config):
+    if "fail" in query:
+        raise BadRequest("Unrecognized name: fail")
+    return FakeQueryResult(
+        [{"x": 1}],
+        total_bytes_processed=100,
+        total_bytes_billed=1024 if "big" in query else 10,
+        slot_millis=50,
+        cache_hit="cached" in query,
+        statement_type="SELECT",
+        query_plan=[
+            QueryPlanEntry.from_api_repr(
+                {
+                    "name": "S00: Input",
+                    "status": "COMPLETE",
+                    "startMs": "1000",
+                    "endMs": "1250",
+                    "waitMsMax": "3",
+                    "recordsRead": "10",
+                    "recordsWritten": "1",
+                    "slotMs": "40",
+                }
+            ),
+            QueryPlanEntry.from_api_repr({"name": "S01: Output"}),
+        ],
+    )
+
+
+def test_execute_records_stats():
+    aggregator = QueryAggregator()
+    bq = fake_bigquery(query_handler=handler)
+    bq.query_stats_sink = aggregator
+
+    for query in (
+        "SELECT big FROM t WHERE day = 1",
+        "SELECT big FROM t WHERE day = 2",
+        "SELECT big FROM t WHERE day = 3",
+    ):
+        bq.execute(query)
+    bq.execute("SELECT cached FROM t")
+    with pytest.raises(GbqException):
+        bq.execute("SELECT fail FROM t")
+
+    big, cached, failed = aggregator.aggregates()
+    assert big.jobs == 3
+    assert big.query == "SELECT big FROM t WHERE day = 3"
+    assert big.total_bytes_billed == 3072
+    assert big.total_slot_millis == 150
+    assert big.mean_run_seconds == big.total_run_seconds / 3
+    assert big.max_run_seconds >= 0
+    assert cached.cache_hits == 1
+    assert failed.errors == 1
+    assert [aggregate.fingerprint for aggregate in aggregator.top(2)] == [
+        big.fingerprint,
+        cached.fingerprint,
+    ]
+    assert aggregator.top(1, key="errors") == [failed]
+
+
+class ListSink(QueryStatsSink):
+    def __init__(self):
+        self.stats = []
+
+    def record(self, stats):
+        self.stats.append(stats)
+
+
+def test_query_stats():
+    sink = ListSink()
+    bq = fake_bigquery(query_handler=handler)
+    bq.query_stats_sink = sink
+    query_job = bq.execute("SELECT 1")
+
+    (stats,) = sink.stats
+    assert stats.job_id == query_job.job_id
+    assert stats.statement_type == "SELECT"
+    assert stats.total_bytes_processed == 100
+    assert stats.queue_seconds == 0
+    assert stats.run_seconds >= 0
+    assert stats.error is None
+    first, second = stats.stages
+    assert first.name == "S00: Input"
+    assert first.duration_ms == 250
+    assert first.wait_ms_max == 3
+    assert first.records_read == 10
+    assert first.slot_ms == 40
+    assert second.duration_ms is None
+
+    QueryStatsSink().record(stats)
+
+
+def test_aggregator_window_and_eviction():
+    aggregator = QueryAggregator(window=2, max_fingerprints=2)
+    bq = fake_bigquery(query_handler=handler)
+    bq.query_stats_sink = aggregator
+
+    for _ in range(3):
+        bq.execute("SELECT a FROM t")
+    bq.execute("SELECT b FROM t")
+    bq.execute("SELECT a FROM t")
+    bq.execute("SELECT c FROM t")
+
+    assert [
+        (aggregate.query, aggregate.jobs) for aggregate in aggregator.aggregates()
+    ] == [
+        ("SELECT a FROM t", 2),
+        ("SELECT c FROM t", 1),
+    ]
@@ -0,0 +1,291 @@
+import gzip
+import io
+import time
+
+import pytest
+from google.api_core.exceptions import (
+    BadRequest,
+    Conflict,
+    Forbidden,
+    NotFound,
+    ServiceUnavailable,
+    TooManyRequests,
+)
+from google.cloud import bigquery
+
+from gbq.bigquery import BigQuery
+from gbq.exceptions import GbqException
+from gbq.testing import FakeBigQueryClient, FakeQueryResult, fake_bigquery
+
+
+@pytest.fixture()
+def fake_bq() -> BigQuery:
+    return fake_bigquery()
+
+
+def test_bigquery_requires_credentials_or_client():
+    with pytest.raises(GbqException):
+        BigQuery()
+
+
+def test_bigquery_with_client_sets_project():
+    bq = BigQuery(project="other", bq_client=FakeBigQueryClient())  # type: ignore[arg-type]
+    assert bq.bq_client.project == "other"
+    assert bq.credentials is None
+
+
+def test_create_and_update_table(fake_bq, nested_json_schema_with_labels):
+    fake_bq.create_or_update_structure(
+        "project", "dataset", "table", nested_json_schema_with_labels
+    )
+    nested_json_schema_with_labels["labels"] = {"test": "changed"}
+    nested_json_schema_with_labels["schema"].append({"name": "new", "type": "STRING"})
+    fake_bq.create_or_update_structure(
+        "project", "dataset", "table", nested_json_schema_with_labels
+    )
+
+    table = fake_bq.get_structure("project", "dataset", "table")
+    assert table.table_type == "TABLE"
+    assert table.labels == {"test": "changed"}
+    assert [field.name for field in table.schema] == [
+        "id",
+        "username",
+        "address",
+        "new",
+    ]
+    assert fake_bq.bq_client.calls == {
+        "get_table": 3,
+        "create_table": 1,
+        "update_table": 1,
+    }
+
+
+def test_create_view_and_list(fake_bq, sql_schema, nested_json_schema):
+    fake_bq.create_or_update_structure(
+        "project", "dataset", "view", {"view_query": sql_schema}
+    )
+    fake_bq.create_or_update_structure("project", "other", "table", nested_json_schema)
+
+    assert [d.dataset_id for d in fake_bq.get_dataset_in_project("project")] == [
+        "dataset",
+        "other",
+    ]
+    tables = fake_bq.get_table_in_project("project")
+    assert [(t.table_id, t.table_type) for t in tables] == [
+        ("view", "VIEW"),
+        ("table", "TABLE"),
+    ]
+
+
+def test_delete_table_and_dataset(fake_bq, nested_json_schema):
+    fake_bq.create_or_update_structure(
+        "project", "dataset", "table", nested_json_schema
+    )
+
+    assert fake_bq.delete_table_or_view("project", "dataset", "table")
+    assert not fake_bq.delete_table_or_view("project", "dataset", "table")
+    assert fake_bq.delete_dataset("project", "dataset")
+    assert not fake_bq.delete_dataset("project", "dataset")
+
+
+def test_stored_procedure(fake_bq):
+    definition = {"body": "SELECT 1", "arguments": [{"name": "x", "data_type": "DATE"}]}
+    fake_bq.create_or_update_structure("project", "dataset", "proc", definition)
+    definition["body"] = "SELECT 2"
+    fake_bq.create_or_update_structure("project", "dataset", "proc", definition)
+
+    routine = fake_bq.get_routine("project", "dataset", "proc")
+    assert routine.body == "SELECT 2"
+    assert [argument.name for argument in routine.arguments] == ["x"]
+
+
+def test_execute_query_handler():
+    bq = fake_bigquery(
+        query_handler=lambda query, job_config: FakeQueryResult(
+            [{"x": 1}], total_bytes_processed=10
+        )
+    )
+    query_job = bq.execute("SELECT 1 AS x")
+
+    assert query_job.total_bytes_processed == 10
+    assert [dict(row.items()) for row in query_job.result()] == [{"x": 1}]
+
+
+def test_execute_query_handler_error():
+    def handler(query, job_config):
+        raise BadRequest("Syntax error")
+
+    bq = fake_bigquery(query_handler=handler)
+    with pytest.raises(GbqException):
+        bq.execute("SELEC 1")
+
+
+def test_job_duration_and_cancel():
+    client = FakeBigQueryClient(job_duration=10)
+    job = client.query("SELECT 1")
+
+    assert job.state == "RUNNING"
+    assert job.error_result is None
+    with pytest.raises(TimeoutError):
+        job.result(timeout=0.01)
+
+    job.cancel()
+    assert job.done()
+    assert job.cancelled
+    assert job.errors == [{"reason": "stopped", "message": str(job._error)}]
+    assert client.calls["cancel_job"] == 1
+
+
+def test_insert_rows_json(nested_json_schema):
+    client = FakeBigQueryClient()
+    client.create_table(
+        bigquery.Table(
+            "project.dataset.table",
+            schema=[bigquery.SchemaField("id", "INTEGER")],
+        )
+    )
+
+    assert client.insert_rows_json("dataset.table", [{"id": 1}]) == []
+    errors = client.insert_rows_json("dataset.table", [{"id": "x"}, {"id": 2}])
+
+    assert [error["errors"][0]["reason"] for error in errors] == ["invalid", "stopped"]
+    assert [dict(row.items()) for row in client.list_rows("dataset.table")] == [
+        {"id": 1}
+    ]
+
+
+def test_load_and_copy():
+    client = FakeBigQueryClient()
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+        schema=[bigquery.SchemaField("id", "INTEGER")],
+        clustering_fields=["id"],
+    )
+    data = io.BytesIO(gzip.compress(b'{"id": 1}\n{"id": 2}\n'))
+    load_job = client.load_table_from_file(data, "project.d.t", job_config=job_config)
+    assert load_job.result().output_rows == 2
+    assert client.get_table("project.d.t").clustering_fields == ["id"]
+
+    csv_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.CSV,
+        schema=[bigquery.SchemaField("id", "INTEGER")],
+        skip_leading_rows=1,
+    )
+    client.load_table_from_file(
+        io.BytesIO(b"id\n3\n"), "project.d.t", job_config=csv_config
+    )
+
+    copy_config = bigquery.CopyJobConfig(operation_type="SNAPSHOT")
+    client.copy_table("project.d.t", "project.e.snap", job_config=copy_config)
+    snapshot = client.get_table("project.e.snap")
+    assert snapshot.table_type == "SNAPSHOT"
+    assert snapshot.num_rows == 3
+
+    truncate = bigquery.CopyJobConfig(
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
+    )
+    client.copy_table(["project.d.t"], "project.e.snap", job_config=truncate)
+    assert client.get_table("project.e.snap").num_rows == 3
+
+
+def test_jobs_listing():
+    client = FakeBigQueryClient()
+    parent = client.query("SELECT 2")
+    child = client.query("SELECT 1")
+    child.parent_job_id = parent.job_id
+
+    assert list(client.list_jobs(parent_job=parent)) == [child]
+    assert list(client.list_jobs()) == [child, parent]
+    assert client.get_job(child.job_id) is child
+    with pytest.raises(NotFound):
+        client.get_job("missing")
+
+
+def test_error_injection_sequence():
+    client = FakeBigQueryClient(errors={"get_table": [ServiceUnavailable(""), None]})
+    client.create_table("project.d.t")
+
+    with pytest.raises(ServiceUnavailable):
+        client.get_table("project.d.t")
+    assert client.get_table("project.d.t").table_id == "t"
+    assert client.get_table("project.d.t").table_id == "t"
+
+
+def test_error_rate_is_reproducible():
+    outcomes = []
+    for _ in range(2):
+        client = FakeBigQueryClient(error_rate=0.5, seed=1)
+        run = []
+        for _ in range(20):
+            try:
+                client.list_datasets()
+                run.append(True)
+            except ServiceUnavailable:
+                run.append(False)
+        outcomes.append(run)
+
+    assert outcomes[0] == outcomes[1]
+    assert not all(outcomes[0]) and any(outcomes[0])
+
+
+def test_quota():
+    client = FakeBigQueryClient(quota={"create_table": 1, "*": 3})
+    client.create_table("project.d.a")
+    with pytest.raises(Forbidden):
+        client.create_table("project.d.b")
+    client.list_datasets()
+    with pytest.raises(Forbidden):
+        client.list_datasets()
+
+
+def test_rate_limit():
+    client = FakeBigQueryClient(rate_limit=2)
+    client.list_datasets()
+    client.list_datasets()
+    with pytest.raises(TooManyRequests):
+        client.list_datasets()
+
+
+def test_latency():
+    client = FakeBigQueryClient(latency={"list_datasets": 0.05})
+    started_at = time.monotonic()
+    client.list_datasets()
+    assert time.monotonic() - started_at >= 0.05
+
+
+def test_conflicts_and_missing_objects():
+    client = FakeBigQueryClient(auto_create_datasets=False)
+    with pytest.raises(NotFound):
+        client.create_table("project.d.t")
+
+    client.create_dataset("d")
+    client.create_dataset("d", exists_ok=True)
+    with pytest.raises(Conflict):
+        client.create_dataset("d")
+
+    client.create_table("project.d.t")
+    assert client.create_table("project.d.t", exists_ok=True).table_id == "t"
+    with pytest.raises(Conflict):
+        client.create_table("project.d.t")
+    with pytest.raises(BadRequest):
+        client.delete_dataset("d")
+
+    client.delete_table("project.d.missing", not_found_ok=True)
+    client.delete_dataset("missing", not_found_ok=True)
+    client.delete_routine("project.d.missing", not_found_ok=True)
+    with pytest.raises(NotFound):
+        client.list_tables("missing")
+    with pytest.raises(NotFound):
+        client.delete_routine("project.d.missing")
+
+
+def test_routines():
+    client = FakeBigQueryClient()
+    routine = bigquery.Routine("project.d.r", type_="PROCEDURE", body="SELECT 1")
+    client.create_routine(routine)
+    with pytest.raises(Conflict):
+        client.create_routine(routine)
+
+    client.delete_routine(routine)
+    with pytest.raises(NotFound):
+        client.update_routine(routine, ["body"])